@@ -0,0 +1,169 @@
+import pygame
+
+from typing import Callable, TYPE_CHECKING
+
+from rotation import Rotation_Atlas
+
+if TYPE_CHECKING: from frame_cache import Frame_Cache
+
+class Assets:
+
+	'''
+	Process-wide registry for images, sounds, fonts, rotation atlases and frame caches' frames.
+
+	Every asset is loaded (and scaled / converted) from disk once, keyed by its path and
+	load parameters, and the same object is handed out to every caller afterwards.
+	Shared surfaces must be treated as read-only - copy them before mutating.
+	'''
+
+	def __init__(self) -> None:
+
+		self.images: dict[tuple[str, float], pygame.surface.Surface] = {}
+		self.sounds: dict[tuple[str, float], pygame.mixer.Sound] = {}
+		self.fonts: dict[tuple[str, int, bool], pygame.font.Font] = {}
+		self.atlases: dict[tuple[str, float, float, tuple | None], Rotation_Atlas] = {}
+		self.frames: dict[tuple[str, int], list[pygame.surface.Surface]] = {} # frame cache path, frame count: frames
+
+		self.hits = 0
+		self.misses = 0
+
+	def load_img(self, path: str, scale: int | float = 1) -> pygame.surface.Surface:
+
+		key = (path, float(scale))
+
+		if key in self.images: self.hits += 1
+		else: self.add_img(path, scale, self.decode_img(path, scale))
+
+		return self.images[key]
+
+	def load_sfx(self, path: str, volume: int | float = 1) -> pygame.mixer.Sound:
+
+		key = (path, float(volume))
+
+		if key in self.sounds: self.hits += 1
+		else: self.add_sfx(path, volume, self.decode_sfx(path))
+
+		return self.sounds[key]
+
+	def load_font(self, path: str, size: int, bold: bool = False) -> pygame.font.Font:
+
+		key = (path, size, bold)
+
+		if key in self.fonts: self.hits += 1
+		else: self.add_font(path, size, bold, self.decode_font(path, size))
+
+		return self.fonts[key]
+
+	def load_frames(self, cache: 'Frame_Cache', progress: Callable[[float], None] | None = None) -> list[pygame.surface.Surface]:
+
+		# Builds the cache first if it's missing / out of date (progress: see Frame_Cache.generate)
+		key = (cache.PATH, cache.FRAME_COUNT)
+
+		if key in self.frames: self.hits += 1
+		else: self.add_frames(cache, self.decode_frames(cache, progress))
+
+		return self.frames[key]
+
+	# Decoding (safe to run on worker threads - nothing touches the display or the registry)
+	def decode_img(self, path: str, scale: int | float = 1) -> pygame.surface.Surface:
+
+		image = pygame.image.load(path)
+		if scale != 1: image = pygame.transform.scale_by(image, scale)
+
+		return image
+
+	def decode_sfx(self, path: str) -> pygame.mixer.Sound:
+		return pygame.mixer.Sound(path)
+
+	def decode_font(self, path: str, size: int) -> pygame.font.Font:
+		return pygame.font.Font(path, size)
+
+	def decode_frames(self, cache: 'Frame_Cache', progress: Callable[[float], None] | None = None) -> list[pygame.surface.Surface]:
+		return cache.get_frames(progress = progress) # already in the display's pixel format
+
+	# Registering (main thread - images are converted to the display format here)
+	def add_img(self, path: str, scale: int | float, image: pygame.surface.Surface) -> None:
+
+		self.misses += 1
+		self.images[(path, float(scale))] = image.convert_alpha()
+
+	def add_sfx(self, path: str, volume: int | float, sfx: pygame.mixer.Sound) -> None:
+
+		self.misses += 1
+		sfx.set_volume(volume)
+		self.sounds[(path, float(volume))] = sfx
+
+	def add_font(self, path: str, size: int, bold: bool, font: pygame.font.Font) -> None:
+
+		self.misses += 1
+		font.set_bold(bold)
+		self.fonts[(path, size, bold)] = font
+
+	def add_frames(self, cache: 'Frame_Cache', frames: list[pygame.surface.Surface]) -> None:
+
+		self.misses += 1
+		self.frames[(cache.PATH, cache.FRAME_COUNT)] = frames
+
+	def load_atlas(
+
+			self,
+			path: str,
+			scale: int | float = 1,
+			step: int | float = 1,
+			build: bool = False,
+			recolour: tuple[tuple[int, int, int], tuple[int, int, int]] | None = None
+
+		) -> Rotation_Atlas:
+
+		'''
+		recolour: (from, to) - an atlas of the image with one colour swapped (e.g. a hit flash),
+		recoloured once before rotating so none of its frames need any pixel work
+		'''
+
+		key = (path, float(scale), float(step), recolour)
+
+		if key in self.atlases: self.hits += 1
+		else: self.atlases[key] = Rotation_Atlas(image = self.recolour_img(self.load_img(path, scale), *recolour) if recolour else self.load_img(path, scale), step = step)
+
+		if build: self.atlases[key].build()
+		return self.atlases[key]
+
+	def recolour_img(self, image: pygame.surface.Surface, old_colour: tuple[int, int, int], new_colour: tuple[int, int, int]) -> pygame.surface.Surface:
+
+		image = image.copy() # the registry's surface is shared
+		array = pygame.PixelArray(image)
+		array.replace(old_colour, new_colour)
+		array.close()
+
+		return image
+
+	def warm_up(
+
+			self,
+			images: list[tuple[str, int | float]] = [],
+			sounds: list[tuple[str, int | float]] = [],
+			fonts: list[tuple[str, int, bool]] = []
+
+		) -> None:
+
+		for path, scale in images: self.load_img(path, scale)
+		for path, volume in sounds: self.load_sfx(path, volume)
+		for path, size, bold in fonts: self.load_font(path, size, bold)
+
+	def reset_stats(self) -> None:
+		self.hits, self.misses = 0, 0
+
+	def get_stats(self) -> dict[str, int]:
+
+		return {
+			'hits': self.hits,
+			'misses': self.misses,
+			'images': len(self.images),
+			'sounds': len(self.sounds),
+			'fonts': len(self.fonts),
+			'atlases': len(self.atlases),
+			'frames': sum(len(frames) for frames in self.frames.values()),
+			'atlas_bytes': sum(atlas.get_memory_footprint() for atlas in self.atlases.values())
+		}
+
+assets = Assets()
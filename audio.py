@@ -0,0 +1,90 @@
+import pygame
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING: from main import Game
+
+class Audio_Manager:
+
+	'''
+	Plays SFX on a fixed set of mixer channels (voices) instead of wherever Sound.play() finds one.
+
+	- The same sound triggered again within `coalesce_time` ms is dropped as a duplicate.
+	- Each sound gets at most `voices_per_sound` voices; past that its oldest voice is restarted.
+	- When every voice is busy, the lowest priority (then oldest) voice is stolen if it isn't more
+	  important than the new sound, otherwise the new sound is dropped.
+
+	Channel 0 is reserved for the music. Times are the game's simulated ticks.
+	'''
+
+	def __init__(
+
+			self,
+			game: 'Game',
+			voices: int = 8,
+			voices_per_sound: int = 3,
+			coalesce_time: int | float = 30
+
+		) -> None:
+
+		self.game = game
+		self.VOICES = voices
+		self.VOICES_PER_SOUND = voices_per_sound
+		self.COALESCE_TIME = coalesce_time
+		self.enabled = pygame.mixer.get_init() is not None
+
+		self.voices: list[tuple[pygame.mixer.Channel, pygame.mixer.Sound | None, int, float]] = [] # channel, sound, priority, start ticks
+		self.last_played: dict[pygame.mixer.Sound, float] = {} # sound: ticks it last started
+
+		if self.enabled:
+
+			pygame.mixer.set_num_channels(voices + 1)
+			pygame.mixer.set_reserved(1)
+			self.music_channel = pygame.mixer.Channel(0)
+			self.voices = [(pygame.mixer.Channel(i + 1), None, 0, 0.0) for i in range(voices)]
+
+		self.played = 0
+		self.coalesced = 0
+		self.stolen = 0
+		self.dropped = 0
+
+	def play(self, sound: pygame.mixer.Sound, priority: int = 0) -> None:
+
+		if not self.enabled: return
+		ticks = self.game.ticks
+
+		# Coalesce
+		if ticks - self.last_played.get(sound, -self.COALESCE_TIME) < self.COALESCE_TIME:
+
+			self.coalesced += 1
+			return
+
+		busy = [(i, voice) for i, voice in enumerate(self.voices) if voice[0].get_busy()]
+		same_sound = [(i, voice) for i, voice in busy if voice[1] is sound]
+
+		# Pick a voice: this sound's oldest if it's at its limit, else a free one, else steal the least important
+		if len(same_sound) >= self.VOICES_PER_SOUND: index = min(same_sound, key = lambda item: item[1][3])[0]
+		elif len(busy) < self.VOICES: index = next(i for i, voice in enumerate(self.voices) if not voice[0].get_busy())
+
+		else:
+
+			index, voice = min(busy, key = lambda item: (item[1][2], item[1][3]))
+
+			if voice[2] > priority:
+
+				self.dropped += 1
+				return
+
+		if self.voices[index][0].get_busy(): self.stolen += 1
+
+		channel = self.voices[index][0]
+		channel.play(sound)
+		self.voices[index] = (channel, sound, priority, ticks)
+		self.last_played[sound] = ticks
+		self.played += 1
+
+	def play_music(self, music: pygame.mixer.Sound) -> None:
+		if self.enabled: self.music_channel.play(music, loops = -1)
+
+	def get_stats(self) -> dict[str, int]:
+		return {'played': self.played, 'coalesced': self.coalesced, 'stolen': self.stolen, 'dropped': self.dropped, 'voices_busy': sum(voice[0].get_busy() for voice in self.voices)}
@@ -0,0 +1,292 @@
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import pygame
+
+from time import perf_counter
+from typing import Callable
+
+import main
+from assets import assets
+from simulation import Simulation
+from constants import TICK_RATE, WIDTH, HEIGHT, X0, Y0, CENTER_X, CENTER_Y
+
+RESULTS_PATH = 'Benchmarks/results.json'
+BASELINE_PATH = 'Benchmarks/baseline.json'
+WARM_UP_FRAMES = 30 # frames run before timing starts (lazy caches fill here)
+STARTUP_FRAME_COUNTS = [20, 90, 360] # explosion frame counts timed by --startup
+
+def random_pos() -> tuple[float, float]:
+	return (X0 + random.uniform(0, WIDTH), Y0 + random.uniform(0, HEIGHT))
+
+def place_lemonoid(game: main.Game, size: int, pos: tuple[float, float]) -> main.Lemonoid:
+
+	# Spawn a lemonoid already inside the frame (size 1 lemonoids normally spawn offscreen)
+	lemonoid = game.pools['lemonoid'].acquire(game = game, angle = random.randint(0, 360), move_speed = 75, size = size, pos = pos)
+	lemonoid.pos = pygame.math.Vector2(pos)
+	lemonoid.outside_frame_on_spawn = False
+	game.lemonoids.add(lemonoid)
+
+	return lemonoid
+
+# Scenarios
+def setup_lemonoids(game: main.Game) -> None:
+	for i in range(50): place_lemonoid(game, 1, random_pos())
+
+def setup_chain_split(game: main.Game) -> None:
+	for i in range(6): place_lemonoid(game, 1, random_pos())
+
+def script_chain_split(game: main.Game, frame: int) -> dict:
+
+	# Every half second, destroy every lemonoid that can still split (1 -> 3 -> 9 -> 27 per size 1)
+	if frame % (TICK_RATE // 2) == 0:
+		for lemonoid in game.lemonoids.sprites():
+			if lemonoid.size != 4: lemonoid.death()
+
+	return {}
+
+def script_firing(game: main.Game, frame: int) -> dict:
+
+	aim = pygame.math.Vector2(200, 0).rotate(frame * 0.5)
+	return {'mouse_pressed': True, 'mouse_pos': (CENTER_X + aim.x, CENTER_Y + aim.y)}
+
+def setup_explosions(game: main.Game) -> None:
+	for i in range(10): game.explosions.add(game.pools['explosion'].acquire(game = game, type = 0, pos = random_pos(), frames = game.explosion_frames))
+
+def setup_particles(game: main.Game) -> None:
+
+	images = game.player.sprite.break_images + game.player.sprite.particle_images
+
+	for i in range(1000):
+
+		game.particles.emit(
+			start_pos = random_pos(),
+			angle = random.randint(0, 360),
+			image = images[i % len(images)],
+			move_speed = random.randint(5, 20),
+			rotation_speed = random.randint(100, 1000),
+			fade_speed = 10
+		)
+
+SCENARIOS: dict[str, dict] = {
+	# name: setup(game), script(game, frame) -> input state, simulated seconds
+	'50 size-1 lemonoids': {'setup': setup_lemonoids, 'script': None, 'seconds': 10},
+	'chain-split storm': {'setup': setup_chain_split, 'script': script_chain_split, 'seconds': 3},
+	'player firing at max rate': {'setup': None, 'script': script_firing, 'seconds': 60},
+	'10 simultaneous explosions': {'setup': setup_explosions, 'script': None, 'seconds': 1},
+	'1000 live particles': {'setup': setup_particles, 'script': None, 'seconds': 5}
+}
+
+def count_entities(game: main.Game) -> int:
+	return len(game.lemonoids) + len(game.player.sprite.lasers_fired) + len(game.particles) + len(game.explosions)
+
+def run_scenario(name: str, seed: int = 0) -> dict:
+
+	scenario = SCENARIOS[name]
+	script: Callable[[main.Game, int], dict] | None = scenario['script']
+
+	# Gameplay render path: no debug overlays, player collisions tested (but harmless, so a scenario's lemonoids aren't cleared by a respawn)
+	simulation = Simulation(seed = seed, render = True, debug = False, invulnerable = True, sfx_vol = 0, music_vol = 0)
+	game = simulation.game
+	game.input.script = (lambda frame: script(game, frame)) if script else None
+	if scenario['setup']: scenario['setup'](game)
+
+	for i in range(WARM_UP_FRAMES): simulation.step()
+	assets.reset_stats() # anything looked up for the first time from here on is a mid-game load
+	game.text_cache.reset_stats()
+
+	frame_times = []
+	entities = []
+	blits = [] # render queue blits per frame
+	blit_calls = [] # fblits / blits calls they were submitted in
+	gc_pauses = [] # ms per garbage collection during the timed frames
+	gc_start = perf_counter()
+
+	def on_gc(phase: str, info: dict) -> None:
+
+		nonlocal gc_start
+		if phase == 'start': gc_start = perf_counter()
+		else: gc_pauses.append((perf_counter() - gc_start) * 1000)
+
+	gc.callbacks.append(on_gc)
+	gc.freeze() # as main() does once the game is loaded (undone below, so this Game can be freed)
+
+	try:
+
+		for i in range(round(scenario['seconds'] / simulation.DT)):
+
+			start_time = perf_counter()
+			simulation.step()
+			frame_times.append((perf_counter() - start_time) * 1000)
+			entities.append(count_entities(game))
+			queue_stats = game.render_queue.get_stats()
+			blits.append(queue_stats['blits'])
+			blit_calls.append(queue_stats['calls'])
+
+	finally:
+
+		gc.callbacks.remove(on_gc)
+		gc.unfreeze()
+
+	percentiles = statistics.quantiles(frame_times, n = 100)
+
+	return {
+		'frames': len(frame_times),
+		'mean_ms': round(statistics.fmean(frame_times), 3),
+		'p95_ms': round(percentiles[94], 3),
+		'p99_ms': round(percentiles[98], 3),
+		'max_ms': round(max(frame_times), 3),
+		'mean_entities': round(statistics.fmean(entities), 1),
+		'mean_blits': round(statistics.fmean(blits), 1),
+		'mean_blit_calls': round(statistics.fmean(blit_calls), 1),
+		'max_entities': max(entities),
+		'gc_collections': len(gc_pauses),
+		'gc_pause_ms': round(sum(gc_pauses), 3),
+		'asset_misses': assets.get_stats()['misses'],
+		'text_renders': game.text_cache.get_stats()['misses'],
+		'pools': game.get_pool_stats()
+	}
+
+def run_interactive() -> dict:
+
+	# Time to the first interactive frame: window, background asset load, game init, first simulated + rendered frame
+	start_time = perf_counter()
+	screen = main.setup(headless = True)
+	load_time = main.load(screen)
+
+	game_start_time = perf_counter()
+	game = main.create_game(headless = True)
+	game_time = perf_counter() - game_start_time
+
+	game.input.update()
+	game.simulate(1 / TICK_RATE)
+	game.render(screen)
+	game.renderer.present()
+
+	return {
+		'load_s': round(load_time, 3),
+		'create_game_s': round(game_time, 3),
+		'first_interactive_frame_s': round(perf_counter() - start_time, 3)
+	}
+
+def run_startup(frame_count: int) -> dict:
+
+	# Explosion frame cache: cold (generate) vs warm (decompress) start, and the first draw of every frame
+	# Built in the temp directory (not over the game's own cache) and deleted afterwards
+	screen = main.setup(headless = True)
+	cache = main.create_explosion_cache(frame_count, path = os.path.join(tempfile.gettempdir(), f'lemonoids_frames_{frame_count}.cache'))
+
+	try:
+
+		start_time = perf_counter()
+		cache.generate()
+		generate_time = perf_counter() - start_time
+
+		# One frame at a time, so the longest caches don't all have to fit in memory at once
+		load_time, first_draw_time = 0.0, 0.0
+		start_time = perf_counter()
+
+		for frame in cache.iter_frames():
+
+			load_time += perf_counter() - start_time
+
+			start_time = perf_counter()
+			screen.blit(frame, frame.get_rect(center = (CENTER_X, CENTER_Y)))
+			first_draw_time += perf_counter() - start_time
+
+			start_time = perf_counter()
+
+		size = os.path.getsize(cache.PATH)
+
+	finally:
+		if os.path.isfile(cache.PATH): os.remove(cache.PATH)
+
+	return {
+		'generate_s': round(generate_time, 3),
+		'load_ms': round(load_time * 1000, 3),
+		'first_draw_ms': round(first_draw_time * 1000, 3),
+		'cache_mb': round(size / 2 ** 20, 1)
+	}
+
+def compare(results: dict, baseline: dict, tolerance: float) -> list[str]:
+
+	# Regressions: any mean / p95 / p99 frame time more than `tolerance` slower than the baseline
+	regressions = []
+
+	for name, result in results['scenarios'].items():
+
+		if name not in baseline['scenarios']: continue
+
+		for metric in ['mean_ms', 'p95_ms', 'p99_ms']:
+
+			limit = baseline['scenarios'][name][metric] * (1 + tolerance)
+			if result[metric] > limit: regressions.append(f'{name}: {metric} {result[metric]} > {round(limit, 3)} (baseline {baseline["scenarios"][name][metric]})')
+
+	return regressions
+
+def main_cli() -> None:
+
+	parser = argparse.ArgumentParser(description = 'Run the Lemonoids scenario benchmarks and compare against the stored baseline.')
+	parser.add_argument('--scenario', action = 'append', choices = list(SCENARIOS), help = 'scenario(s) to run (default: all, or none with --startup)')
+	parser.add_argument('--seed', type = int, default = 0)
+	parser.add_argument('--output', default = RESULTS_PATH)
+	parser.add_argument('--baseline', default = BASELINE_PATH)
+	parser.add_argument('--save-baseline', action = 'store_true', help = 'store these results as the new baseline')
+	parser.add_argument('--tolerance', type = float, default = 0.2, help = 'allowed slowdown vs the baseline (0.2 = 20%%)')
+	parser.add_argument('--startup', type = int, action = 'append', nargs = '?', const = 0, metavar = 'FRAMES', help = f'also time the first interactive frame and explosion frame cache startup (default counts: {STARTUP_FRAME_COUNTS})')
+	args = parser.parse_args()
+
+	results = {
+		'python': platform.python_version(),
+		'pygame': pygame.version.ver,
+		'machine': platform.machine(),
+		'seed': args.seed,
+		'scenarios': {}
+	}
+
+	if args.startup:
+
+		results['interactive'] = run_interactive() # first, while no asset is loaded yet
+		print(f'first interactive frame: {results["interactive"]["first_interactive_frame_s"]}s (assets {results["interactive"]["load_s"]}s | game {results["interactive"]["create_game_s"]}s)')
+
+		results['startup'] = {}
+
+		for frame_count in [count for count in args.startup if count] or STARTUP_FRAME_COUNTS:
+
+			results['startup'][frame_count] = run_startup(frame_count)
+			result = results['startup'][frame_count]
+			print(f'startup ({frame_count} explosion frames): generate {result["generate_s"]}s | load {result["load_ms"]}ms | first draw {result["first_draw_ms"]}ms | {result["cache_mb"]}MB')
+
+	for name in args.scenario or ([] if args.startup else list(SCENARIOS)):
+
+		results['scenarios'][name] = run_scenario(name, args.seed)
+		result = results['scenarios'][name]
+		print(f'{name}: mean {result["mean_ms"]}ms | p95 {result["p95_ms"]}ms | p99 {result["p99_ms"]}ms | {result["mean_entities"]} entities/frame | {result["mean_blits"]} blits/frame in {result["mean_blit_calls"]} calls | {result["gc_collections"]} GCs ({result["gc_pause_ms"]}ms)')
+		pools = ', '.join(f'{pool} {stats["in_use"]}/{stats["allocated"]} ({stats["high_water"]})' for pool, stats in result['pools'].items())
+		print(f'  {result["asset_misses"]} asset misses | {result["text_renders"]} text renders after warm-up | pools (in use / allocated, peak): {pools}')
+
+	os.makedirs(os.path.dirname(args.output), exist_ok = True)
+	with open(args.output, 'w') as file: json.dump(results, file, indent = 4)
+
+	if args.save_baseline:
+
+		with open(args.baseline, 'w') as file: json.dump(results, file, indent = 4)
+		print(f'Baseline saved to {args.baseline}')
+
+	elif os.path.isfile(args.baseline):
+
+		with open(args.baseline, 'r') as file: regressions = compare(results, json.load(file), args.tolerance)
+
+		for regression in regressions: print(f'REGRESSION {regression}')
+		if regressions: sys.exit(1)
+		print('No regressions')
+
+	else: print(f'No baseline at {args.baseline} (run with --save-baseline to create one)')
+
+if __name__ == '__main__': main_cli()
@@ -0,0 +1,52 @@
+from math import sin, pi
+from random import uniform
+
+class Camera:
+
+	'''
+	Render offset for everything in the play area.
+
+	Screen shake is a decaying "trauma" value: triggers just add to it (no matter how many
+	happen at once), and the offset is worked out from it procedurally - two out of phase
+	sine waves per axis, scaled by trauma squared - once per step. Entity positions stay in
+	world space; the offset is only applied when the world is drawn.
+	'''
+
+	def __init__(self, max_offset: int | float, decay: int | float, frequency: int | float) -> None:
+
+		self.MAX_OFFSET = max_offset # pixels at full trauma
+		self.DECAY = decay # trauma lost per second
+		self.FREQUENCY = frequency # shake oscillations per second
+
+		self.trauma = 0.0 # 0-1
+		self.time = 0.0
+		self.phases = (0.0, 0.0)
+		self.offset = (0, 0)
+
+	def add_shake(self, strength: int | float) -> None:
+
+		if self.trauma == 0: self.phases = (uniform(0, 2 * pi), uniform(0, 2 * pi))
+		self.trauma = min(1.0, self.trauma + strength)
+
+	def update(self, dt: int | float) -> None:
+
+		if self.trauma == 0: return
+
+		self.time += dt
+		self.trauma = max(0.0, self.trauma - self.DECAY * dt)
+
+		amplitude = self.MAX_OFFSET * self.trauma ** 2
+		angle = 2 * pi * self.FREQUENCY * self.time
+
+		self.offset = (
+			round(amplitude * (sin(angle + self.phases[0]) + sin(angle * 2.1 + self.phases[1])) / 2),
+			round(amplitude * (sin(angle * 1.3 + self.phases[1]) + sin(angle * 2.7 + self.phases[0])) / 2)
+		)
+
+	def get_offset(self) -> tuple[int, int]:
+		return self.offset
+
+	def reset(self) -> None:
+
+		self.trauma = 0.0
+		self.offset = (0, 0)
@@ -17,6 +17,9 @@ Y1 = CENTER_Y + (WINDOW_H / 2) * SCALE
 
 # Game
 FPS = 144
+TICK_RATE = 120 # fixed simulation steps per second (rendering interpolates between steps)
+MAX_FRAME_TIME = 0.25 # seconds - longer frames are clamped, so a stall can't trigger an endless catch-up
+MAX_STEPS_PER_FRAME = 8 # simulation steps run per rendered frame at most
 DEBUG = True
 
 # Colours
@@ -33,6 +36,69 @@ DARK_RED = '#801300'
 # Audio (0-1; 0 = off, 1 = full volume)
 SFX_VOL = 1
 MUSIC_VOL = 0
+AUDIO_VOICES = 8 # SFX playing at once (the music has its own channel)
+AUDIO_VOICES_PER_SOUND = 3 # voices one SFX can use at once (past that its oldest voice is restarted)
+AUDIO_COALESCE_TIME = 30 # ms within which the same SFX triggered again is only played once
+
+# Lemonoids
+LEMONOID_SPEED = 75 # move speed of newly spawned (size 1) lemonoids
+LEMONOID_FREQUENCY = 15000 # ms between lemonoid spawns at the start of a game
+LEMONOID_FREQUENCIES = [(100000, 1000), (50000, 7500), (10000, 10000)] # (score above, ms between lemonoid spawns), highest threshold first
 
 # Explosion
-EXPLOSION_FRAME_COUNT = 20 # (1-360, higher = slower load time, higher possible explosion rotate speed, lower = vice versa)
\ No newline at end of file
+EXPLOSION_FRAME_COUNT = 20 # (1-360, higher = slower load time, more memory (~16MB per frame), higher possible explosion rotate speed, lower = vice versa)
+EXPLOSION_CACHE = 'explosion_frames.cache' # packed, compressed pre-rotated frames, in the per-user cache directory (rebuilt when missing / out of date, ~1.2MB per frame)
+EXPLOSION_CROP_MARGIN = 256 # extra pixels kept around the 2 screens' worth of each frame (explosions just off screen, shake)
+
+# Rotation
+LEMONOID_ROTATION_STEP = 3 # degrees per pre-rotated lemonoid frame (lower = smoother rotation, higher memory use)
+PLAYER_ROTATION_STEP = 1 # degrees per pre-rotated player ship frame
+PRELOAD_ROTATIONS = False # build every rotation frame at startup instead of on first use (longer load time, no mid-game hitches)
+
+# Hit Flash
+LEMONOID_FLASH_COLOURS = ((255, 228, 0), (255, 255, 255)) # lemonoid colour swapped out (yellow -> white) in its pre-built flash frames
+HIT_FLASH_TIME = 50 # ms a lemonoid shows its flash frames after being hit
+
+# Screen Shake
+SHAKE_MAX_OFFSET = 16 # pixels the play area is shaken by at full strength
+SHAKE_DECAY = 1.5 # shake strength (0-1) lost per second
+SHAKE_FREQUENCY = 12 # shake oscillations per second
+
+# Quality Governor (visual quality is stepped down while frames run over budget, and back up once they're cheap again)
+QUALITY_GOVERNOR = True # False = always full quality
+QUALITY_WINDOW = 60 # frames in the rolling window whose median frame time is compared against the budget (1000 / FPS ms)
+QUALITY_DOWNGRADE_LOAD = 0.9 # fraction of the budget above which quality drops a level
+QUALITY_UPGRADE_LOAD = 0.5 # fraction of the budget below which quality rises a level
+QUALITY_LEVELS = [
+	# particles: fraction of emitted particles kept, particle_rotation: multiple of PARTICLE_ROTATION_STEP particles are drawn at,
+	# health_bars: 'all' / 'damaged' (lemonoids below max health) / 'player', explosion_frames: draw every nth explosion frame,
+	# explosion_fade: explosion fade speed multiplier (less time spent alpha blending), debug: debug overlays shown (with DEBUG on)
+	{'name': 'High', 'particles': 1, 'particle_rotation': 1, 'health_bars': 'all', 'explosion_frames': 1, 'explosion_fade': 1, 'debug': True},
+	{'name': 'Medium', 'particles': 0.6, 'particle_rotation': 2, 'health_bars': 'damaged', 'explosion_frames': 1, 'explosion_fade': 1.25, 'debug': True},
+	{'name': 'Low', 'particles': 0.35, 'particle_rotation': 3, 'health_bars': 'damaged', 'explosion_frames': 2, 'explosion_fade': 1.5, 'debug': False},
+	{'name': 'Minimum', 'particles': 0.15, 'particle_rotation': 6, 'health_bars': 'player', 'explosion_frames': 4, 'explosion_fade': 2, 'debug': False}
+]
+
+# Particles
+PARTICLE_ROTATION_STEP = 10 # degrees per cached particle rotation frame
+PARTICLE_ALPHA_LEVELS = 16 # cached fade levels per particle image (higher = smoother fade, more cached surfaces)
+
+# Collisions
+COLLISION_CELL_SIZE = 128 # spatial hash cell size in pixels (~ the size of a mid-sized lemonoid)
+
+# Rendering
+RENDERER = 'dirty' # 'dirty' = only clear + update the regions that changed, 'full' = redraw + update the whole window every frame
+DIRTY_TILE_SIZE = 32 # pixels per dirty rect tile
+DIRTY_FULL_THRESHOLD = 0.4 # fraction of the screen dirty above which a full update is cheaper
+
+# Text
+TEXT_CACHE_SIZE = 256 # rendered text surfaces kept (least recently used are dropped first)
+FPS_READOUT_INTERVAL = 250 # ms between FPS readout updates
+
+# Cursor
+CURSOR_MODE = 'system' # 'system' = OS colour cursor (only updated when its frame changes), 'software' = drawn onto the game surface
+CURSOR_ROTATION_STEP = 5 # degrees per pre-rotated frame of the spinning crosshair
+
+# Profiling
+PROFILER_CSV = None # file to stream per-frame stage timings to (e.g. 'Saves/profile.csv'), None = off
+RECORD_REPLAY = None # file to record each session's input to for offline replay / profiling (e.g. 'Saves/last.replay'), None = off
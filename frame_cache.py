@@ -0,0 +1,183 @@
+import hashlib
+import multiprocessing
+import os
+import struct
+import sys
+import zlib
+import pygame
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Callable, Iterator
+
+class Frame_Cache:
+
+	'''
+	Pre-rotated frames of one image, zlib compressed and packed into a single file.
+
+	The header holds the frame count, frame size, pixel format and a hash of the source
+	image + generation settings, followed by a table of each frame's (offset, length) in the file;
+	a cache whose header doesn't match (or whose table was never completed) is rebuilt. Frames
+	are stored compressed as the explosion's rays compress ~10x, so even 360 frames stay a few
+	hundred MB on disk; loading decompresses each one straight into the display's pixel format.
+
+	Frames are cropped (around their centre) to `crop`, as pixels further out can never be on screen.
+	`pixel_format` is the display's (see get_pixel_format()), worked out up front on the main thread,
+	so checking / generating / loading the cache can run on a loader thread without touching the display.
+	'''
+
+	MAGIC = b'LEMFRAMZ'
+	HEADER = struct.Struct('<8sIII4s32s') # magic, frame count, width, height, pixel format, source hash
+	HEADER_SIZE = 64
+	ENTRY = struct.Struct('<QQ') # frame table: offset, compressed length
+	COMPRESSION = 3 # zlib level (higher barely shrinks the rays further, and takes twice as long)
+
+	def __init__(
+
+			self,
+			path: str,
+			source: str,
+			frame_count: int,
+			pixel_format: str,
+			scale: int | float = 1,
+			crop: tuple[int, int] | None = None
+
+		) -> None:
+
+		self.PATH = path
+		self.SOURCE = source
+		self.FRAME_COUNT = frame_count
+		self.PIXEL_FORMAT = pixel_format
+		self.SCALE = scale
+		self.CROP = crop
+
+	def get_source_hash(self) -> bytes:
+
+		hash = hashlib.sha256()
+		with open(self.SOURCE, 'rb') as file: hash.update(file.read())
+		hash.update(repr((self.SCALE, self.CROP)).encode())
+
+		return hash.digest()
+
+	def get_frame_size(self) -> tuple[int, int]:
+
+		# Every rotation's bounding box contains the unrotated image, so the unrotated size is the most every frame can fill
+		width, height = pygame.image.load(self.SOURCE).get_size()
+		width, height = int(width * self.SCALE), int(height * self.SCALE)
+		if self.CROP is not None: width, height = min(width, self.CROP[0]), min(height, self.CROP[1])
+
+		return (width, height)
+
+	def read_header(self) -> tuple | None:
+
+		# Header + frame table, or None if the file is missing / isn't a frame cache
+		if not os.path.isfile(self.PATH): return None
+
+		with open(self.PATH, 'rb') as file:
+
+			data = file.read(self.HEADER.size)
+			if len(data) < self.HEADER.size: return None
+
+			header = self.HEADER.unpack(data)
+			if header[0] != self.MAGIC: return None
+
+			file.seek(self.HEADER_SIZE)
+			data = file.read(header[1] * self.ENTRY.size)
+			if len(data) < header[1] * self.ENTRY.size: return None
+
+		return (*header, list(self.ENTRY.iter_unpack(data)))
+
+	def is_valid(self) -> bool:
+
+		header = self.read_header()
+		if header is None: return False
+
+		magic, frame_count, width, height, pixel_format, source_hash, table = header
+		complete = all(length for offset, length in table) and os.path.getsize(self.PATH) == max((offset + length for offset, length in table), default = 0)
+
+		return frame_count == self.FRAME_COUNT and pixel_format.decode() == self.PIXEL_FORMAT and source_hash == self.get_source_hash() and complete
+
+	def generate(self, workers: int | None = None, progress: Callable[[float], None] | None = None) -> None:
+
+		'''
+		Renders and compresses every frame in a process pool, appending each to the cache file as it
+		arrives; the frame table is written last, so an interrupted build is never taken as valid.
+		progress(fraction) is called as frames finish.
+		'''
+
+		width, height = self.get_frame_size()
+		pixel_format = self.PIXEL_FORMAT
+		table = [(0, 0)] * self.FRAME_COUNT
+
+		os.makedirs(os.path.dirname(self.PATH) or '.', exist_ok = True)
+
+		with open(self.PATH, 'wb') as file:
+
+			file.write(self.HEADER.pack(self.MAGIC, self.FRAME_COUNT, width, height, pixel_format.encode(), self.get_source_hash()).ljust(self.HEADER_SIZE, b'\0'))
+			file.write(bytes(self.FRAME_COUNT * self.ENTRY.size))
+
+			# Spawned (not forked) workers, so they don't inherit the parent's SDL state
+			with ProcessPoolExecutor(max_workers = workers, mp_context = multiprocessing.get_context('spawn'), initializer = init_worker, initargs = (self.SOURCE, self.SCALE)) as executor:
+
+				futures = {executor.submit(render_frame, i, (width, height), pixel_format, self.COMPRESSION): i for i in range(self.FRAME_COUNT)}
+
+				for done, future in enumerate(as_completed(futures)):
+
+					data = future.result()
+					table[futures[future]] = (file.tell(), len(data))
+					file.write(data)
+
+					if progress: progress((done + 1) / self.FRAME_COUNT)
+
+			file.seek(self.HEADER_SIZE)
+			file.write(b''.join(self.ENTRY.pack(*entry) for entry in table))
+
+	def iter_frames(self) -> Iterator[pygame.surface.Surface]:
+
+		magic, frame_count, width, height, pixel_format, source_hash, table = self.read_header()
+
+		with open(self.PATH, 'rb') as file:
+
+			for offset, length in table:
+
+				file.seek(offset)
+				yield pygame.image.frombuffer(zlib.decompress(file.read(length)), (width, height), pixel_format.decode()) # the surface keeps the decompressed bytes alive
+
+	def load(self) -> list[pygame.surface.Surface]:
+		return list(self.iter_frames())
+
+	def get_frames(self, workers: int | None = None, progress: Callable[[float], None] | None = None) -> list[pygame.surface.Surface]:
+
+		if not self.is_valid(): self.generate(workers, progress)
+		return self.load()
+
+def get_cache_dir(app: str = 'Lemonoids') -> str:
+
+	# Per-user cache directory (writable, unlike an install directory, and one the OS / user knows can be cleared)
+	if sys.platform == 'win32': root = os.environ.get('LOCALAPPDATA', os.path.join(os.path.expanduser('~'), 'AppData', 'Local'))
+	elif sys.platform == 'darwin': root = os.path.expanduser('~/Library/Caches')
+	else: root = os.environ.get('XDG_CACHE_HOME', os.path.expanduser('~/.cache'))
+
+	return os.path.join(root, app)
+
+def get_pixel_format() -> str:
+
+	# Main thread only (converts against the display) - byte order of the display's per-pixel alpha format, so cached frames blit without conversion
+	surface = pygame.surface.Surface((1, 1), pygame.SRCALPHA)
+	if pygame.display.get_surface() is not None: surface = surface.convert_alpha()
+
+	return 'BGRA' if surface.get_masks()[0] == 0x00ff0000 else 'RGBA'
+
+# Workers
+worker_source: pygame.surface.Surface | None = None
+
+def init_worker(source: str, scale: int | float) -> None:
+
+	global worker_source
+	worker_source = pygame.transform.scale_by(pygame.image.load(source), scale)
+
+def render_frame(angle: int | float, size: tuple[int, int], pixel_format: str, level: int) -> bytes:
+
+	image = pygame.transform.rotate(worker_source, angle)
+	frame = image.subsurface(pygame.Rect((0, 0), size).move(image.get_width() // 2 - size[0] // 2, image.get_height() // 2 - size[1] // 2))
+
+	return zlib.compress(pygame.image.tobytes(frame, pixel_format), level)
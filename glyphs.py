@@ -0,0 +1,93 @@
+import pygame
+
+from collections import OrderedDict
+
+class Text_Cache:
+
+	'''
+	Least-recently-used cache of rendered text, keyed by (font, string, colour, background, alpha).
+	Text that doesn't change between frames is rendered once instead of every frame.
+	'''
+
+	def __init__(self, capacity: int = 256) -> None:
+
+		self.CAPACITY = capacity
+		self.surfaces: OrderedDict[tuple, pygame.surface.Surface] = OrderedDict()
+
+		self.hits = 0
+		self.misses = 0
+
+	def render(
+
+			self,
+			font: pygame.font.Font,
+			string: str,
+			colour: str | tuple,
+			background: str | tuple | None = None,
+			alpha: int | None = None
+
+		) -> pygame.surface.Surface:
+
+		key = (font, string, colour, background, alpha)
+
+		if key in self.surfaces:
+
+			self.surfaces.move_to_end(key)
+			self.hits += 1
+
+		else:
+
+			surface = font.render(string, False, colour, background)
+			if alpha is not None: surface.set_alpha(alpha)
+
+			self.surfaces[key] = surface
+			if len(self.surfaces) > self.CAPACITY: self.surfaces.popitem(last = False)
+			self.misses += 1
+
+		return self.surfaces[key]
+
+	def reset_stats(self) -> None:
+		self.hits, self.misses = 0, 0
+
+	def get_stats(self) -> dict[str, int]:
+		return {'hits': self.hits, 'misses': self.misses, 'surfaces': len(self.surfaces)}
+
+class Glyph_Atlas:
+
+	'''
+	Pre-rendered glyphs for one font + colour, so strings made of them (scores, the FPS
+	readout) are drawn as a few glyph blits rather than a new font.render every change.
+	'''
+
+	def __init__(
+
+			self,
+			font: pygame.font.Font,
+			colour: str | tuple,
+			background: str | tuple | None = None,
+			characters: str = '0123456789'
+
+		) -> None:
+
+		self.glyphs = {character: font.render(character, False, colour, background) for character in characters}
+		self.HEIGHT = font.get_height()
+
+	def get_width(self, string: str) -> int:
+		return sum(self.glyphs[character].get_width() for character in string)
+
+	def get_blits(self, string: str, **anchor: tuple[int | float, int | float]) -> list[tuple[pygame.surface.Surface, pygame.rect.Rect]]:
+
+		# One (glyph, rect) per character, with the whole string positioned like Surface.get_rect(**anchor)
+		rect = pygame.Rect(0, 0, self.get_width(string), self.HEIGHT)
+		for key, value in anchor.items(): setattr(rect, key, value)
+
+		blits = []
+		x = rect.left
+
+		for character in string:
+
+			glyph = self.glyphs[character]
+			blits.append((glyph, glyph.get_rect(topleft = (x, rect.top))))
+			x += glyph.get_width()
+
+		return blits
@@ -0,0 +1,59 @@
+import statistics
+
+from collections import deque
+
+class Quality_Governor:
+
+	'''
+	Steps the game's visual quality down when frames run over budget, and back up once they're cheap again.
+
+	Frame times go into a rolling window; once it's full, its median is compared against the frame
+	budget. Above `downgrade_load` x budget drops a level, below `upgrade_load` x budget raises one, and
+	anything in between holds (hysteresis). The window is cleared after every change, so the next
+	decision is made on a full window of frames at the new level and one hitch can't cause a change.
+
+	Levels only touch presentation (never gameplay or the RNG), and only the live game loop feeds the
+	governor, so replays and headless runs aren't affected.
+	'''
+
+	def __init__(
+
+			self,
+			levels: list[dict],
+			budget_ms: int | float,
+			window: int = 60,
+			downgrade_load: float = 0.9,
+			upgrade_load: float = 0.5
+
+		) -> None:
+
+		self.LEVELS = levels # best quality first
+		self.BUDGET_MS = budget_ms
+		self.DOWNGRADE_MS = budget_ms * downgrade_load
+		self.UPGRADE_MS = budget_ms * upgrade_load
+
+		self.level = 0
+		self.frame_times: deque[float] = deque(maxlen = window) # ms
+		self.changes = 0
+
+	def update(self, frame_ms: int | float) -> bool:
+
+		# Returns whether the level changed
+		self.frame_times.append(frame_ms)
+		if len(self.frame_times) < self.frame_times.maxlen: return False
+
+		median = statistics.median(self.frame_times)
+
+		if median > self.DOWNGRADE_MS and self.level < len(self.LEVELS) - 1: self.level += 1
+		elif median < self.UPGRADE_MS and self.level > 0: self.level -= 1
+		else: return False
+
+		self.frame_times.clear()
+		self.changes += 1
+		return True
+
+	def get_settings(self) -> dict:
+		return self.LEVELS[self.level]
+
+	def get_name(self) -> str:
+		return self.LEVELS[self.level]['name']
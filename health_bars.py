@@ -0,0 +1,78 @@
+import math
+import pygame
+
+from typing import TYPE_CHECKING
+
+from constants import WHITE, BLACK
+
+if TYPE_CHECKING: from main import Game
+
+class Health_Bar_Atlas:
+
+	'''
+	Pre-rendered health bars, one per (size, max health, health).
+
+	Each image is the base bar recoloured along the green -> red ramp, with the segment at its
+	fill position and the health number + shadow, composed once the first time that health is
+	shown. Health bars only swap images when their health changes, and are all drawn in one blits call.
+	'''
+
+	BASE_COLOUR = (255, 0, 0) # colour the bar images are drawn in
+
+	def __init__(self, game: 'Game') -> None:
+
+		self.game = game
+		self.font = game.load_font(15, bold = True)
+		self.bars: dict[tuple[float, int, int], tuple[pygame.surface.Surface, tuple[int, int]]] = {} # (size, max health, health): (image, offset from the bar's centre to its topleft)
+
+	def get_colour(self, health_percent: float) -> tuple[int, int, int]:
+
+		if health_percent > 0.5: return (round((255 * (1 - health_percent)) * 2), 255, 0)
+		return (255, round((255 * health_percent) * 2), 0)
+
+	def recolour(self, image: pygame.surface.Surface, colour: tuple[int, int, int]) -> pygame.surface.Surface:
+
+		image = image.copy()
+		array = pygame.PixelArray(image)
+		array.replace(self.BASE_COLOUR, colour)
+		array.close()
+
+		return image
+
+	def build(self, size: float, max_health: int, health: int) -> tuple[pygame.surface.Surface, tuple[int, int]]:
+
+		health_percent = health / max_health
+		colour = self.get_colour(health_percent)
+
+		# Bar
+		bar = self.recolour(self.game.load_img('Images/Health Bar/Base.png', size), colour)
+		segment = self.recolour(self.game.load_img('Images/Health Bar/Full.png', size), colour) if health_percent > 0.5 else self.game.load_img('Images/Health Bar/Empty.png', size)
+
+		segment_x = segment.get_width() + (2 * size) - segment.get_width() * (((1 - health_percent) * 2) % 1)
+		if health_percent < 1 / max_health: segment_x = 2 * size
+		bar.blit(segment, (int(segment_x), 0))
+
+		# Number (positioned relative to the bar's centre)
+		bar_rect = bar.get_rect(center = (0, 0))
+
+		# (floored, so the offsets round the same way as when they were added to the bar's on-screen position)
+		text = self.game.text_cache.render(self.font, str(health), WHITE)
+		text_rect = text.get_rect(midright = (math.floor(-bar.get_width() / 2 - bar.get_width() / 20), math.floor(-bar.get_height() / 10)))
+
+		text_shadow = self.game.text_cache.render(self.font, str(health), BLACK, alpha = 128)
+		text_shadow_rect = text.get_rect(midright = (text_rect.midright[0], math.floor(text_rect.midright[1] + bar.get_height() / 10)))
+
+		# Compose (same draw order as drawing each part to the screen)
+		area = bar_rect.unionall([text_rect, text_shadow_rect])
+		image = pygame.surface.Surface(area.size, pygame.SRCALPHA)
+
+		for part, rect in [(bar, bar_rect), (text_shadow, text_shadow_rect), (text, text_rect)]: image.blit(part, rect.move(-area.left, -area.top))
+
+		return (image.convert_alpha(), area.topleft)
+
+	def get(self, size: float, max_health: int, health: int) -> tuple[pygame.surface.Surface, tuple[int, int]]:
+
+		key = (size, max_health, health)
+		if key not in self.bars: self.bars[key] = self.build(size, max_health, health)
+
+		return self.bars[key]
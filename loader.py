@@ -0,0 +1,70 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from assets import assets
+
+class Loader:
+
+	'''
+	Staged asset loader.
+
+	Files are decoded (and scaled) on a thread pool while the main thread keeps the window
+	responsive; each job's `finish` step - registering the asset and, for images, converting it
+	to the display format, which has to happen on the main thread - runs from poll() as the
+	jobs complete.
+	'''
+
+	def __init__(self, workers: int = 4) -> None:
+
+		self.executor = ThreadPoolExecutor(max_workers = workers, thread_name_prefix = 'loader')
+		self.jobs: list[tuple[Future, Callable[[Any], None] | None, int]] = [] # future, finish(result), weight
+
+		self.total_weight = 0
+		self.done_weight = 0
+
+	def add(self, job: Callable[[], Any], finish: Callable[[Any], None] | None = None, weight: int = 1) -> None:
+
+		self.jobs.append((self.executor.submit(job), finish, weight))
+		self.total_weight += weight
+
+	def add_assets(
+
+			self,
+			images: list[tuple[str, int | float]] = [],
+			sounds: list[tuple[str, int | float]] = [],
+			fonts: list[tuple[str, int, bool]] = []
+
+		) -> None:
+
+		# Same arguments as assets.warm_up() (duplicates are only loaded once)
+		for path, scale in dict.fromkeys(images): self.add(partial(assets.decode_img, path, scale), partial(assets.add_img, path, scale))
+		for path, volume in dict.fromkeys(sounds): self.add(partial(assets.decode_sfx, path), partial(assets.add_sfx, path, volume))
+		for path, size, bold in dict.fromkeys(fonts): self.add(partial(assets.decode_font, path, size), partial(assets.add_font, path, size, bold))
+
+	def poll(self) -> None:
+
+		# Main thread: finish every job that has completed since the last poll (re-raises worker errors)
+		pending = []
+
+		for future, finish, weight in self.jobs:
+
+			if not future.done():
+
+				pending.append((future, finish, weight))
+				continue
+
+			result = future.result()
+			if finish is not None: finish(result)
+			self.done_weight += weight
+
+		self.jobs = pending
+
+	def get_progress(self) -> float:
+		return self.done_weight / self.total_weight if self.total_weight else 1.0
+
+	def is_done(self) -> bool:
+		return not self.jobs
+
+	def shutdown(self) -> None:
+		self.executor.shutdown(wait = True, cancel_futures = True)
@@ -1,41 +1,103 @@
 import pygame
+import numpy
 import os
+import gc
+import random
+import multiprocessing
 
-from time import time
+from time import perf_counter
+from functools import partial
 from math import atan2, cos, sin, degrees, radians, pi
 from random import randint, uniform, choice
 from typing import Union
 
+from assets import assets
+from rotation import Rotation_Atlas
+from particles import Particle_System
+from spatial import Spatial_Hash
+from profiler import Profiler
+from renderer import Renderer
+from render_queue import Render_Queue
+from glyphs import Text_Cache, Glyph_Atlas
+from pool import Pooled_Sprite, Pool, release_group
+from frame_cache import Frame_Cache, get_cache_dir, get_pixel_format
+from loader import Loader
+from health_bars import Health_Bar_Atlas
+from camera import Camera
+from replay import Recorder
+from audio import Audio_Manager
+from scheduler import Scheduler
+from governor import Quality_Governor
 from constants import (
 
 	splashscreen_size,
-	WINDOW_W, WINDOW_H, WIDTH, HEIGHT, CENTER_X, CENTER_Y, SCALE, X0, Y0, X1, Y1, FPS, # screen setup
+	WINDOW_W, WINDOW_H, WIDTH, HEIGHT, CENTER_X, CENTER_Y, SCALE, X0, Y0, X1, Y1, FPS, TICK_RATE, MAX_FRAME_TIME, MAX_STEPS_PER_FRAME, # screen setup
 	DEBUG, 
-	SFX_VOL, MUSIC_VOL, # audio
-	EXPLOSION_FRAME_COUNT,
+	SFX_VOL, MUSIC_VOL, AUDIO_VOICES, AUDIO_VOICES_PER_SOUND, AUDIO_COALESCE_TIME, # audio
+	LEMONOID_SPEED, LEMONOID_FREQUENCY, LEMONOID_FREQUENCIES, # lemonoids
+	EXPLOSION_FRAME_COUNT, EXPLOSION_CACHE, EXPLOSION_CROP_MARGIN, # explosions
+	LEMONOID_ROTATION_STEP, PLAYER_ROTATION_STEP, PRELOAD_ROTATIONS, # rotation
+	LEMONOID_FLASH_COLOURS, HIT_FLASH_TIME, # hit flash
+	SHAKE_MAX_OFFSET, SHAKE_DECAY, SHAKE_FREQUENCY, # screen shake
+	QUALITY_GOVERNOR, QUALITY_WINDOW, QUALITY_DOWNGRADE_LOAD, QUALITY_UPGRADE_LOAD, QUALITY_LEVELS, # quality governor
+	PARTICLE_ROTATION_STEP, PARTICLE_ALPHA_LEVELS, # particles
+	COLLISION_CELL_SIZE, # collisions
+	RENDERER, DIRTY_TILE_SIZE, DIRTY_FULL_THRESHOLD, # rendering
+	TEXT_CACHE_SIZE, FPS_READOUT_INTERVAL, # text
+	CURSOR_MODE, CURSOR_ROTATION_STEP, # cursor
+	PROFILER_CSV, RECORD_REPLAY, # profiling
 	BG_COLOUR, BLACK, DARK_GREY, GREY, WHITE, RED, YELLOW, GREEN # colours
 
 )
 
-# PYGAME SETUP
-pygame.init()
-screen = pygame.display.set_mode((WINDOW_W, WINDOW_H))
-clock = pygame.time.Clock()
-
-# Fonts
-h1_font = pygame.font.Font('Fonts/pixel_font.ttf', int(75 * SCALE))
-h2_font = pygame.font.Font('Fonts/pixel_font.ttf', int(50 * SCALE))
-h3_font = pygame.font.Font('Fonts/pixel_font.ttf', int(25 * SCALE))
-
-# Window Setup
-pygame.display.set_icon(pygame.image.load('Images/UI/Icon.ico'))
-pygame.display.set_caption('Lemonoids | INITIALISING...')
-screen.fill(BG_COLOUR)
-# Cover
-cover = pygame.image.load('Images/UI/Cover/Cover.png').convert_alpha()
-cover = pygame.transform.scale(cover, splashscreen_size(img_size = cover.get_size(), screen_size = (WIDTH, HEIGHT))).convert_alpha()
-screen.blit(cover, cover.get_rect(center = (CENTER_X, CENTER_Y)))
-pygame.display.update()
+def setup(headless: bool = False) -> pygame.surface.Surface:
+
+	'''
+	Initialises pygame + the window and returns the screen surface.
+	headless: use SDL's dummy video / audio drivers (no window, no sound, no cover)
+	'''
+
+	# PYGAME SETUP
+	if headless:
+
+		os.environ['SDL_VIDEODRIVER'] = 'dummy'
+		os.environ['SDL_AUDIODRIVER'] = 'dummy'
+
+	pygame.init()
+	screen = pygame.display.set_mode((WINDOW_W, WINDOW_H))
+	if headless: return screen
+
+	# Window Setup
+	pygame.display.set_icon(pygame.image.load('Images/UI/Icon.ico'))
+	pygame.display.set_caption('Lemonoids | INITIALISING...')
+	screen.fill(BG_COLOUR)
+	# Cover
+	cover = pygame.image.load('Images/UI/Cover/Cover.png').convert_alpha()
+	cover = pygame.transform.scale(cover, splashscreen_size(img_size = cover.get_size(), screen_size = (WIDTH, HEIGHT))).convert_alpha()
+	screen.blit(cover, cover.get_rect(center = (CENTER_X, CENTER_Y)))
+	pygame.display.update()
+
+	return screen
+
+class Input:
+
+	# Input state, sampled once per frame so everything in a frame sees the same input
+	def __init__(self) -> None:
+
+		self.keys_pressed: set[int] = set()
+		self.mouse_pressed = False
+		self.mouse_pos: tuple[int | float, int | float] = (CENTER_X, CENTER_Y)
+		self.events: list[pygame.event.Event] = []
+
+	def update(self) -> None:
+
+		keys_pressed = pygame.key.get_pressed()
+		self.keys_pressed = {key for key in [pygame.K_w, pygame.K_SPACE] if keys_pressed[key]}
+		self.mouse_pressed = pygame.mouse.get_pressed()[0]
+		self.mouse_pos = pygame.mouse.get_pos()
+
+	def is_pressed(self, key: int) -> bool:
+		return key in self.keys_pressed
 
 class Game:
 
@@ -47,7 +109,8 @@ class Game:
 			audio: dict[str, int | float],
 			colours: dict[str, str], 
 			fonts: dict[str, pygame.font.Font],
-			explosions: dict[str, int]
+			explosions: dict[str, int],
+			lemonoids: dict[str, int | float | list]
 		
 		) -> None:
 
@@ -56,7 +119,9 @@ class Game:
 				'scale': int | float
 			],
 			game: dict[
-				'debug': bool
+				'debug': bool,
+				'headless': bool,
+				'invulnerable': bool
 			],
 			audio: dict[
 				'sfx_vol': int | float,
@@ -78,51 +143,26 @@ class Game:
 			],
 			explosions: dict[
 				'frame_count': int
+			],
+			lemonoids: dict[
+				'speed': int | float,
+				'frequency': int,
+				'frequencies': list[tuple[int, int]]
 			]
 		]
 		'''
 
 		def load_explosion_frames() -> list:
 
-			def create_explosion_frames(frame_count: int) -> list:
+			def show_progress(fraction: float) -> None:
 
-				frames = []
+				pygame.display.set_caption(f'Lemonoids | INITIALISING... Creating New Explosion Frames... {round(fraction * 100, 1)}%')
+				pygame.display.update()
 
-				os.makedirs('Images/Explosion/Frames')
-				for i in range(frame_count):
-
-					image = pygame.transform.scale_by(pygame.transform.rotate(pygame.image.load('Images/Explosion/God-Rays.png'), i), 0.5).convert_alpha()
-					frames.append(image)
-					pygame.image.save(image, f'Images/Explosion/Frames/{i}.png')
-					pygame.display.set_caption(f'Lemonoids | INITIALISING... Creating New Explosion Frames... {round(i / frame_count * 100, 1)}%')
-					pygame.display.update()
-
-				return frames
-
-			frames = []
-
-			if os.path.isdir('Images/Explosion/Frames'):
-
-				frame_count = len([entry for entry in os.listdir('Images/Explosion/Frames') if os.path.isfile(os.path.join('Images/Explosion/Frames', entry))])
-
-				if frame_count != self.EXPLOSION_FRAME_COUNT:
-
-					for path in os.listdir('Images/Explosion/Frames'): os.remove(f'Images/Explosion/Frames/{path}')
-					os.rmdir('Images/Explosion/Frames')
-					frames = create_explosion_frames(self.EXPLOSION_FRAME_COUNT)
-
-				else:
-					
-					for i in range(frame_count):
-
-						frames.append(pygame.image.load(f'Images/Explosion/Frames/{i}.png'))
-						pygame.display.set_caption(f'Lemonoids | INITIALISING... {round(i / frame_count * 100, 1)}%')
-
-			else: frames = create_explosion_frames(self.EXPLOSION_FRAME_COUNT)
-
-			return frames
+			self.explosion_cache = create_explosion_cache(self.EXPLOSION_FRAME_COUNT)
+			return assets.load_frames(self.explosion_cache, progress = show_progress) # already loaded by load(), outside of headless runs
 		
-		start_time = time()
+		start_time = perf_counter()
 
 		self.STATES = {'play': 0, 'game_over': 1}
 		self.MUSIC_VOL = audio['music_vol']
@@ -131,57 +171,302 @@ class Game:
 		self.FONTS = fonts
 		self.SCALE = screen['scale']
 		self.EXPLOSION_FRAME_COUNT = explosions['frame_count']
+		self.LEMONOID_SPEED = lemonoids['speed']
 		self.DEBUG = game['debug']
+		self.HEADLESS = game.get('headless', False)
+		self.INVULNERABLE = game.get('invulnerable', False) # player collisions are still tested, but never hurt (benchmarks keep their scenario intact)
 
 		self.state = self.STATES['play']
 		self.score = 0
+		self.ticks = 0.0 # simulated time in ms
+		self.scheduler = Scheduler()
+		self.clock = pygame.time.Clock()
+		self.input = Input()
+		self.profiler = Profiler(enabled = self.DEBUG, csv_path = PROFILER_CSV)
+		self.renderer = Renderer(size = (WINDOW_W, WINDOW_H), mode = RENDERER, tile_size = DIRTY_TILE_SIZE, full_threshold = DIRTY_FULL_THRESHOLD)
+		self.backgrounds: dict[int, pygame.surface.Surface] = {} # state: static background
+		self.render_queue = Render_Queue()
+		self.text_cache = Text_Cache(capacity = TEXT_CACHE_SIZE)
+		self.health_bar_atlas = Health_Bar_Atlas(game = self)
 		with open('Saves/save.txt', 'r') as save: self.highscore = int(save.readlines()[0].strip('HIGHSCORE = '))
-		self.shake_offset = (0.0, 0.0)
-		self.shake_offsets: list[tuple[float, float]] = []
+		self.camera = Camera(max_offset = SHAKE_MAX_OFFSET, decay = SHAKE_DECAY, frequency = SHAKE_FREQUENCY)
+		self.governor = Quality_Governor(levels = QUALITY_LEVELS, budget_ms = 1000 / FPS, window = QUALITY_WINDOW, downgrade_load = QUALITY_DOWNGRADE_LOAD, upgrade_load = QUALITY_UPGRADE_LOAD)
+		self.quality = self.governor.get_settings()
 		self.explosion_frames = load_explosion_frames()
+		self.warm_up()
+
+		self.pools = {'laser': Pool(Laser), 'lemonoid': Pool(Lemonoid), 'explosion': Pool(Explosion)}
 
 		self.player = pygame.sprite.GroupSingle(Player(game = self))
-		self.cursor = Cursor(game = self)
-		self.lemonoids: pygame.sprite.Group = pygame.sprite.Group()
-		for i in range(3): self.lemonoids.add(Lemonoid(angle = randint(0, 360), move_speed = 75, size = 1, game = self))
+		self.cursor = Cursor(game = self, mode = CURSOR_MODE)
+		self.lemonoids = Lemonoid_Group(game = self)
+		for i in range(3): self.lemonoids.add(self.pools['lemonoid'].acquire(angle = randint(0, 360), move_speed = self.LEMONOID_SPEED, size = 1, game = self))
 		self.explosions: pygame.sprite.Group = pygame.sprite.Group()
 		self.text = Text(game = self)
-		self.particles: pygame.sprite.Group = pygame.sprite.Group()
+		self.particles = Particle_System(game = self, rotation_step = PARTICLE_ROTATION_STEP, alpha_levels = PARTICLE_ALPHA_LEVELS)
+		self.apply_quality()
 		self.life_count_meter: pygame.sprite.Group = pygame.sprite.Group()
 		for i in range(self.player.sprite.MAX_LIVES): self.life_count_meter.add(Life_Count_Meter(game = self, index = i, origin = (CENTER_X, Y1 - 79)))
 
-		# Music
-		self.game_music = pygame.mixer.Sound('Audio/Music/game_music.wav')
-		self.game_music.set_volume(self.MUSIC_VOL)
-		if self.MUSIC_VOL > 0: self.game_music.play(-1)
+		# Audio
+		self.audio = Audio_Manager(game = self, voices = AUDIO_VOICES, voices_per_sound = AUDIO_VOICES_PER_SOUND, coalesce_time = AUDIO_COALESCE_TIME)
+		self.game_music = assets.load_sfx('Audio/Music/game_music.wav', self.MUSIC_VOL)
+		if self.MUSIC_VOL > 0 and not self.HEADLESS: self.audio.play_music(self.game_music)
 
-		self.lemonoid_frequency = 15000
+		self.lemonoid_frequency = lemonoids['frequency']
+		self.LEMONOID_FREQUENCIES = lemonoids['frequencies'] # (score above, ms between lemonoid spawns)
 		self.LEMONOID_TIMER = pygame.USEREVENT + 0
-		pygame.time.set_timer(self.LEMONOID_TIMER, self.lemonoid_frequency)
+		self.set_timer(self.LEMONOID_TIMER, self.lemonoid_frequency)
 
-		print(f'Game Initialised {round(time() - start_time, 1)}s')
+		print(f'Game Initialised {round(perf_counter() - start_time, 1)}s')
+		if self.DEBUG: print(f'Assets Loaded {assets.get_stats()}')
 
-	def update(self) -> None:
+	def handle_event(self, event: pygame.event.Event) -> None:
 
-		if self.score > self.highscore: self.highscore = self.score
+		if self.get_state() == self.STATES['play']:
+
+			if event.type == self.LEMONOID_TIMER:
+
+				angle = randint(0, 360)
+				new_lemonoid = self.pools['lemonoid'].acquire(angle = angle, move_speed = self.LEMONOID_SPEED, size = 1, game = self)
+				self.lemonoids.add(new_lemonoid)
+
+			if event.type == self.player.sprite.BLINK_TIMER:
+				self.player.sprite.blink()
+
+		if self.get_state() == self.STATES['game_over']:
+
+			if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
+
+				self.set_game()
+				self.set_state(self.STATES['play'])
+
+	def simulate(self, dt: float) -> None:
+
+		self.ticks += dt * 1000
+		self.scheduler.update(self.ticks, lambda event: self.handle_event(pygame.event.Event(event)))
+		for pool in self.pools.values(): pool.recycle()
+
+		if self.get_state() == self.STATES['play']:
+
+			player = self.player.sprite
+			profiler = self.profiler
+
+			# Game
+			self.camera.update(dt)
+
+			profiler.start('particles')
+			self.particles.update(dt)
+			profiler.stop(len(self.particles))
+
+			profiler.start('explosions')
+			self.explosions.update(dt)
+			profiler.stop(len(self.explosions))
+
+			profiler.start('lasers')
+			player.lasers_fired.update(dt)
+			profiler.stop(len(player.lasers_fired))
+
+			# Player
+			profiler.start('player')
+			self.player.update(dt)
+
+			if player.dead and self.ticks - player.death_time >= 1500:
+
+				if player.lives <= 0: self.game_over()
+				else: player.respawn()
+
+			profiler.stop(1)
+
+			profiler.start('lemonoids')
+			self.lemonoids.update(dt)
+			profiler.stop(len(self.lemonoids))
+
+			profiler.start('life meter')
+			self.life_count_meter.update(player_lives = player.lives)
+			profiler.stop(len(self.life_count_meter))
+
+	def interpolate(self, alpha: float) -> dict[pygame.sprite.Sprite, pygame.rect.Rect]:
+
+		'''
+		Where to draw moving sprites between their last two simulated positions (alpha = 0 -> previous step, 1 -> latest).
+		Returns {sprite: rect to draw it at}; sprites' own rects are simulation state (collisions), so they're never touched.
+		'''
+
+		draw_rects = self.lemonoids.interpolate(alpha)
+
+		for group in [self.player, self.player.sprite.lasers_fired]:
+
+			for sprite in group:
+
+				if sprite.previous_pos.distance_squared_to(sprite.pos) > (WIDTH / 4) ** 2: continue # wrapped / respawned, don't sweep across the screen
+				pos = sprite.previous_pos.lerp(sprite.pos, alpha)
+				draw_rects[sprite] = sprite.rect.copy()
+				draw_rects[sprite].center = (round(pos.x), round(pos.y))
+
+		return draw_rects
+
+	def get_pool_stats(self) -> dict[str, dict[str, int]]:
+
+		stats = {name: pool.get_stats() for name, pool in self.pools.items()}
+		stats['particle'] = {'allocated': self.particles.capacity, 'in_use': len(self.particles), 'free': self.particles.capacity - len(self.particles), 'high_water': self.particles.high_water}
+
+		return stats
+
+	def get_background(self) -> pygame.surface.Surface:
+
+		# Everything static behind the sprites (the renderer restores dirty regions from this)
+		state = self.get_state()
+
+		if state not in self.backgrounds:
+
+			background = pygame.surface.Surface((WINDOW_W, WINDOW_H)).convert()
+			background.fill(BG_COLOUR)
+
+			# Debug
+			if self.DEBUG and state == self.STATES['play']:
+
+				pygame.draw.line(background, DARK_GREY, (X0, CENTER_Y), (X1, CENTER_Y), 1)
+				pygame.draw.line(background, DARK_GREY, (CENTER_X, Y0), (CENTER_X, Y1), 1)
+			
+				pygame.draw.line(background, DARK_GREY, (CENTER_X - 10, CENTER_Y), (CENTER_X + 10, CENTER_Y), round(3 * SCALE))
+				pygame.draw.line(background, DARK_GREY, (CENTER_X, CENTER_Y - 10), (CENTER_X, CENTER_Y + 10), round(3 * SCALE))
+
+				pygame.draw.polygon(background, DARK_GREY, [(X0, Y0), (X0 + WIDTH, Y0), (X0 + WIDTH, Y0 + HEIGHT), (X0, Y0 + HEIGHT)], 1)
+
+			self.backgrounds[state] = background
+
+		return self.backgrounds[state]
+
+	def render(self, surface: pygame.surface.Surface, alpha: float = 1.0) -> None:
+
+		profiler = self.profiler
+		renderer = self.renderer
+		queue = self.render_queue
+		draw_rects = self.interpolate(alpha) if alpha < 1 else {}
+
+		profiler.start('display')
+		renderer.set_background(self.get_background())
+		renderer.begin(surface)
+		offset = self.camera.get_offset()
+		if offset != (0, 0): renderer.mark_all() # everything moves while shaking
+		queue.begin(offset)
+		profiler.stop()
+
+		if self.get_state() == self.STATES['play']:
+
+			profiler.start('particles')
+			images, positions, bounds = self.particles.get_blits(alpha)
+			queue.add(images, positions)
+			renderer.mark_boxes(bounds + (offset * 2))
+			profiler.stop(len(images))
+
+			profiler.start('explosions')
+			renderer.mark_rects(queue.add_sprites(self.explosions))
+			profiler.stop()
+
+			profiler.start('lasers')
+			renderer.mark_rects(queue.add_sprites(self.player.sprite.lasers_fired, rects = draw_rects))
+			profiler.stop()
 
-		if self.score > 10000 and self.lemonoid_frequency == 15000:
+			# Player
+			if not self.player.sprite.dead:
+
+				profiler.start('player')
+				renderer.mark_rects(queue.add_sprites(self.player, rects = draw_rects))
+				profiler.stop()
+
+			# Lemonoids
+			profiler.start('lemonoids')
+			renderer.mark_rects(queue.add_sprites(self.lemonoids, rects = draw_rects))
+			profiler.stop()
+
+			if self.DEBUG and self.quality['debug'] and self.lemonoids: 
+				
+				# Direction lines go on top of the lemonoids (and cross the whole screen)
+				profiler.start('blits')
+				queue.flush(surface)
+				profiler.stop()
+
+				[lemonoid.render_debug(surface, offset) for lemonoid in self.lemonoids]
+				renderer.mark_all()
+
+			# Health Bars
+			profiler.start('health bars')
+
+			health_bars = self.get_health_bars()
+			if not self.player.sprite.dead: health_bars.append(self.player.sprite.health_bar)
+
+			for health_bar in health_bars: health_bar.update(draw_rects.get(health_bar.parent))
+			renderer.mark_rects(queue.add_sprites(health_bars))
+
+			profiler.stop(len(health_bars))
+
+			# Life Count Meter (HUD - doesn't shake)
+			profiler.start('life meter')
+			renderer.mark_rects(queue.add_sprites(self.life_count_meter, world = False))
+			profiler.stop()
+
+		# Text
+		profiler.start('text')
+		self.text.update()
 
-			self.lemonoid_frequency = 10000
-			pygame.time.set_timer(self.LEMONOID_TIMER, self.lemonoid_frequency)
+		queue.add_blits(self.text.texts, world = False)
+		renderer.mark_rects([line[1] for line in self.text.texts])
 
-		if self.score > 50000 and self.lemonoid_frequency == 10000:
+		profiler.stop(len(self.text.texts))
 
-			self.lemonoid_frequency = 7500
-			pygame.time.set_timer(self.LEMONOID_TIMER, self.lemonoid_frequency)
+		# Submit (one fblits call per blend mode)
+		profiler.start('blits')
+		queue.flush(surface)
+		profiler.stop(queue.blit_count)
 
-		if self.score > 100000 and self.lemonoid_frequency == 7500:
+		# Profiler Overlay
+		if self.DEBUG and self.quality['debug']:
 
-			self.lemonoid_frequency = 1000
-			pygame.time.set_timer(self.LEMONOID_TIMER, self.lemonoid_frequency)
+			profiler.pools = self.get_pool_stats()
+			renderer.mark(profiler.draw(surface, font = self.load_font(12), budget_ms = 1000 / FPS, origin = (X0 + 10, Y1 - 10)))
+
+	def get_health_bars(self) -> list['Health_Bar']:
+
+		# Lemonoid health bars shown at the current quality level (the player's is added separately)
+		shown = self.quality['health_bars']
+		if shown == 'player': return []
+
+		return [lemonoid.health_bar for lemonoid in self.lemonoids if lemonoid.size != 4 and lemonoid.health > 0 and (shown == 'all' or lemonoid.health < lemonoid.MAX_HEALTH)]
+
+	def update_quality(self, frame_ms: int | float) -> None:
+
+		# Feeds the quality governor a rendered frame's time (excluding the FPS cap's wait)
+		if QUALITY_GOVERNOR and self.governor.update(frame_ms):
+
+			self.apply_quality()
+			if self.DEBUG: print(f'Quality {self.governor.get_name()}')
+
+	def apply_quality(self) -> None:
+
+		self.quality = self.governor.get_settings()
+		self.particles.density = self.quality['particles']
+		self.particles.rotation_stride = self.quality['particle_rotation']
+		self.profiler.quality = self.governor.level
+
+	def set_timer(self, event: int, millis: int, loops: int = 0) -> None:
+
+		# Same as pygame.time.set_timer, but on simulated time (see Scheduler)
+		self.scheduler.set(event, millis, loops, ticks = self.ticks)
 
 	def add_score(self, score: int) -> None:
+
 		self.score += score
+		if self.score > self.highscore: self.highscore = self.score
+
+		# Spawn lemonoids faster as the score passes each threshold (never slower again)
+		frequency = next((frequency for threshold, frequency in self.LEMONOID_FREQUENCIES if self.score > threshold), self.lemonoid_frequency)
+
+		if frequency < self.lemonoid_frequency:
+
+			self.lemonoid_frequency = frequency
+			self.set_timer(self.LEMONOID_TIMER, self.lemonoid_frequency)
 
 	def get_state(self) -> int:
 		return self.state
@@ -189,50 +474,48 @@ class Game:
 	def set_state(self, state: int) -> None:
 		self.state = state
 
-	def shake(self, offset: tuple) -> None:
-		self.shake_offset = (self.shake_offset[0] * offset[0], self.shake_offset[1] * offset[1])
+	def play_sfx(self, sfx: pygame.mixer.Sound, priority: int = 0) -> None:
+		if self.SFX_VOL > 0: self.audio.play(sfx, priority)
 
-	def add_shake_offsets(self, velocity: int) -> None:
+	def load_sfx(self, path: str, volume: int | float = 1) -> pygame.mixer.Sound:
+		return assets.load_sfx(path, self.SFX_VOL * volume)
 
-		self.shake_offset = (cos(self.player.sprite.angle) * 16, sin(self.player.sprite.angle) * 16)
+	def load_img(self, path: str, scale: int | float = 1) -> pygame.surface.Surface:
+		return assets.load_img(path, self.SCALE * scale)
 
-		for i in range(velocity): self.shake_offsets.append((1, 1))
+	def load_font(self, size: int, bold: bool = False) -> pygame.font.Font:
+		return assets.load_font('Fonts/pixel_font.ttf', int(size * self.SCALE), bold)
 
-		self.shake_offsets.append((-1.8, -1.8))
-		for i in range(velocity): self.shake_offsets.append((1, 1))
-
-		for i in range(16):
-			
-			self.shake_offsets.append((uniform(-0.5, -0.8), uniform(-0.5, -0.8)))
-			for i in range(velocity): self.shake_offsets.append((1, 1))
+	def load_atlas(self, path: str, scale: int | float = 1, step: int | float = 1, recolour: tuple[tuple[int, int, int], tuple[int, int, int]] | None = None) -> Rotation_Atlas:
+		return assets.load_atlas(path, self.SCALE * scale, step, build = PRELOAD_ROTATIONS, recolour = recolour)
 
-		self.shake_offsets.append((0, 0))
+	def warm_up(self) -> None:
 
-	def play_sfx(self, sfx: pygame.mixer.Sound) -> None:
-		if self.SFX_VOL > 0: sfx.play()
+		# Preload everything spawned mid-game (lemonoids, lasers, explosions, health bars) so steady-state frames never touch the disk
+		# (already in the registry when the background loader ran first)
+		assets.warm_up(**get_manifest(scale = self.SCALE, sfx_vol = self.SFX_VOL, music_vol = self.MUSIC_VOL))
 
-	def load_sfx(self, path: str) -> pygame.mixer.Sound:
-		
-		sfx = pygame.mixer.Sound(path)
-		sfx.set_volume(self.SFX_VOL)
-		return sfx
-
-	def load_img(self, path: str) -> pygame.surface.Surface:
-		return pygame.transform.scale_by(pygame.image.load(path), self.SCALE).convert_alpha()
+		for size in range(1, 5): 
+			
+			self.load_atlas(f'Images/Lemonoid/Normal/{size}.png', 2.5, LEMONOID_ROTATION_STEP)
+			self.load_atlas(f'Images/Lemonoid/Normal/{size}.png', 2.5, LEMONOID_ROTATION_STEP, recolour = LEMONOID_FLASH_COLOURS)
+			
+		for name in ['Normal', 'Shoot', 'Thruster', 'Blink']: self.load_atlas(f'Images/Player/Ship0/{name}.png', 2.5, PLAYER_ROTATION_STEP)
+		self.load_atlas('Images/Laser/Laser0.png', 2.5, 1)
+		self.load_atlas('Images/Explosion/Flash.png', 2.5 / 8, 1)
 
 	def respawn(self) -> None:
 
-		self.shake_offset = (0, 0)
-		self.shake_offsets.clear()
-		self.lemonoids.empty()
-		for i in range(3): self.lemonoids.add(Lemonoid(angle = randint(0, 360), move_speed = 75, size = 1, game = self))
-		pygame.time.set_timer(self.LEMONOID_TIMER, self.lemonoid_frequency)
-		self.explosions.empty()
+		self.camera.reset()
+		release_group(self.lemonoids)
+		for i in range(3): self.lemonoids.add(self.pools['lemonoid'].acquire(angle = randint(0, 360), move_speed = self.LEMONOID_SPEED, size = 1, game = self))
+		self.set_timer(self.LEMONOID_TIMER, self.lemonoid_frequency)
+		release_group(self.explosions)
 
 	def reset(self) -> None:
 
-		self.lemonoids.empty()
-		self.explosions.empty()
+		release_group(self.lemonoids)
+		release_group(self.explosions)
 		self.player.sprite.reset()
 		self.particles.empty()
 		self.life_count_meter.empty()
@@ -259,6 +542,7 @@ class Game:
 
 	def save(self) -> None:
 
+		self.profiler.close()
 		print('Saving... 0%')
 		with open('Saves/save.txt', 'w') as save: save.write(f'HIGHSCORE = {self.highscore}')
 		print('Saving... 100%')
@@ -270,25 +554,32 @@ class Text:
 		self.game = game
 		self.COLOURS = game.COLOURS
 		self.FONTS = game.FONTS
+		self.cache = game.text_cache
 		self.texts: list[tuple[pygame.surface.Surface, pygame.rect.Rect]] = []
 
+		# Glyphs (numbers are composed from these instead of being re-rendered)
+		self.fps_glyphs = {colour: Glyph_Atlas(self.FONTS['h3'], self.COLOURS[colour], self.COLOURS['black'], characters = '0123456789.') for colour in ['green', 'yellow', 'red']}
+		self.score_glyphs = Glyph_Atlas(self.FONTS['h1'], self.COLOURS['white'])
+		self.highscore_glyphs = Glyph_Atlas(self.FONTS['h2'], self.COLOURS['grey'])
+
 		# Texts
 
 		self.fps_text1 = self.FONTS['h3'].render('FPS', False, self.COLOURS['grey'], self.COLOURS['black'])
 		self.fps_text1_rect = self.fps_text1.get_rect(topleft = (X0, Y0))
 
-		self.fps_text2 = pygame.surface.Surface((0, 0))
-		self.fps_text2_rect = self.fps_text2.get_rect()
+		self.fps_text2: list[tuple[pygame.surface.Surface, pygame.rect.Rect]] = []
+		self.fps_update_time = 0.0
+
+		self.quality_text = pygame.surface.Surface((0, 0))
+		self.quality_text_rect = self.quality_text.get_rect()
 
 		# Play
-		self.score_text = pygame.surface.Surface((0, 0))
-		self.score_text_rect = self.score_text.get_rect()
+		self.score_text: list[tuple[pygame.surface.Surface, pygame.rect.Rect]] = []
 
 		self.play_text1 = self.FONTS['h3'].render('Score', False, self.COLOURS['dark_grey'])
 		self.play_text1_rect = self.play_text1.get_rect(center = (CENTER_X, Y0 + 170 * SCALE))
 
-		self.highscore_text = pygame.surface.Surface((0, 0))
-		self.highscore_text_rect = self.highscore_text.get_rect()
+		self.highscore_text: list[tuple[pygame.surface.Surface, pygame.rect.Rect]] = []
 
 		self.play_text2 = self.FONTS['h3'].render('Highscore', False, self.COLOURS['dark_grey'])
 		self.play_text2_rect = self.play_text2.get_rect(center = (CENTER_X, Y0 + 70 * SCALE))
@@ -311,39 +602,45 @@ class Text:
 
 	def update(self) -> None:
 
-		fps = round(clock.get_fps(), 1)
-		fps_colour = self.COLOURS['green'] if fps > 60 else self.COLOURS['yellow'] if fps < 60 and fps > 10 else self.COLOURS['red']
+		# FPS (only re-read every FPS_READOUT_INTERVAL ms)
+		if not self.fps_text2 or self.game.ticks - self.fps_update_time >= FPS_READOUT_INTERVAL:
+
+			fps = round(self.game.clock.get_fps(), 1)
+			fps_colour = 'green' if fps > 60 else 'yellow' if fps < 60 and fps > 10 else 'red'
 
-		self.fps_text2 = self.FONTS['h3'].render(str(fps), False, fps_colour, self.COLOURS['black'])
-		self.fps_text2_rect = self.fps_text2.get_rect(topleft = self.fps_text1_rect.topright)
+			self.fps_text2 = self.fps_glyphs[fps_colour].get_blits(str(fps), topleft = self.fps_text1_rect.topright)
+			self.fps_update_time = self.game.ticks
+
+		# Quality Level (governor)
+		self.quality_text = self.cache.render(self.FONTS['h3'], f'Quality {self.game.governor.get_name()}', self.COLOURS['grey'], self.COLOURS['black'])
+		self.quality_text_rect = self.quality_text.get_rect(topleft = self.fps_text1_rect.bottomleft)
 
 		if self.game.get_state() == self.game.STATES['play']:
 
-			self.score_text = self.FONTS['h1'].render(str(self.game.score), False, self.COLOURS['white'])
-			self.score_text_rect = self.score_text.get_rect(center = (CENTER_X, Y0 + 120 * SCALE))
+			lives = self.game.player.sprite.lives
 
-			self.highscore_text = self.FONTS['h2'].render(str(self.game.highscore), False, self.COLOURS['grey'])
-			self.highscore_text_rect = self.highscore_text.get_rect(center = (CENTER_X, Y0 + 30 * SCALE))
+			self.score_text = self.score_glyphs.get_blits(str(self.game.score), center = (CENTER_X, Y0 + 120 * SCALE))
+			self.highscore_text = self.highscore_glyphs.get_blits(str(self.game.highscore), center = (CENTER_X, Y0 + 30 * SCALE))
 
-			self.play_text3 = self.FONTS['h3'].render('Lives' if self.game.player.sprite.lives != 1 else 'Life', False, self.COLOURS['dark_grey'])
+			self.play_text3 = self.cache.render(self.FONTS['h3'], 'Lives' if lives != 1 else 'Life', self.COLOURS['dark_grey'])
 			self.play_text3_rect = self.play_text3.get_rect(center = (CENTER_X, Y1 - 30 * SCALE))
 
-			self.lives_text = self.FONTS['h1'].render(str(self.game.player.sprite.lives), False, [self.COLOURS['red'], self.COLOURS['red'], self.COLOURS['yellow'], self.COLOURS['green']][self.game.player.sprite.lives] if self.game.player.sprite.lives <= 3 else self.COLOURS['green'])
+			self.lives_text = self.cache.render(self.FONTS['h1'], str(lives), [self.COLOURS['red'], self.COLOURS['red'], self.COLOURS['yellow'], self.COLOURS['green']][lives] if lives <= 3 else self.COLOURS['green'])
 			self.lives_text_rect = self.lives_text.get_rect(midbottom = (CENTER_X, Y1 - 40 * SCALE))
 
-			self.lives_text_shadow = self.FONTS['h1'].render(str(self.game.player.sprite.lives), False, self.COLOURS['black'])
-			self.lives_text_shadow.set_alpha(128)
+			self.lives_text_shadow = self.cache.render(self.FONTS['h1'], str(lives), self.COLOURS['black'], alpha = 128)
 			self.lives_text_shadow_rect = self.lives_text.get_rect(midbottom = (CENTER_X, Y1 - 35 * SCALE))
 
 			self.texts = [
 
 				(self.fps_text1, self.fps_text1_rect),
-				(self.fps_text2, self.fps_text2_rect),
+				*self.fps_text2,
+				(self.quality_text, self.quality_text_rect),
 
-				(self.score_text, self.score_text_rect),
+				*self.score_text,
 				(self.play_text1, self.play_text1_rect),
 
-				(self.highscore_text, self.highscore_text_rect),
+				*self.highscore_text,
 				(self.play_text2, self.play_text2_rect),
 
 				(self.lives_text_shadow, self.lives_text_shadow_rect),
@@ -365,48 +662,71 @@ class Text:
 			
 			self.texts = [
 				(self.fps_text1, self.fps_text1_rect),
-				(self.fps_text2, self.fps_text2_rect)
+				*self.fps_text2,
+				(self.quality_text, self.quality_text_rect)
 			]
 
 class Cursor:
 
-	def __init__(self, game: Game) -> None:
+	'''
+	Mouse cursor: the arrow on the game over screen, the crosshair while playing (spinning while firing).
+
+	The spinning crosshair's frames are pre-rotated once, and a frame's system cursor is made once
+	and only pushed to SDL (a costly call) when the frame shown actually changes. In 'software'
+	mode the OS cursor is hidden and the frame is drawn onto the game surface instead.
+	'''
+
+	def __init__(self, game: Game, mode: str = 'system') -> None:
 
 		self.game = game
+		self.MODE = mode
 		self.ROTATE_SPEED = 500
 		self.angle = 0.0
-		self.index = {self.game.STATES['play']: 1, self.game.STATES['game_over']: 0}[self.game.get_state()]
-
-		self.cursor_unfocus_image = pygame.transform.scale_by(pygame.image.load('Images/UI/Cursor/Cursor/Unfocus.png'), 3).convert_alpha()
-		self.cursor_focus_image = pygame.transform.scale_by(self.game.load_img('Images/UI/Cursor/Cursor/Focus.png'), 3).convert_alpha()
-		self.focussed = False
-		
-		self.crosshair_unfocus_image = pygame.transform.scale_by(pygame.image.load('Images/UI/Cursor/Crosshair/Unfocus.png'), 3).convert_alpha()
-		self.crosshair_focus_image = pygame.transform.scale_by(pygame.image.load('Images/UI/Cursor/Crosshair/Focus.png'), 3).convert_alpha()
 		self.focussed = False
 
+		self.cursor_unfocus_image = assets.load_img('Images/UI/Cursor/Cursor/Unfocus.png', 3)
+		self.cursor_focus_image = self.game.load_img('Images/UI/Cursor/Cursor/Focus.png', 3)
+		self.crosshair_unfocus_image = assets.load_img('Images/UI/Cursor/Crosshair/Unfocus.png', 3)
+		self.crosshair_focus_image = assets.load_img('Images/UI/Cursor/Crosshair/Focus.png', 3)
+		self.crosshair_atlas = assets.load_atlas('Images/UI/Cursor/Crosshair/Focus.png', 3, CURSOR_ROTATION_STEP, build = True) # only the focussed crosshair spins
+
 		self.images = [[self.cursor_unfocus_image, self.cursor_focus_image], [self.crosshair_unfocus_image, self.crosshair_focus_image]]
-		self.image = self.images[self.index][self.focussed]
-		self.cursor = pygame.cursors.Cursor((self.image.get_width() // 2, self.image.get_height() // 2), self.image)
+		self.cursors: dict[tuple[int, bool, int | None], pygame.cursors.Cursor] = {} # frame: system cursor
+		self.frame: tuple[int, bool, int | None] | None = None # (image index, focussed, rotation frame) shown
+		self.image = self.images[0][0]
+		self.pushes = 0 # system cursor changes
+
+		if self.MODE == 'software': pygame.mouse.set_visible(False)
 
 	def update(self, dt: float) -> None:
-		
-		def input() -> None:
 
-			self.focussed = pygame.mouse.get_pressed()[0]
-			if self.focussed and self.game.get_state() == self.game.STATES['play']: rotate()
+		index = {self.game.STATES['play']: 1, self.game.STATES['game_over']: 0}[self.game.get_state()]
+		self.focussed = self.game.input.mouse_pressed
 
-		def rotate() -> None:
+		if self.focussed and index == 1:
 
 			self.angle = (self.angle % 360) + self.ROTATE_SPEED * dt
-			self.image = pygame.transform.rotate(self.images[self.index][self.focussed], self.angle).convert_alpha()
+			frame = (index, True, self.crosshair_atlas.get_index(self.angle))
 
-		self.cursor = pygame.cursors.Cursor((self.image.get_width() // 2, self.image.get_height() // 2), self.image)
-		pygame.mouse.set_cursor(self.cursor)
+		else: frame = (index, self.focussed, None)
 
-		self.index = {self.game.STATES['play']: 1, self.game.STATES['game_over']: 0}[self.game.get_state()]
-		self.image = self.images[self.index][self.focussed]
-		input()
+		if frame == self.frame: return
+
+		self.frame = frame
+		self.image = self.images[index][self.focussed] if frame[2] is None else self.crosshair_atlas.get_frame(frame[2])[0]
+
+		if self.MODE == 'system':
+
+			if frame not in self.cursors: self.cursors[frame] = pygame.cursors.Cursor((self.image.get_width() // 2, self.image.get_height() // 2), self.image)
+			pygame.mouse.set_cursor(self.cursors[frame])
+			self.pushes += 1
+
+	def draw(self, surface: pygame.surface.Surface) -> pygame.rect.Rect:
+
+		# Software mode: returns the area drawn over
+		rect = self.image.get_rect(center = self.game.input.mouse_pos)
+		surface.blit(self.image, rect)
+		return rect
 
 class Player(pygame.sprite.Sprite):
 
@@ -422,19 +742,19 @@ class Player(pygame.sprite.Sprite):
 		self.SPEED = 3
 		self.MAX_SPEED = 3
 		self.FIRE_RATE = 0
-		self.FIRE_RATES = {0: 8} # ship index: fire rate
+		self.FIRE_RATES = {0: 0.075} # ship index: seconds between shots
 		self.ACCURACIES = {0: 1} # ship index: accuracy (fire spread) in degrees
 		self.MAX_LIVES = 3
 		self.BLINK_FREQUENCY = 250
 		self.BLINK_TIMER = pygame.USEREVENT + 1
-		self.EXPLOSION_SHAKE_VEL = 4
+		self.EXPLOSION_SHAKE = 1 # camera trauma added on death
 		self.MAX_HEALTH = 4
 
 		# Vars
 		self.x_vel = 0.0
 		self.y_vel = 0.0
 		self.angle = 0.0
-		self.fire_buffer = 0
+		self.fire_buffer = 0.0 # seconds until the next shot
 		self.ship_index = 0
 		self.lives = self.MAX_LIVES
 		self.collided = False
@@ -444,19 +764,16 @@ class Player(pygame.sprite.Sprite):
 		self.health = self.MAX_HEALTH
 
 		# Images
-		self.og_image = pygame.transform.scale_by(self.game.load_img(f'Images/Player/Ship{self.ship_index}/Normal.png'), self.SIZE).convert_alpha()
-		self.shoot_image = pygame.transform.scale_by(self.game.load_img(f'Images/Player/Ship{self.ship_index}/Shoot.png'), self.SIZE).convert_alpha()
-		self.thruster_image = pygame.transform.scale_by(self.game.load_img(f'Images/Player/Ship{self.ship_index}/Thruster.png'), self.SIZE).convert_alpha()
-		self.blink_image = pygame.transform.scale_by(self.game.load_img(f'Images/Player/Ship{self.ship_index}/Blink.png'), self.SIZE).convert_alpha()
+		self.atlases = {name: self.game.load_atlas(f'Images/Player/Ship{self.ship_index}/{name}.png', self.SIZE, PLAYER_ROTATION_STEP) for name in ['Normal', 'Shoot', 'Thruster', 'Blink']}
 
-		self.break_images = [pygame.transform.scale_by(self.game.load_img(f'Images/Player/Ship{self.ship_index}/Break/Break{i}.png'), self.SIZE).convert_alpha() for i in range(3)]
-		self.particle_images = [pygame.transform.scale_by(self.game.load_img(f'Images/Player/Ship{self.ship_index}/Break/Particle{i}.png'), self.SIZE).convert_alpha() for i in range(2)]
+		self.break_images = [self.game.load_img(f'Images/Player/Ship{self.ship_index}/Break/Break{i}.png', self.SIZE) for i in range(3)]
+		self.particle_images = [self.game.load_img(f'Images/Player/Ship{self.ship_index}/Break/Particle{i}.png', self.SIZE) for i in range(2)]
 
 		# Image, Rect, Mask, Pos
-		self.image = self.og_image
+		self.image, self.mask, self.offset = self.atlases['Normal'].get(0)
 		self.rect = self.image.get_rect(center = (CENTER_X, CENTER_Y))
-		self.mask = pygame.mask.from_surface(self.image)
 		self.pos = pygame.math.Vector2(self.rect.center)
+		self.previous_pos = self.pos.copy()
 
 		# SFX
 		self.shoot_sfx = self.game.load_sfx('Audio/SFX/Player/Shoot.wav')
@@ -464,7 +781,7 @@ class Player(pygame.sprite.Sprite):
 		self.hit_sfx = self.game.load_sfx('Audio/SFX/Player/Hit.mp3')
 
 		self.lasers_fired: pygame.sprite.Group = pygame.sprite.Group()
-		self.health_bar = pygame.sprite.GroupSingle(Health_Bar(game = self.game, offset = (0, -40), size = 0.75, parent = self))
+		self.health_bar = Health_Bar(game = self.game, offset = (0, -40), size = 0.75, parent = self)
 
 		self.set_fire_rate()
 
@@ -479,7 +796,7 @@ class Player(pygame.sprite.Sprite):
 					# Explosion
 					self.game.explosions.add(
 
-						Explosion(
+						self.game.pools['explosion'].acquire(
 							type = 0, 
 							pos = self.pos, 
 							game = self.game, 
@@ -491,41 +808,31 @@ class Player(pygame.sprite.Sprite):
 					# Particles
 					for i in range(len(self.break_images)): 
 						
-						self.game.particles.add(
-
-							Particle(
-								start_pos = self.pos, 
-								angle = self.angle + 120 * i,
-								image = self.break_images[i], 
-								move_speed = randint(100, 200), 
-								rotation_speed = randint(100, 1000),
-								fade_speed = 50,
-								game = self.game
-							)
-
+						self.game.particles.emit(
+							start_pos = self.pos,
+							angle = self.angle + 120 * i,
+							image = self.break_images[i],
+							move_speed = randint(100, 200),
+							rotation_speed = randint(100, 1000),
+							fade_speed = 50
 						)
 
 					for i in range(randint(8, 32)): 
 						
-						self.game.particles.add(
-
-							Particle(
-								start_pos = self.pos,
-								angle = randint(0, 360),
-								image = self.particle_images[i % len(self.particle_images)], 
-								move_speed = randint(100, 200), 
-								rotation_speed = randint(100, 1000),
-								fade_speed = 150,
-								game = self.game
-							)
-
+						self.game.particles.emit(
+							start_pos = self.pos,
+							angle = randint(0, 360),
+							image = self.particle_images[i % len(self.particle_images)],
+							move_speed = randint(100, 200),
+							rotation_speed = randint(100, 1000),
+							fade_speed = 150
 						)
 
 					# Shake
-					self.game.add_shake_offsets(velocity = self.EXPLOSION_SHAKE_VEL)
-					self.game.play_sfx(self.death_sfx)
+					self.game.camera.add_shake(self.EXPLOSION_SHAKE)
+					self.game.play_sfx(self.death_sfx, priority = 3)
 				
-					self.death_time = pygame.time.get_ticks()
+					self.death_time = self.game.ticks
 
 				self.health -= damage
 
@@ -533,42 +840,40 @@ class Player(pygame.sprite.Sprite):
 
 					self.dead = True
 					self.lives -= 1
-					self.health_bar.sprite.segment.empty()
-					self.health_bar.empty()
 					death_animation()
 
-				else: self.game.play_sfx(self.hit_sfx)
+				else: self.game.play_sfx(self.hit_sfx, priority = 2)
 		
 			def move(angle: float, momentum: int) -> None:
 
 				self.x_vel += cos(radians(angle)) * self.ACCELERATION_VEL ** 2 * momentum * self.SPEED * dt
 				if self.x_vel > self.MAX_SPEED: self.x_vel = self.MAX_SPEED
 				if self.x_vel < -self.MAX_SPEED: self.x_vel = -self.MAX_SPEED
-				self.pos.x += self.x_vel + self.game.shake_offset[0]
+				self.pos.x += self.x_vel * dt * TICK_RATE # velocities are in px per 120Hz tick
 
 				self.y_vel += sin(radians(angle)) * self.ACCELERATION_VEL ** 2 * momentum * self.SPEED * dt
 				if self.y_vel > self.MAX_SPEED: self.y_vel = self.MAX_SPEED
 				if self.y_vel < -self.MAX_SPEED: self.y_vel = -self.MAX_SPEED
-				self.pos.y -= self.y_vel + self.game.shake_offset[1]
+				self.pos.y -= self.y_vel * dt * TICK_RATE
 
-			def rotate_to(pos: tuple, og_img: pygame.surface.Surface) -> None:
+			def rotate_to(pos: tuple, atlas: Rotation_Atlas) -> None:
 		
 				x_distance = pos[0] - self.pos.x
 				y_distance = pos[1] - self.pos.y
 				angle_to = degrees(atan2(-y_distance, x_distance) % (2 * pi))
 				self.angle = round(angle_to, 2)
-				self.image = pygame.transform.rotate(og_img, self.angle).convert_alpha()
-				self.rect = self.image.get_rect(center = self.pos)
+				self.image, self.mask, self.offset = atlas.get(self.angle)
+				self.rect = self.image.get_rect(topleft = (round(self.pos.x) + self.offset[0], round(self.pos.y) + self.offset[1]))
 
 			def shoot() -> None:
 
-				if self.fire_buffer < 0: self.set_fire_rate()
-				elif self.fire_buffer == 0:
+				# Fires on the tick nearest each shot's due time, carrying the remainder over so the rate doesn't depend on dt
+				if loaded:
 					
-					self.game.play_sfx(self.shoot_sfx)
+					self.game.play_sfx(self.shoot_sfx, priority = 1)
 					self.lasers_fired.add(
 
-						Laser(
+						self.game.pools['laser'].acquire(
 							start_pos = self.pos, 
 							angle = self.angle + uniform(-(self.ACCURACIES[self.ship_index] / 2), self.ACCURACIES[self.ship_index] / 2),
 							size = self.SIZE,
@@ -577,31 +882,32 @@ class Player(pygame.sprite.Sprite):
 						)
 
 					)
+					self.fire_buffer += self.FIRE_RATE
 
-				self.fire_buffer -= round(100 * dt)
+				self.fire_buffer -= dt
 
-			keys_pressed = pygame.key.get_pressed()
-			mouse_pressed = pygame.mouse.get_pressed()[0]
-			mouse_pos = pygame.mouse.get_pos()
+			thrusting = self.game.input.is_pressed(pygame.K_w)
+			firing = self.game.input.mouse_pressed or self.game.input.is_pressed(pygame.K_SPACE)
 
 			# Movement
-			if not self.dead: move(self.angle, keys_pressed[pygame.K_w])
+			if not self.dead: move(self.angle, thrusting)
 
-			# Direction
-			if self.fire_buffer != 0: rotate_to(mouse_pos, self.og_image)
-			if self.fire_buffer == 0: rotate_to(mouse_pos, self.shoot_image)
-			if keys_pressed[pygame.K_w] and randint(0, 1) == 0: rotate_to(mouse_pos, self.thruster_image)
-			if self.blink_index == 1: rotate_to(mouse_pos, self.blink_image)
+			# Direction (resolve the visual state first, then do a single lookup)
+			loaded = self.fire_buffer < dt / 2
+			atlas = self.atlases['Shoot'] if loaded else self.atlases['Normal']
+			if thrusting and randint(0, 1) == 0: atlas = self.atlases['Thruster']
+			if self.blink_index == 1: atlas = self.atlases['Blink']
+			rotate_to(self.game.input.mouse_pos, atlas)
 
-			if (mouse_pressed or keys_pressed[pygame.K_SPACE]) and not self.dead: shoot()	
-			elif not mouse_pressed and not keys_pressed[pygame.K_SPACE] and not self.dead: self.set_fire_rate()
+			if firing and not self.dead: shoot()	
+			elif not firing and not self.dead: self.set_fire_rate()
 
 			# Collisions
 			if pygame.sprite.spritecollide(self, self.game.lemonoids, False, pygame.sprite.collide_rect) and not self.dead and not self.game.DEBUG:
 
 				collided_lemonoids = pygame.sprite.spritecollide(self, self.game.lemonoids, False, pygame.sprite.collide_mask)
 
-				if collided_lemonoids:
+				if collided_lemonoids and not self.game.INVULNERABLE:
 
 					hit(5 - collided_lemonoids[0].size)
 					collided_lemonoids[0].death(False)
@@ -616,20 +922,11 @@ class Player(pygame.sprite.Sprite):
 			if self.pos.y > Y1 + self.image.get_height() / 2: self.pos.y = Y0 - self.image.get_height() / 2
 			elif self.pos.y < Y0 - self.image.get_height() / 2: self.pos.y = Y1 + self.image.get_height() / 2
 
+		self.previous_pos = self.pos.copy()
 		self.rect.center = (round(self.pos.x), round(self.pos.y))
-		self.mask = pygame.mask.from_surface(self.image)
 		input()
 		wrap_around()
 
-		if not self.dead:
-
-			self.health_bar.update()
-			self.health_bar.sprite.segment.update()
-
-			self.health_bar.draw(screen)
-			self.health_bar.sprite.segment.draw(screen)
-			self.health_bar.sprite.render_font()
-
 	def blink(self) -> None:
 		self.blink_index = (self.blink_index % 2) + 1
 
@@ -648,13 +945,13 @@ class Player(pygame.sprite.Sprite):
 		self.death_time = 0
 		self.blink_index = 0
 		self.health = self.MAX_HEALTH
-		self.health_bar = pygame.sprite.GroupSingle(Health_Bar(game = self.game, offset = (0, -40), size = 0.75, parent = self))
-		pygame.time.set_timer(self.BLINK_TIMER, self.BLINK_FREQUENCY, 6)
+		self.health_bar = Health_Bar(game = self.game, offset = (0, -40), size = 0.75, parent = self)
+		self.game.set_timer(self.BLINK_TIMER, self.BLINK_FREQUENCY, 6)
 
 	def reset(self) -> None:
 
 		self.lives = self.MAX_LIVES
-		self.image = self.og_image
+		self.image, self.mask, self.offset = self.atlases['Normal'].get(0)
 		self.pos = pygame.math.Vector2((CENTER_X, CENTER_Y))
 		self.x_vel, self.y_vel, self.angle = 0, 0, 0
 		self.collided = False
@@ -662,10 +959,10 @@ class Player(pygame.sprite.Sprite):
 		self.death_time = 0
 		self.blink_index = 0
 		self.health = self.MAX_HEALTH
-		self.health_bar = pygame.sprite.GroupSingle(Health_Bar(game = self.game, offset = (0, -40), size = 0.75, parent = self))
-		self.lasers_fired.empty()
+		self.health_bar = Health_Bar(game = self.game, offset = (0, -40), size = 0.75, parent = self)
+		release_group(self.lasers_fired)
 
-class Laser(pygame.sprite.Sprite):
+class Laser(Pooled_Sprite):
 
 	def __init__(
 			
@@ -679,20 +976,33 @@ class Laser(pygame.sprite.Sprite):
 
 		super().__init__()
 		
-		self.laser_index = laser_index
 		self.game = game
-		self.ANGLE = angle
-		self.SIZE = size
 		self.SPEEDS = {0: 1000} # laser index: speed
 		self.DAMAGES = {0: 1} # laser index: damage to lemonoid
+
+		self.reset(start_pos, angle, size, laser_index)
+
+	def reset(
+			
+			self, 
+			start_pos: tuple[int, int] | pygame.math.Vector2, 
+			angle: int | float, size: int | float, 
+			laser_index: int,
+			game: Game | None = None
+		
+		) -> None:
+
+		self.laser_index = laser_index
+		self.ANGLE = angle
+		self.SIZE = size
 		self.collided = 0
 
-		self.image = pygame.transform.rotate(pygame.transform.scale_by(self.game.load_img(f'Images/Laser/Laser{self.laser_index}.png'), self.SIZE), self.ANGLE).convert_alpha()
-		self.hit_image = pygame.transform.rotate(pygame.transform.scale_by(self.game.load_img('Images/Explosion/Flash.png'), self.SIZE / 8), self.ANGLE).convert_alpha()
-		self.mask = pygame.mask.from_surface(self.image)
+		self.image, self.mask = self.game.load_atlas(f'Images/Laser/Laser{self.laser_index}.png', self.SIZE, 1).get(self.ANGLE)[:2]
+		self.hit_image = self.game.load_atlas('Images/Explosion/Flash.png', self.SIZE / 8, 1).get(self.ANGLE)[0]
 
 		self.rect = self.image.get_rect(center = start_pos)
 		self.pos = pygame.math.Vector2(self.rect.center)
+		self.previous_pos = self.pos.copy()
 
 	def update(self, dt: int | float) -> None:
 		
@@ -705,9 +1015,10 @@ class Laser(pygame.sprite.Sprite):
 
 			x = cos(radians(self.ANGLE)) * self.SPEEDS[self.laser_index] * dt
 			y = sin(radians(self.ANGLE)) * self.SPEEDS[self.laser_index] * dt
-			self.pos += pygame.math.Vector2((x, -y)) + pygame.math.Vector2(self.game.shake_offset)
+			self.pos += pygame.math.Vector2((x, -y))
 
 		if self.collided >= 1: self.kill()
+		self.previous_pos = self.pos.copy()
 		self.rect.center = (round(self.pos.x), round(self.pos.y))
 
 		move()
@@ -719,7 +1030,7 @@ class Laser(pygame.sprite.Sprite):
 		self.rect = self.image.get_rect(center = self.pos)
 		self.collided += 1
 		
-class Lemonoid(pygame.sprite.Sprite):
+class Lemonoid(Pooled_Sprite):
 
 	def __init__(
 			
@@ -738,11 +1049,34 @@ class Lemonoid(pygame.sprite.Sprite):
 		self.game = game
 		self.HEALTHS = {1: 10, 2: 4, 3: 2, 4: 1} # size: health
 		self.SCORES = {1: 100, 2: 50, 3: 20, 4: 10} # size: score gained when destroyed
+		self.EXPLOSION_SHAKE = 1 # camera trauma added on death
+		self.health_bars: dict[int, Health_Bar] = {} # size: health bar (kept for when this lemonoid is reused at that size)
+		self.kinematics: Lemonoid_Group | None = None # group whose arrays hold this lemonoid's position / angle
+		self.slot = 0 # row in those arrays
+
+		# SFX
+		self.hit_sfx = self.game.load_sfx('Audio/SFX/Lemonoid/Hit.wav', 0.3)
+		self.explosion_sfx = self.game.load_sfx('Audio/SFX/Lemonoid/Explosion.wav', 0.3)
+		self.explosion_sfx_2 = self.game.load_sfx('Audio/SFX/Lemonoid/Explosion2.wav', 0.3)
+
+		self.reset(angle, move_speed, size, pos)
+
+	def reset(
+			
+			self,
+			angle: float, 
+			move_speed: int | float, 
+			size: int, 
+			pos: tuple | pygame.math.Vector2 = (0, 0),
+			game: Game | None = None
+
+		) -> None:
+
 		self.MOVE_SPEED = move_speed
 		self.ROTATE_SPEED = randint(75, 125) * size
 		self.DIRECTION = angle + 180 % 360
+		self.VELOCITY = (cos(radians(self.DIRECTION)) * self.MOVE_SPEED, -sin(radians(self.DIRECTION)) * self.MOVE_SPEED) # never changes, so worked out once
 		self.MAX_HEALTH = self.HEALTHS[size]
-		self.EXPLOSION_SHAKE_VEL = 4
 		
 		# Vars
 		self.angle = self.DIRECTION
@@ -755,215 +1089,198 @@ class Lemonoid(pygame.sprite.Sprite):
 		self.dead = False
 
 		# Images
-		self.og_image = pygame.transform.scale_by(self.game.load_img(f'Images/Lemonoid/Normal/{self.size}.png'), 2.5).convert_alpha()
-		self.particle_images = [self.game.load_img(f'Images/Lemonoid/Break/Particle{i}.png').convert_alpha() for i in range(2)]
-		self.image = pygame.transform.rotate(self.og_image, self.angle).convert_alpha()
+		self.og_image = self.game.load_img(f'Images/Lemonoid/Normal/{self.size}.png', 2.5)
+		self.atlas = self.game.load_atlas(f'Images/Lemonoid/Normal/{self.size}.png', 2.5, LEMONOID_ROTATION_STEP)
+		self.flash_atlas = self.game.load_atlas(f'Images/Lemonoid/Normal/{self.size}.png', 2.5, LEMONOID_ROTATION_STEP, recolour = LEMONOID_FLASH_COLOURS)
+		self.flash_time = None # ticks of the last hit (shows the flash atlas for HIT_FLASH_TIME)
+		self.particle_images = [self.game.load_img(f'Images/Lemonoid/Break/Particle{i}.png') for i in range(2)]
+		self.image, self.mask, self.offset = self.atlas.get(self.angle)
 
 		# Rects, Vectors, Masks, Pos
 		if self.size == 1: self.rect = self.image.get_rect(center = (CENTER_X + cos(radians(angle)) * max(WIDTH, HEIGHT), CENTER_Y - sin(radians(angle)) * max(WIDTH, HEIGHT)))
 		else: self.rect = self.image.get_rect(center = pos)
-		self.mask = pygame.mask.from_surface(self.image)
 		self.pos = pygame.math.Vector2(self.rect.center)
 
-		# SFX
-		self.hit_sfx = self.game.load_sfx('Audio/SFX/Lemonoid/Hit.wav')
-		self.explosion_sfx = self.game.load_sfx('Audio/SFX/Lemonoid/Explosion.wav')
-		self.explosion_sfx_2 = self.game.load_sfx('Audio/SFX/Lemonoid/Explosion2.wav')
-		for sfx in [self.hit_sfx, self.explosion_sfx, self.explosion_sfx_2]: sfx.set_volume(sfx.get_volume() * 0.3)
-
 		# Health Bar
-		if self.size != 4: 
+		if self.size != 4 and self.size not in self.health_bars: 
 			
-			self.health_bar = pygame.sprite.GroupSingle(
-				
-				Health_Bar(
-					game = self.game,
-					offset = (0, -50) if self.size == 3 else (0, 0),
-					size = 0.5 if self.size == 3 else (1 / self.size), 
-					parent = self
-				)
-
+			self.health_bars[self.size] = Health_Bar(
+				game = self.game,
+				offset = (0, -50) if self.size == 3 else (0, 0),
+				size = 0.5 if self.size == 3 else (1 / self.size), 
+				parent = self
 			)
 
-	def update(self, dt: float) -> None:
+		if self.size != 4: self.health_bar = self.health_bars[self.size]
 
-		def input() -> None:
+	# Kinematics (held in the group's arrays while this lemonoid is in one - see Lemonoid_Group)
+	@property
+	def pos(self) -> pygame.math.Vector2:
+		return pygame.math.Vector2(self.kinematics.pos[self.slot].tolist()) if self.kinematics else self.spawn_pos.copy()
 
-			# Laser Collisions
-			if pygame.sprite.spritecollide(self, self.game.player.sprite.lasers_fired, False, pygame.sprite.collide_rect):
+	@pos.setter
+	def pos(self, pos: tuple | pygame.math.Vector2) -> None:
 
-				collided_lasers = pygame.sprite.spritecollide(self, self.game.player.sprite.lasers_fired, False, pygame.sprite.collide_mask)
+		if self.kinematics: self.kinematics.pos[self.slot] = tuple(pos)
+		else: self.spawn_pos = pygame.math.Vector2(pos)
 
-				if collided_lasers and not self.colliding['laser']: 
-					
-					collision_pos = pygame.sprite.collide_mask(self, collided_lasers[0])
-					self.hit(relative_collision_pos = collision_pos if collision_pos else (0, 0), damage = collided_lasers[0].DAMAGES[collided_lasers[0].laser_index], object = collided_lasers[0])
-					for laser in collided_lasers: laser.hit()
-					self.colliding['laser'] = True
+	@property
+	def previous_pos(self) -> pygame.math.Vector2:
+		return pygame.math.Vector2(self.kinematics.previous_pos[self.slot].tolist()) if self.kinematics else self.spawn_pos.copy()
 
-				else: self.colliding['laser'] = False
-			
-			# Other Lemonoid Collisions
-			other_lemonoids = self.game.lemonoids.copy()
-			other_lemonoids.remove(self)
+	@property
+	def angle(self) -> float:
+		return float(self.kinematics.angle[self.slot]) if self.kinematics else self.spawn_angle
 
-			if pygame.sprite.spritecollide(self, other_lemonoids, False, pygame.sprite.collide_rect):
+	@angle.setter
+	def angle(self, angle: float) -> None:
 
-				collided_lemonoids = pygame.sprite.spritecollide(self, other_lemonoids, False, pygame.sprite.collide_mask)
+		if self.kinematics: self.kinematics.angle[self.slot] = angle
+		else: self.spawn_angle = angle
 
-				if collided_lemonoids and not self.colliding['lemonoid']:
+	@property
+	def outside_frame_on_spawn(self) -> bool:
+		return bool(self.kinematics.entering[self.slot]) if self.kinematics else self.spawn_entering
 
-					if self.first_frame: self.colliding_first = True
+	@outside_frame_on_spawn.setter
+	def outside_frame_on_spawn(self, outside_frame_on_spawn: bool) -> None:
 
-					if not self.colliding_first: 
-						
-						collision_pos = pygame.sprite.collide_mask(self, collided_lemonoids[0])
-						self.hit(relative_collision_pos = collision_pos if collision_pos else (0, 0), damage = 4 - (collided_lemonoids[0].size - 1), object = self)
-						collided_lemonoids[0].hit(relative_collision_pos = pygame.sprite.collide_mask(self, collided_lemonoids[0]), damage = 4 - (self.size - 1), object = self)
-					
-						self.colliding['lemonoid'] = True
+		if self.kinematics: self.kinematics.entering[self.slot] = outside_frame_on_spawn
+		else: self.spawn_entering = outside_frame_on_spawn
 
-				else:
-					
-					if self.colliding_first: self.colliding_first = False
-					self.colliding['lemonoid'] = False
+	def get_atlas(self) -> Rotation_Atlas:
 
-		def move() -> None:
+		if self.flash_time is not None and self.game.ticks - self.flash_time < HIT_FLASH_TIME: return self.flash_atlas
+		return self.atlas
 
-			x = cos(radians(self.DIRECTION)) * self.MOVE_SPEED * dt
-			y = sin(radians(self.DIRECTION)) * self.MOVE_SPEED * dt
-			self.pos += (x + self.game.shake_offset[0], -y - self.game.shake_offset[1])
+	def collide(self, lasers: list['Laser'], lemonoids: list['Lemonoid'], collided_lemonoids: list['Lemonoid']) -> None:
 
-		def rotate() -> None:
+		'''
+		lasers / lemonoids: candidates whose rects overlap this lemonoid (from the broadphase)
+		collided_lemonoids: the subset of lemonoids whose masks overlap this lemonoid
+		'''
 
-			self.angle = (self.angle % 360) + self.ROTATE_SPEED * dt
-			self.image = pygame.transform.rotate(self.og_image, self.angle).convert_alpha()
-			self.rect = self.image.get_rect(center = self.pos)
+		# Laser Collisions
+		if lasers:
 
-		def wrap_around() -> None:
+			collided_lasers = [laser for laser in lasers if pygame.sprite.collide_mask(self, laser)]
 
-			if self.pos.x >= X1 + self.og_image.get_width() / 2: self.pos.x = X0 - self.og_image.get_width() / 2
-			elif self.pos.x <= X0 - self.og_image.get_width() / 2: self.pos.x = X1 + self.og_image.get_width() / 2
-			elif self.pos.y >= Y1 + self.og_image.get_width() / 2: self.pos.y = Y0 - self.og_image.get_width() / 2
-			elif self.pos.y <= Y0 - self.og_image.get_width() / 2: self.pos.y = Y1 + self.og_image.get_width() / 2
+			if collided_lasers and not self.colliding['laser']: 
+				
+				collision_pos = pygame.sprite.collide_mask(self, collided_lasers[0])
+				self.hit(relative_collision_pos = collision_pos if collision_pos else (0, 0), damage = collided_lasers[0].DAMAGES[collided_lasers[0].laser_index], object = collided_lasers[0])
+				for laser in collided_lasers: laser.hit()
+				self.colliding['laser'] = True
 
-		def check_outside_frame() -> bool:
-			return ((self.pos.x >= X1 + self.og_image.get_width() / 2) or (self.pos.x <= X0 - self.og_image.get_width() / 2) or (self.pos.y >= Y1 + self.og_image.get_width() / 2) or (self.pos.y <= Y0 - self.og_image.get_width() / 2))
+			else: self.colliding['laser'] = False
+		
+		# Other Lemonoid Collisions
+		if lemonoids:
 
-		self.rect.center = (round(self.pos.x), round(self.pos.y))
-		self.mask = pygame.mask.from_surface(self.image)
+			if collided_lemonoids and not self.colliding['lemonoid']:
 
-		move()
-		rotate()
-		if not self.outside_frame_on_spawn: wrap_around()
-		input()
+				if self.first_frame: self.colliding_first = True
+
+				if not self.colliding_first: 
+					
+					collision_pos = pygame.sprite.collide_mask(self, collided_lemonoids[0])
+					self.hit(relative_collision_pos = collision_pos if collision_pos else (0, 0), damage = 4 - (collided_lemonoids[0].size - 1), object = self)
+					collided_lemonoids[0].hit(relative_collision_pos = pygame.sprite.collide_mask(self, collided_lemonoids[0]), damage = 4 - (self.size - 1), object = self)
+				
+					self.colliding['lemonoid'] = True
+
+			else:
+				
+				if self.colliding_first: self.colliding_first = False
+				self.colliding['lemonoid'] = False
 
-		if self.outside_frame_on_spawn and not check_outside_frame(): self.outside_frame_on_spawn = False
 		if self.first_frame: self.first_frame = False
 
-	def render_debug(self) -> None:
+	def render_debug(self, surface: pygame.surface.Surface, offset: tuple[int, int] = (0, 0)) -> None:
 
 		diagonal = (WIDTH ** 2 + HEIGHT ** 2) ** 0.5 * 2
+		pos = self.pos + offset
 
 		pygame.draw.line(
-			surface = screen, 
+			surface = surface, 
 			color = 'Blue', 
-			start_pos = self.pos, 
-			end_pos = (self.pos.x + cos(radians(self.DIRECTION)) * diagonal, self.pos.y - sin(radians(self.DIRECTION)) * diagonal), 
+			start_pos = pos, 
+			end_pos = (pos.x + cos(radians(self.DIRECTION)) * diagonal, pos.y - sin(radians(self.DIRECTION)) * diagonal), 
 			width = round(2 * SCALE)
 		)
 		pygame.draw.line(
-			surface = screen, 
+			surface = surface, 
 			color = 'Dark Blue', 
-			start_pos = self.pos, 
-			end_pos = (self.pos.x - cos(radians(self.DIRECTION)) * diagonal, self.pos.y + sin(radians(self.DIRECTION)) * diagonal), 
+			start_pos = pos, 
+			end_pos = (pos.x - cos(radians(self.DIRECTION)) * diagonal, pos.y + sin(radians(self.DIRECTION)) * diagonal), 
 			width = round(2 * SCALE)
 		)
 		pygame.draw.line(
-			surface = screen, 
+			surface = surface, 
 			color = 'Red', 
-			start_pos = self.pos, 
-			end_pos = (self.pos.x + cos(radians(self.angle)) * self.og_image.get_width() * (2 / 3), self.pos.y - sin(radians(self.angle)) * self.og_image.get_width() * (2 / 3)), 
+			start_pos = pos, 
+			end_pos = (pos.x + cos(radians(self.angle)) * self.og_image.get_width() * (2 / 3), pos.y - sin(radians(self.angle)) * self.og_image.get_width() * (2 / 3)), 
 			width = round(2 * SCALE)
 		)
 
-	def render_health_bar(self) -> None:
-
-		if self.size != 4 and self.health > 0:
+	def death(self, score: bool = True) -> None:
 
-			self.health_bar.update()
-			self.health_bar.sprite.segment.update()
-			self.health_bar.draw(screen)
-			self.health_bar.sprite.segment.draw(screen)
-			self.health_bar.sprite.render_font()
+		def death_animation() -> None:
 
-	def hit(self, relative_collision_pos: tuple[int, int] | pygame.math.Vector2, damage: int, object: Union[Laser, 'Lemonoid']) -> None:
-
-		def death() -> None:
+			# Shake
+			if self.size == 1: self.game.camera.add_shake(self.EXPLOSION_SHAKE)
 
-			def death_animation() -> None:
+			# Explosion
+			self.game.explosions.add(
 
-				# Shake
-				if self.size == 1: self.game.add_shake_offsets(velocity = self.EXPLOSION_SHAKE_VEL)
+				self.game.pools['explosion'].acquire(
+					type = 0 if self.size == 1 else 1, 
+					pos = self.pos, 
+					frames = self.game.explosion_frames, 
+					game = self.game
+				)
 
-				# Explosion
-				self.game.explosions.add(
+			)
 
-					Explosion(
-						type = 0 if self.size == 1 else 1, 
-						pos = self.pos, 
-						frames = self.game.explosion_frames, 
+			# Particles
+			for i in range(int(25 / self.size)):
+				
+				self.game.particles.emit(
+					start_pos = self.pos,
+					angle = (360 / int(25 / self.size)) * i,
+					image = choice(self.particle_images),
+					move_speed = randint(100, 500) / self.size,
+					rotation_speed = randint(100, 500) * self.size,
+					fade_speed = 100 * self.size
+				)	
+
+		if self.size != 4:
+
+			# New Lemonoids
+			for i in range(3):
+
+				self.game.lemonoids.add(
+
+					self.game.pools['lemonoid'].acquire(
+						pos = self.pos,
+						angle = self.DIRECTION + ((75 - randint(0, 30)) * (i - 1)), 
+						move_speed = self.MOVE_SPEED * 1.5,
+						size = self.size + 1, 
 						game = self.game
 					)
 
 				)
 
-				# Particles
-				for i in range(int(25 / self.size)):
-					
-					self.game.particles.add(
-
-						Particle(
-							start_pos = self.pos,
-							angle = (360 / int(25 / self.size)) * i,
-							image = choice(self.particle_images), 
-							move_speed = randint(100, 500) / self.size,
-							rotation_speed = randint(100, 500) * self.size,
-							fade_speed = 100 * self.size,
-							game = self.game
-						)
-
-					)	
+		# Score, Animation, SFX
+		if self.size == 1: self.game.play_sfx(self.explosion_sfx, priority = 2)
+		else: self.game.play_sfx(self.explosion_sfx_2, priority = 1)
 
-			if self.size != 4:
+		if score: self.game.add_score(self.SCORES[self.size])
+		death_animation()
+		self.kill()
+		self.dead = True
 
-				# New Lemonoids
-				for i in range(3):
-
-					self.game.lemonoids.add(
-
-						Lemonoid(
-							pos = self.pos,
-							angle = self.DIRECTION + ((75 - randint(0, 30)) * (i - 1)), 
-							move_speed = self.MOVE_SPEED * 1.5,
-							size = self.size + 1, 
-							game = self.game
-						)
-
-					)
-
-				# Delete Heath Bar
-				self.health_bar.sprite.segment.empty()
-				self.health_bar.empty()
-
-			# Score, Animation, SFX
-			if self.size == 1: self.game.play_sfx(self.explosion_sfx)
-			else: self.game.play_sfx(self.explosion_sfx_2)
-
-			if isinstance(object, Laser): self.game.add_score(self.SCORES[self.size])
-			death_animation()
-			self.kill()
-			self.dead = True
+	def hit(self, relative_collision_pos: tuple[int, int] | pygame.math.Vector2, damage: int, object: Union[Laser, 'Lemonoid']) -> None:
 
 		self.health -= damage
 
@@ -971,10 +1288,9 @@ class Lemonoid(pygame.sprite.Sprite):
 		self.game.play_sfx(self.hit_sfx)
 		if isinstance(object, Laser): self.game.add_score(5)
 		
-		# Flash Effect
-		array = pygame.PixelArray(self.image)
-		array.replace((255, 228, 0), (255, 255, 255))
-		array.close()
+		# Flash Effect (pre-recoloured frames, until HIT_FLASH_TIME has passed)
+		self.flash_time = self.game.ticks
+		self.image, self.mask, self.offset = self.flash_atlas.get(self.angle)
 
 		# Position of Collision
 		screen_collision_pos = (self.rect.topleft[0] + relative_collision_pos[0], self.rect.topleft[1] + relative_collision_pos[1])
@@ -986,23 +1302,193 @@ class Lemonoid(pygame.sprite.Sprite):
 		# Particles
 		for i in range(randint(2, 16)): 
 		
-			self.game.particles.add(
-
-				Particle( 
-					start_pos = screen_collision_pos,
-					angle = randint(angle - 15, angle + 15),
-					image = self.particle_images[i % len(self.particle_images)], 
-					move_speed = randint(100, 200),
-					rotation_speed = randint(100, 1000),
-					fade_speed = 400,
-					game = self.game
-				)
-
+			self.game.particles.emit(
+				start_pos = screen_collision_pos,
+				angle = randint(angle - 15, angle + 15),
+				image = self.particle_images[i % len(self.particle_images)],
+				move_speed = randint(100, 200),
+				rotation_speed = randint(100, 1000),
+				fade_speed = 400
 			)
 
-		if self.health <= 0 and not self.dead: death()
+		if self.health <= 0 and not self.dead: self.death(score = isinstance(object, Laser))
+
+class Lemonoid_Group(pygame.sprite.Group):
+
+	'''
+	Lemonoids, with their kinematics held structure-of-arrays style.
+
+	Position, velocity, angle, spin and wrap extent of every lemonoid in the group are rows in
+	NumPy arrays (slot = the lemonoid's row), so movement, spin and wrapping around the frame are
+	advanced for all of them in one vectorised step; the sprites only pick their atlas frame and
+	rect from the results, for drawing and collisions.
+	'''
+
+	def __init__(self, game: Game, capacity: int = 64) -> None:
+
+		super().__init__()
+
+		self.game = game
+		self.grid = Spatial_Hash(cell_size = COLLISION_CELL_SIZE)
+
+		self.slots: list[Lemonoid] = [] # slot: lemonoid
+		self.allocate(capacity)
+
+	def allocate(self, capacity: int) -> None:
+
+		def grow(array: numpy.ndarray | None, shape: tuple, dtype: type) -> numpy.ndarray:
+
+			new_array = numpy.zeros(shape, dtype = dtype)
+			if array is not None: new_array[:len(self.slots)] = array[:len(self.slots)]
+			return new_array
+
+		self.capacity = capacity
+		self.pos = grow(getattr(self, 'pos', None), (capacity, 2), numpy.float64)
+		self.previous_pos = grow(getattr(self, 'previous_pos', None), (capacity, 2), numpy.float64)
+		self.vel = grow(getattr(self, 'vel', None), (capacity, 2), numpy.float64)
+		self.angle = grow(getattr(self, 'angle', None), (capacity,), numpy.float64)
+		self.rotate_speed = grow(getattr(self, 'rotate_speed', None), (capacity,), numpy.float64)
+		self.extent = grow(getattr(self, 'extent', None), (capacity,), numpy.float64) # half width (how far offscreen before wrapping)
+		self.entering = grow(getattr(self, 'entering', None), (capacity,), numpy.bool_) # still coming in from offscreen (no wrapping yet)
+
+	def add_internal(self, sprite: 'Lemonoid', layer: None = None) -> None:
+
+		super().add_internal(sprite, layer)
+
+		if len(self.slots) == self.capacity: self.allocate(self.capacity * 2)
+		i = len(self.slots)
+
+		self.pos[i] = self.previous_pos[i] = tuple(sprite.spawn_pos)
+		self.vel[i] = sprite.VELOCITY
+		self.angle[i] = sprite.spawn_angle
+		self.rotate_speed[i] = sprite.ROTATE_SPEED
+		self.extent[i] = sprite.og_image.get_width() / 2
+		self.entering[i] = sprite.spawn_entering
+
+		sprite.kinematics, sprite.slot = self, i
+		self.slots.append(sprite)
+
+	def remove_internal(self, sprite: 'Lemonoid') -> None:
+
+		super().remove_internal(sprite)
+
+		# Hand the sprite back its state, then move the last row into its slot
+		i = sprite.slot
+		sprite.spawn_pos, sprite.spawn_angle, sprite.spawn_entering = sprite.pos, sprite.angle, sprite.outside_frame_on_spawn
+		sprite.kinematics = None
+
+		last = self.slots.pop()
+
+		if last is not sprite:
+
+			for array in [self.pos, self.previous_pos, self.vel, self.angle, self.rotate_speed, self.extent, self.entering]: array[i] = array[len(self.slots)]
+			self.slots[i] = last
+			last.slot = i
+
+	def update(self, dt: float) -> None:
+
+		self.move(dt)
+		self.collide()
+
+	def move(self, dt: float) -> None:
+
+		n = len(self.slots)
+		if n == 0: return
+
+		pos, x, y, extent = self.pos[:n], self.pos[:n, 0], self.pos[:n, 1], self.extent[:n]
+
+		# Move + Spin
+		self.previous_pos[:n] = pos
+		pos += self.vel[:n] * dt
+		self.angle[:n] = (self.angle[:n] % 360) + self.rotate_speed[:n] * dt
+
+		# Frames + Rects (before wrapping, so a wrapping lemonoid is drawn at its edge for one more step)
+		indexes = (numpy.rint(self.angle[:n] / LEMONOID_ROTATION_STEP).astype(numpy.int64) % round(360 / LEMONOID_ROTATION_STEP)).tolist()
+		centers = numpy.rint(pos).astype(numpy.int64).tolist()
+
+		for lemonoid, index, (center_x, center_y) in zip(self.slots, indexes, centers):
+
+			lemonoid.image, lemonoid.mask, lemonoid.offset = lemonoid.get_atlas().get_frame(index)
+			lemonoid.rect = lemonoid.image.get_rect(topleft = (center_x + lemonoid.offset[0], center_y + lemonoid.offset[1]))
+
+		# Wrap Around (one edge per step, x first)
+		wrapping = ~self.entering[:n]
+
+		right = wrapping & (x >= X1 + extent)
+		left = wrapping & ~right & (x <= X0 - extent)
+		bottom = wrapping & ~(right | left) & (y >= Y1 + extent)
+		top = wrapping & ~(right | left | bottom) & (y <= Y0 - extent)
+
+		x[right] = X0 - extent[right]
+		x[left] = X1 + extent[left]
+		y[bottom] = Y0 - extent[bottom]
+		y[top] = Y1 + extent[top]
+
+		# Lemonoids spawned offscreen start wrapping once they're fully in frame
+		self.entering[:n] &= (x >= X1 + extent) | (x <= X0 - extent) | (y >= Y1 + extent) | (y <= Y0 - extent)
+
+	def interpolate(self, alpha: float) -> dict['Lemonoid', pygame.rect.Rect]:
+
+		n = len(self.slots)
+		if n == 0: return {}
+
+		# Same as Game.interpolate, for every lemonoid at once
+		previous_pos, pos = self.previous_pos[:n], self.pos[:n]
+		jumped = ((pos - previous_pos) ** 2).sum(axis = 1) > (WIDTH / 4) ** 2
+		centers = numpy.rint(previous_pos + (pos - previous_pos) * alpha).astype(numpy.int64).tolist()
 
-class Explosion(pygame.sprite.Sprite):
+		draw_rects = {}
+
+		for lemonoid, skip, center in zip(self.slots, jumped.tolist(), centers):
+
+			if skip: continue
+			draw_rects[lemonoid] = lemonoid.rect.copy()
+			draw_rects[lemonoid].center = center
+
+		return draw_rects
+
+	def collide(self) -> None:
+
+		# Broadphase: bucket lemonoids into the grid, then only test lasers / lemonoids sharing a cell
+		lemonoids = self.sprites()
+		order = {lemonoid: i for i, lemonoid in enumerate(lemonoids)}
+		self.grid.build(lemonoids)
+
+		lasers: dict[Lemonoid, list[Laser]] = {lemonoid: [] for lemonoid in lemonoids}
+		for laser in self.game.player.sprite.lasers_fired:
+			for lemonoid in self.grid.query(laser.rect): lasers[lemonoid].append(laser)
+
+		# Each lemonoid pair is rect + mask tested once and shared by both sides
+		touching: dict[Lemonoid, list[Lemonoid]] = {lemonoid: [] for lemonoid in lemonoids}
+		collided: dict[Lemonoid, list[Lemonoid]] = {lemonoid: [] for lemonoid in lemonoids}
+
+		for a, b in self.grid.get_pairs():
+
+			touching[a].append(b)
+			touching[b].append(a)
+
+			if pygame.sprite.collide_mask(a, b):
+
+				collided[a].append(b)
+				collided[b].append(a)
+
+		# The candidates were gathered up front, so drop any that an earlier collision this frame used up
+		# (lemonoids killed by a hit, lasers that already hit), as spritecollide against the live groups would have
+		def live(lemonoid: Lemonoid) -> bool:
+			return not lemonoid.dead and lemonoid.alive()
+
+		for lemonoid in lemonoids:
+
+			if not live(lemonoid): continue
+
+			collided[lemonoid].sort(key = order.__getitem__) # keep group order, as spritecollide did
+			lemonoid.collide(
+				lasers = [laser for laser in lasers[lemonoid] if laser.collided == 0 and laser.alive()],
+				lemonoids = [other for other in touching[lemonoid] if live(other)],
+				collided_lemonoids = [other for other in collided[lemonoid] if live(other)]
+			)
+
+class Explosion(Pooled_Sprite):
 
 	def __init__(
 			
@@ -1016,10 +1502,24 @@ class Explosion(pygame.sprite.Sprite):
 
 		super().__init__()
 
-		self.TYPE = type
 		self.game = game
 		self.ROTATE_SPEED = 40
 		self.FADE_SPEED = 550
+		self.og_image = self.game.load_img('Images/Explosion/Flash.png', 0.25).copy() # copied as fade() sets its alpha
+
+		self.reset(type, pos, frames)
+
+	def reset(
+			
+			self, 
+			type: int,
+			pos: tuple | pygame.math.Vector2, 
+			frames: list = [],
+			game: Game | None = None
+			
+		) -> None:
+
+		self.TYPE = type
 		self.finished = False
 		self.alpha = 256.0
 		
@@ -1028,9 +1528,7 @@ class Explosion(pygame.sprite.Sprite):
 			self.frames = frames
 			self.frame_index = 0.0
 
-		if type == 1:
-
-			self.og_image = pygame.transform.scale_by(self.game.load_img('Images/Explosion/Flash.png'), 0.25).convert_alpha()
+		if type == 1: self.og_image.set_alpha(255)
 
 		self.image = self.og_image if type == 1 else self.frames[int(self.frame_index)] 
 		self.rect = self.image.get_rect(center = pos)
@@ -1040,20 +1538,19 @@ class Explosion(pygame.sprite.Sprite):
 
 		def fade() -> None:
 
-			self.alpha -= self.FADE_SPEED * dt
+			self.alpha -= self.FADE_SPEED * self.game.quality['explosion_fade'] * dt
 			self.image.set_alpha(int(self.alpha))
 			if self.alpha <= 0: self.kill()
 		
 		def rotate() -> None:
 
 			self.frame_index = (self.frame_index + self.ROTATE_SPEED * dt) % len(self.frames)
-			self.image = self.frames[int(self.frame_index)]
-			self.rect = self.image.get_rect(center = self.pos + pygame.math.Vector2(self.game.shake_offset))
+			stride = self.game.quality['explosion_frames']
+			self.image = self.frames[int(self.frame_index) // stride * stride]
+			self.rect = self.image.get_rect(center = self.pos)
 
 		if self.TYPE == 0: rotate()
 		fade()
-		self.pos.x += self.game.shake_offset[0]
-		self.pos.y -= self.game.shake_offset[1]
 
 class Health_Bar(pygame.sprite.Sprite):
 
@@ -1063,7 +1560,7 @@ class Health_Bar(pygame.sprite.Sprite):
 			game: Game, 
 			offset: tuple, 
 			size: int | float, 
-			parent: Union[Player, Lemonoid, 'Health_Bar']
+			parent: Union[Player, Lemonoid]
 		
 		) -> None:
 
@@ -1073,156 +1570,21 @@ class Health_Bar(pygame.sprite.Sprite):
 		self.SIZE = size
 		self.OFFSET = offset
 		self.parent = parent
-		self.pos: pygame.math.Vector2 = pygame.math.Vector2(0, 0)
-		self.colour = (255, 0, 0)
-
-		if isinstance(self.parent, (Player, Lemonoid)):
-
-			self.COLOURS = {'white': WHITE, 'black': BLACK}
-			self.MAX_HEALTH = self.parent.MAX_HEALTH
-			self.health = self.parent.health
-			self.health_percent = self.health / self.MAX_HEALTH
-
-			self.image = pygame.transform.scale_by(self.game.load_img('Images/Health Bar/Base.png'), self.SIZE).convert_alpha()
-			self.rect = self.image.get_rect(center = (self.parent.pos.x + self.OFFSET[0], self.parent.pos.y + self.OFFSET[1]))
-			self.pos = pygame.math.Vector2(self.rect.center)
-			self.segment: pygame.sprite.GroupSingle = pygame.sprite.GroupSingle(Health_Bar(game = self.game, size = self.SIZE, offset = self.OFFSET, parent = self))
-
-			# Text
-			self.font = pygame.font.Font('Fonts/pixel_font.ttf', int(15 * SCALE))
-			self.font.set_bold(True)
-
-			self.text = pygame.surface.Surface((0, 0))
-			self.text_rect = self.text.get_rect()
-
-			self.text_shadow = pygame.surface.Surface((0, 0))
-			self.text_shadow_rect = self.text_shadow.get_rect()
-
-		if isinstance(self.parent, Health_Bar):
-
-			self.full_image = pygame.transform.scale_by(self.game.load_img('Images/Health Bar/Full.png'), self.SIZE).convert_alpha()
-			self.empty_image = pygame.transform.scale_by(self.game.load_img('Images/Health Bar/Empty.png'), self.SIZE).convert_alpha()
-			self.images = [self.full_image, self.empty_image]
-			self.image_index = 0
-
-			self.image = self.images[self.image_index]
-			self.rect = self.image.get_rect(center = ((self.parent.rect.topleft[0] + self.image.get_width() + 2) - self.image.get_width() * (((1 - self.parent.health_percent) * 2) % 1), self.parent.rect.topleft[1]))
-			self.pos = pygame.math.Vector2(self.rect.topleft)
+		self.MAX_HEALTH = self.parent.MAX_HEALTH
 
-	def update(self) -> None: 
-		
-		def change_colour() -> None:
-		
-			health_percent = self.health_percent if isinstance(self.parent, (Player, Lemonoid)) else self.parent.health_percent
-
-			if health_percent > 0.5: new_colour = (round((255 * (1 - health_percent)) * 2), 255, 0)
-			if health_percent <= 0.5: new_colour = (255, round((255 * health_percent) * 2), 0)
-
-			array = pygame.PixelArray(self.image)
-			array.replace(self.colour, new_colour)
-			array.close()
+		self.health: int | None = None
+		self.update()
 
-			self.colour = new_colour
+	def update(self, parent_rect: pygame.rect.Rect | None = None) -> None: 
 
-		if isinstance(self.parent, (Player, Lemonoid)):
+		# New image only when the health changed - otherwise it just follows its parent (drawn at parent_rect, if it's interpolated)
+		if self.parent.health != self.health:
 
 			self.health = self.parent.health
-			self.health_percent = self.health / self.MAX_HEALTH
-			
-			self.pos = pygame.math.Vector2((self.parent.pos.x + self.OFFSET[0], self.parent.pos.y - self.OFFSET[1]))
-			self.rect.center = (round(self.pos.x), round(self.pos.y))
-
-			self.text = self.font.render(str(self.health), False, self.COLOURS['white'])
-			self.text_rect = self.text.get_rect(midright = (self.pos[0] - self.image.get_width() / 2 - self.image.get_width() / 20, self.pos[1] - self.image.get_height() / 10))
-
-			self.text_shadow = self.font.render(str(self.health), False, self.COLOURS['black'])
-			self.text_shadow.set_alpha(128)
-			self.text_shadow_rect = self.text.get_rect(midright = (self.text_rect.midright[0], self.text_rect.midright[1] + self.image.get_height() / 10))
-
-			change_colour()
-
-		if isinstance(self.parent, Health_Bar):
-
-			self.pos.x = (self.parent.rect.topleft[0] + self.image.get_width() + (2 * self.SIZE)) - self.image.get_width() * (((1 - self.parent.health_percent) * 2) % 1)
-			self.pos.y = self.parent.rect.topleft[1]
-
-			change_colour()
-
-			if self.parent.health_percent < 1 / self.parent.MAX_HEALTH: self.pos.x = self.parent.rect.topleft[0] + (2 * self.SIZE) 
-			if self.parent.health_percent > 0.5: self.image_index = 0
-			if self.parent.health_percent <= 0.5: self.image_index = 1
-
-			self.image = self.images[self.image_index]
-			self.rect = self.image.get_rect(topleft = self.pos)
+			self.image, self.offset = self.game.health_bar_atlas.get(self.SIZE, self.MAX_HEALTH, self.health)
 
-	def render_font(self) -> None:
-
-		screen.blit(self.text_shadow, self.text_shadow_rect)
-		screen.blit(self.text, self.text_rect)
-
-class Particle(pygame.sprite.Sprite):
-
-	def __init__(
-			
-		self, 
-		start_pos: tuple | pygame.math.Vector2, 
-		angle: int | float, 
-		image: pygame.surface.Surface, 
-		move_speed: int | float, 
-		rotation_speed: int | float, 
-		fade_speed: int | float, 
-		game: Game
-
-	) -> None:
-
-		super().__init__()
-		
-		self.game = game
-		self.ANGLE = angle
-		self.MOVE_SPEED = move_speed
-		self.ROTATE_SPEED = rotation_speed
-		self.FADE_SPEED = fade_speed
-		
-		self.rotation_angle = 0.0
-		self.alpha = 256.0
-
-		self.og_image = image
-		self.image = self.og_image
-
-		self.rect = self.image.get_rect(center = start_pos)
-		self.pos = pygame.math.Vector2(self.rect.center)
-
-	def update(self, dt: int | float) -> None:
-
-		def input() -> None:
-
-			if self.pos.y <= Y0 - (self.image.get_height() / 2) or self.pos.y >= Y1 + (self.image.get_height() / 2): self.kill()
-			if self.pos.x <= X0 - (self.image.get_width() / 2) or self.pos.x >= X1 + (self.image.get_width() / 2): self.kill()
-
-		def move() -> None:
-
-			x = cos(radians(self.ANGLE)) * self.MOVE_SPEED * dt
-			y = sin(radians(self.ANGLE)) * self.MOVE_SPEED * dt
-			self.pos += pygame.math.Vector2((x, -y)) + pygame.math.Vector2(self.game.shake_offset)
-
-		def rotate() -> None:
-
-			self.rotation_angle = (self.rotation_angle % 360) + self.ROTATE_SPEED * dt
-			self.image = pygame.transform.rotate(self.og_image, self.rotation_angle).convert_alpha()
-			self.rect = self.image.get_rect(center = self.pos)
-
-		def fade() -> None:
-
-			self.alpha -= self.FADE_SPEED * dt
-			self.image.set_alpha(int(self.alpha))
-			if self.alpha <= 0: self.kill()
-
-		self.rect.center = (round(self.pos.x), round(self.pos.y))
-
-		move()
-		rotate()
-		fade()
-		input()
+		parent_rect = parent_rect or self.parent.rect
+		self.rect = self.image.get_rect(topleft = (parent_rect.centerx + round(self.OFFSET[0]) + self.offset[0], parent_rect.centery - round(self.OFFSET[1]) + self.offset[1]))
 
 class Life_Count_Meter(pygame.sprite.Sprite):
 
@@ -1245,7 +1607,7 @@ class Life_Count_Meter(pygame.sprite.Sprite):
 		self.ORIGIN = origin
 		self.ship = {'index': self.player.ship_index, 'max_lives': self.player.MAX_LIVES}
 
-		self.image = pygame.transform.rotate(pygame.transform.scale_by(self.game.load_img(f'Images/UI/Life Count Meter/Ship{self.ship['index']}.png'), self.SIZE), 90).convert_alpha()
+		self.image = pygame.transform.rotate(self.game.load_img(f'Images/UI/Life Count Meter/Ship{self.ship["index"]}.png', self.SIZE), 90).convert_alpha()
 		self.rect = self.image.get_rect(center = (self.ORIGIN[0] - (((self.image.get_width() + self.OFFSET) * (self.ship['max_lives'] - 1)) / 2), self.ORIGIN[1]))
 		self.pos = pygame.math.Vector2(self.rect.center)
 
@@ -1256,18 +1618,116 @@ class Life_Count_Meter(pygame.sprite.Sprite):
 		if player_lives - 1 < self.INDEX: self.kill()
 		self.pos[0] = (self.ORIGIN[0] - (((self.image.get_width() + self.OFFSET) * (player_lives - 1)) / 2)) + (self.OFFSET + self.image.get_width()) * self.INDEX
 
-def main() -> None:
+def get_manifest(scale: int | float = SCALE, sfx_vol: int | float = SFX_VOL, music_vol: int | float = MUSIC_VOL) -> dict[str, list]:
+
+	# Every asset the game loads, keyed as the sprites load them (assets.warm_up() / Loader.add_assets() arguments)
+	return {
+
+		'images': [
+			*[(f'Images/Player/Ship0/{name}.png', scale * 2.5) for name in ['Normal', 'Shoot', 'Thruster', 'Blink']],
+			*[(f'Images/Player/Ship0/Break/Break{i}.png', scale * 2.5) for i in range(3)],
+			*[(f'Images/Player/Ship0/Break/Particle{i}.png', scale * 2.5) for i in range(2)],
+			*[(f'Images/Lemonoid/Normal/{size}.png', scale * 2.5) for size in range(1, 5)],
+			*[(f'Images/Lemonoid/Break/Particle{i}.png', scale) for i in range(2)],
+			('Images/Laser/Laser0.png', scale * 2.5),
+			('Images/Explosion/Flash.png', scale * 2.5 / 8),
+			('Images/Explosion/Flash.png', scale * 0.25),
+			*[(f'Images/Health Bar/{name}.png', scale * size) for name in ['Base', 'Full', 'Empty'] for size in [0.75, 1, 0.5]],
+			('Images/UI/Life Count Meter/Ship0.png', scale * 4),
+			*[(f'Images/UI/Cursor/{name}/{state}.png', 3) for name in ['Cursor', 'Crosshair'] for state in ['Unfocus', 'Focus']],
+			('Images/UI/Cursor/Cursor/Focus.png', scale * 3)
+		],
+		'sounds': [
+			*[(f'Audio/SFX/Player/{name}', sfx_vol) for name in ['Shoot.wav', 'Death.wav', 'Hit.mp3']],
+			*[(f'Audio/SFX/Lemonoid/{name}.wav', sfx_vol * 0.3) for name in ['Hit', 'Explosion', 'Explosion2']],
+			('Audio/Music/game_music.wav', music_vol)
+		],
+		'fonts': [
+			*[('Fonts/pixel_font.ttf', int(size * scale), False) for size in [75, 50, 25, 12]],
+			('Fonts/pixel_font.ttf', int(15 * scale), True)
+		]
+
+	}
+
+def load(screen: pygame.surface.Surface) -> float:
+
+	'''
+	Loads every asset (and builds the explosion frame cache if needed) on worker threads, keeping
+	the window responsive and drawing the progress under the cover. Returns the seconds taken.
+	'''
 
-	game = Game(
+	start_time = perf_counter()
+	clock = pygame.time.Clock()
+
+	loader = Loader()
+	loader.add_assets(**get_manifest())
+
+	explosion_cache = create_explosion_cache(EXPLOSION_FRAME_COUNT)
+	loader.add(partial(assets.decode_frames, explosion_cache), partial(assets.add_frames, explosion_cache), weight = EXPLOSION_FRAME_COUNT)
+
+	bar = pygame.Rect(0, 0, WIDTH / 2, round(6 * SCALE))
+	bar.center = (CENTER_X, Y1 - 40 * SCALE)
+
+	while not loader.is_done():
+
+		for event in pygame.event.get():
+
+			if event.type == pygame.QUIT:
+
+				loader.shutdown()
+				pygame.quit()
+				exit()
+
+		loader.poll()
+
+		pygame.draw.rect(screen, DARK_GREY, bar)
+		pygame.draw.rect(screen, WHITE, (bar.left, bar.top, bar.width * loader.get_progress(), bar.height))
+		pygame.display.set_caption(f'Lemonoids | INITIALISING... {round(loader.get_progress() * 100, 1)}%')
+		pygame.display.update(bar)
+
+		clock.tick(60)
+
+	loader.shutdown()
+	return perf_counter() - start_time
+
+def create_explosion_cache(frame_count: int, path: str | None = None) -> Frame_Cache:
+
+	# Pixels further than a screen from the explosion's centre can't be seen, so each frame only keeps (a bit more than) 2 screens' worth
+	return Frame_Cache(
+		path = path or os.path.join(get_cache_dir(), EXPLOSION_CACHE),
+		source = 'Images/Explosion/God-Rays.png',
+		frame_count = frame_count,
+		pixel_format = get_pixel_format(), # here, on the main thread (the cache may be checked / built on a loader thread)
+		scale = 0.5,
+		crop = (round(WIDTH * 2 + EXPLOSION_CROP_MARGIN), round(HEIGHT * 2 + EXPLOSION_CROP_MARGIN))
+	)
+
+def create_game(
+
+		headless: bool = False,
+		debug: bool = DEBUG,
+		invulnerable: bool = False,
+		sfx_vol: int | float = SFX_VOL,
+		music_vol: int | float = MUSIC_VOL,
+		explosion_frame_count: int = EXPLOSION_FRAME_COUNT,
+		lemonoid_speed: int | float = LEMONOID_SPEED,
+		lemonoid_frequency: int = LEMONOID_FREQUENCY,
+		lemonoid_frequencies: list[tuple[int, int]] = LEMONOID_FREQUENCIES
+
+	) -> Game:
+
+	return Game(
 		screen = {
 			'scale': SCALE,
 		},
 		game = {
-			'debug': DEBUG,
+			'debug': debug,
+			'headless': headless,
+			'invulnerable': invulnerable
 		},
 		audio = {
-			'sfx_vol': SFX_VOL,
-			'music_vol': MUSIC_VOL
+			'sfx_vol': sfx_vol,
+			'music_vol': music_vol
 		},
 		colours = {
 			'black': BLACK, 
@@ -1279,125 +1739,108 @@ def main() -> None:
 			'green': GREEN
 		},
 		fonts = {
-			'h1': h1_font,
-			'h2': h2_font,
-			'h3': h3_font
+			'h1': assets.load_font('Fonts/pixel_font.ttf', int(75 * SCALE)),
+			'h2': assets.load_font('Fonts/pixel_font.ttf', int(50 * SCALE)),
+			'h3': assets.load_font('Fonts/pixel_font.ttf', int(25 * SCALE))
 		},
 		explosions = {
-			'frame_count': EXPLOSION_FRAME_COUNT
+			'frame_count': explosion_frame_count
+		},
+		lemonoids = {
+			'speed': lemonoid_speed,
+			'frequency': lemonoid_frequency,
+			'frequencies': lemonoid_frequencies
 		}
 	)
-	text = game.text
-	player = game.player
-	lasers_fired = player.sprite.lasers_fired
-	lemonoids = game.lemonoids
-	explosions = game.explosions
-	cursor = game.cursor
-	particles = game.particles
-	life_count_meter = game.life_count_meter
+
+def main() -> None:
+
+	start_time = perf_counter()
+
+	screen = setup()
+	print(f'Assets Loaded In Background {round(load(screen), 2)}s')
+
+	STEP = 1 / TICK_RATE
+	accumulator = 0.0
+
+	# Replay recording (seeded before the game is created, so a replay starts from the same state)
+	recorder = None
+
+	if RECORD_REPLAY:
+
+		seed = random.randrange(2 ** 32)
+		random.seed(seed)
+
+	game = create_game()
+	gc.freeze() # everything loaded so far lives for the whole session - keep it out of future collections (only here: a frozen Game is never freed)
+	if RECORD_REPLAY: recorder = Recorder(path = RECORD_REPLAY, seed = seed, dt = STEP, debug = game.DEBUG)
+	first_frame = True
 
 	pygame.display.set_caption('Lemonoids')
 
-	previous_time = time()
+	previous_time = perf_counter()
 	while True:
 
-		dt = time() - previous_time
-		previous_time = time()
+		# Real time since the last frame, capped so a long stall can't snowball into ever more catch-up steps
+		frame_time = min(perf_counter() - previous_time, MAX_FRAME_TIME)
+		previous_time = perf_counter()
+		accumulator += frame_time
 
 		# pygame event loop
+		events = []
+
 		for event in pygame.event.get():
 
 			if event.type == pygame.QUIT:
 
 				game.save()
+				if recorder: recorder.close()
+				if game.DEBUG: print(f'Audio {game.audio.get_stats()} | Cursor Changes {game.cursor.pushes}')
 				pygame.quit()
 				exit()
 
-			if game.get_state() == game.STATES['play']:
+			game.handle_event(event)
+			if event.type == pygame.KEYDOWN: events.append(event)
 
-				if event.type == game.LEMONOID_TIMER:
+		game.input.update()
 
-					angle = randint(0, 360)
-					new_lemonoid = Lemonoid(angle = angle, move_speed = 75, size = 1, game = game)
-					lemonoids.add(new_lemonoid)
+		# Fixed timestep simulation
+		steps = 0
+		while accumulator >= STEP and steps < MAX_STEPS_PER_FRAME:
 
-				if event.type == player.sprite.BLINK_TIMER:
-					player.sprite.blink()
-
-			if game.get_state() == game.STATES['game_over']:
-
-				if event.type == pygame.KEYDOWN and event.key == pygame.K_SPACE:
-
-					game.set_game()
-					game.set_state(game.STATES['play'])
+			game.simulate(STEP)
+			accumulator -= STEP
+			steps += 1
 
+		if steps == MAX_STEPS_PER_FRAME: accumulator = min(accumulator, STEP) # drop the backlog instead of spiralling
+		if recorder: recorder.record_frame(game = game, steps = steps, input = game.input, events = events)
 
 		# rendering game
 		# ------------------
-		screen.fill(BG_COLOUR)
-
-		if game.get_state() == game.STATES['play']:
-
-			# Debug
-			if game.DEBUG: 
-
-				pygame.draw.line(screen, DARK_GREY, (X0, CENTER_Y), (X1, CENTER_Y), 1)
-				pygame.draw.line(screen, DARK_GREY, (CENTER_X, Y0), (CENTER_X, Y1), 1)
-			
-				pygame.draw.line(screen, DARK_GREY, (CENTER_X - 10, CENTER_Y), (CENTER_X + 10, CENTER_Y), round(3 * SCALE))
-				pygame.draw.line(screen, DARK_GREY, (CENTER_X, CENTER_Y - 10), (CENTER_X, CENTER_Y + 10), round(3 * SCALE))
-
-				pygame.draw.polygon(screen, DARK_GREY, [(X0, Y0), (X0 + WIDTH, Y0), (X0 + WIDTH, Y0 + HEIGHT), (X0, Y0 + HEIGHT)], 1)
-
-			# Game
-			game.update()
-			if game.shake_offsets: game.shake(game.shake_offsets.pop(0))
-
-			# Particles
-			particles.update(dt)
-			particles.draw(screen)
+		game.render(screen, alpha = accumulator / STEP)
 
-			# Explosions
-			explosions.update(dt)
-			explosions.draw(screen)
-
-			# Lasers
-			lasers_fired.draw(screen)
-			lasers_fired.update(dt)
-
-			# Player
-			player.update(dt)
+		# Cursor
+		game.profiler.start('cursor')
+		game.cursor.update(frame_time)
+		if game.cursor.MODE == 'software': game.renderer.mark(game.cursor.draw(screen))
+		game.profiler.stop(1)
 
-			if not player.sprite.dead:
+		game.profiler.start('display')
+		game.renderer.present()
+		game.profiler.stop(game.renderer.update_count)
+		game.profiler.end_frame()
 
-				player.draw(screen)
+		if first_frame:
 
-			elif player.sprite.dead:
+			print(f'Time To First Interactive Frame {round(perf_counter() - start_time, 2)}s')
+			first_frame = False
 
-				if pygame.time.get_ticks() - player.sprite.death_time >= 1500:
-						
-					if player.sprite.lives <= 0: game.game_over()
-					else: player.sprite.respawn()
-			
-			# Lemonoids
-			lemonoids.update(dt)
-			lemonoids.draw(screen)
-			if game.DEBUG: [lemonoid.render_debug() for lemonoid in lemonoids]
-			for lemonoid in lemonoids: lemonoid.render_health_bar()
+		else: game.update_quality((perf_counter() - previous_time) * 1000) # (the first frame's one-off setup isn't representative)
 
-			# Life Count Meter
-			life_count_meter.update(player_lives = player.sprite.lives)
-			life_count_meter.draw(screen)
-
-		# Text
-		text.update()
-		for line in text.texts: screen.blit(line[0], line[1])
-
-		# Cursor
-		cursor.update(dt)
-
-		pygame.display.update()
-		clock.tick(FPS)
+		game.clock.tick(FPS)
 		# ------------------
 
-if __name__ == '__main__': main()
\ No newline at end of file
+if __name__ == '__main__':
+
+	multiprocessing.freeze_support() # frozen (.exe) builds: lets the frame cache's worker processes run instead of each relaunching the game
+	main()
@@ -0,0 +1,185 @@
+import numpy
+import pygame
+
+from typing import TYPE_CHECKING
+
+from constants import X0, Y0, X1, Y1
+
+if TYPE_CHECKING: from main import Game
+
+class Particle_System:
+
+	'''
+	Structure-of-arrays particle engine.
+
+	Every live particle is one row in a set of NumPy arrays (position, velocity, rotation,
+	alpha, image index...), so a frame advances and culls all of them with a handful of
+	vectorised operations and hands them to the render queue as one batch. Rotated / faded images
+	are quantised to `rotation_step` degrees and `alpha_levels` alpha values and cached.
+
+	`density` (0-1) and `rotation_stride` are the quality governor's levers: only that fraction of
+	emitted particles is kept (every nth, so emitters still use the RNG the same way), and particles
+	are drawn at every `rotation_stride`th cached rotation.
+	'''
+
+	def __init__(
+
+			self,
+			game: 'Game',
+			rotation_step: int | float = 10,
+			alpha_levels: int = 16,
+			capacity: int = 256
+
+		) -> None:
+
+		self.game = game
+		self.ROTATION_STEP = rotation_step
+		self.ROTATION_COUNT = max(1, round(360 / rotation_step))
+		self.ALPHA_LEVELS = alpha_levels
+		self.density = 1.0
+		self.emit_credit = 1.0 # density accumulated since the last kept particle
+		self.rotation_stride = 1
+
+		self.images: list[pygame.surface.Surface] = []
+		self.image_indexes: dict[int, int] = {} # id(image): index into self.images
+		self.frames: dict[tuple[int, int, int], tuple[pygame.surface.Surface, float, float]] = {} # (image, rotation, alpha): (surface, x offset, y offset)
+
+		self.count = 0
+		self.high_water = 0 # most particles alive at once
+		self.allocate(capacity)
+
+	def __len__(self) -> int:
+		return self.count
+
+	def allocate(self, capacity: int) -> None:
+
+		def grow(array: numpy.ndarray | None, shape: tuple, dtype: type) -> numpy.ndarray:
+
+			new_array = numpy.zeros(shape, dtype = dtype)
+			if array is not None: new_array[:self.count] = array[:self.count]
+			return new_array
+
+		self.capacity = capacity
+		self.pos = grow(getattr(self, 'pos', None), (capacity, 2), numpy.float64)
+		self.previous_pos = grow(getattr(self, 'previous_pos', None), (capacity, 2), numpy.float64)
+		self.vel = grow(getattr(self, 'vel', None), (capacity, 2), numpy.float64)
+		self.rotation = grow(getattr(self, 'rotation', None), (capacity,), numpy.float64)
+		self.rotate_speed = grow(getattr(self, 'rotate_speed', None), (capacity,), numpy.float64)
+		self.alpha = grow(getattr(self, 'alpha', None), (capacity,), numpy.float64)
+		self.fade_speed = grow(getattr(self, 'fade_speed', None), (capacity,), numpy.float64)
+		self.half_size = grow(getattr(self, 'half_size', None), (capacity, 2), numpy.float64)
+		self.image_index = grow(getattr(self, 'image_index', None), (capacity,), numpy.int32)
+
+	def get_image_index(self, image: pygame.surface.Surface) -> int:
+
+		if id(image) not in self.image_indexes:
+
+			self.image_indexes[id(image)] = len(self.images)
+			self.images.append(image)
+
+		return self.image_indexes[id(image)]
+
+	def emit(
+
+			self,
+			start_pos: tuple | pygame.math.Vector2,
+			angle: int | float,
+			image: pygame.surface.Surface,
+			move_speed: int | float,
+			rotation_speed: int | float,
+			fade_speed: int | float
+
+		) -> None:
+
+		self.emit_credit += self.density
+		if self.emit_credit < 1: return
+		self.emit_credit -= 1
+
+		if self.count == self.capacity: self.allocate(self.capacity * 2)
+
+		i = self.count
+		angle = numpy.radians(angle)
+
+		self.pos[i] = (start_pos[0], start_pos[1])
+		self.previous_pos[i] = self.pos[i]
+		self.vel[i] = (numpy.cos(angle) * move_speed, -numpy.sin(angle) * move_speed)
+		self.rotation[i] = 0.0
+		self.rotate_speed[i] = rotation_speed
+		self.alpha[i] = 256.0
+		self.fade_speed[i] = fade_speed
+		self.half_size[i] = (image.get_width() / 2, image.get_height() / 2)
+		self.image_index[i] = self.get_image_index(image)
+
+		self.count += 1
+		self.high_water = max(self.high_water, self.count)
+
+	def update(self, dt: int | float) -> None:
+
+		if self.count == 0: return
+		n = self.count
+
+		# Move, Rotate, Fade
+		self.previous_pos[:n] = self.pos[:n]
+		self.pos[:n] += self.vel[:n] * dt
+		self.rotation[:n] = (self.rotation[:n] % 360) + self.rotate_speed[:n] * dt
+		self.alpha[:n] -= self.fade_speed[:n] * dt
+
+		# Cull faded out + offscreen particles in one pass
+		x, y = self.pos[:n, 0], self.pos[:n, 1]
+		half_w, half_h = self.half_size[:n, 0], self.half_size[:n, 1]
+
+		alive = (self.alpha[:n] > 0) & (x > X0 - half_w) & (x < X1 + half_w) & (y > Y0 - half_h) & (y < Y1 + half_h)
+
+		if not alive.all():
+
+			keep = numpy.flatnonzero(alive)
+			self.count = len(keep)
+
+			for array in [self.pos, self.previous_pos, self.vel, self.rotation, self.rotate_speed, self.alpha, self.fade_speed, self.half_size, self.image_index]:
+				array[:self.count] = array[keep]
+
+	def get_frame(self, image_index: int, rotation_index: int, alpha_index: int) -> tuple[pygame.surface.Surface, float, float]:
+
+		key = (image_index, rotation_index, alpha_index)
+
+		if key not in self.frames:
+
+			image = pygame.transform.rotate(self.images[image_index], rotation_index * self.ROTATION_STEP).convert_alpha()
+			image.set_alpha((alpha_index + 1) * 256 // self.ALPHA_LEVELS - 1)
+			self.frames[key] = (image, -image.get_width() / 2, -image.get_height() / 2)
+
+		return self.frames[key]
+
+	def get_blits(self, alpha: float = 1.0) -> tuple[list[pygame.surface.Surface], list[tuple[int, int]], numpy.ndarray]:
+
+		'''
+		alpha: how far between the previous and latest simulated positions to draw (fixed timestep interpolation)
+		Returns every particle's image and world position (for the render queue), and their (left, top, right, bottom) bounds for dirty rect tracking.
+		'''
+
+		if self.count == 0: return ([], [], numpy.empty((0, 4)))
+		n = self.count
+
+		pos = self.pos[:n] if alpha >= 1 else self.previous_pos[:n] + (self.pos[:n] - self.previous_pos[:n]) * alpha
+
+		stride = self.rotation_stride
+		rotation_indexes = (numpy.rint(self.rotation[:n] / (self.ROTATION_STEP * stride)).astype(numpy.int32) * stride % self.ROTATION_COUNT).tolist()
+		alpha_indexes = numpy.clip((self.alpha[:n] * self.ALPHA_LEVELS / 256).astype(numpy.int32), 0, self.ALPHA_LEVELS - 1).tolist()
+
+		images = []
+		positions = []
+		sizes = []
+
+		for image_index, rotation_index, alpha_index, (x, y) in zip(self.image_index[:n].tolist(), rotation_indexes, alpha_indexes, pos.tolist()):
+
+			image, x_offset, y_offset = self.get_frame(image_index, rotation_index, alpha_index)
+			images.append(image)
+			positions.append((round(x + x_offset), round(y + y_offset)))
+			sizes.append(image.get_size())
+
+		# Bounds of the frames actually drawn (rotated frames are bigger than the source image)
+		topleft = numpy.array(positions, dtype = numpy.float64)
+		return (images, positions, numpy.hstack((topleft, topleft + numpy.array(sizes) - 1)))
+
+	def empty(self) -> None:
+		self.count = 0
@@ -0,0 +1,76 @@
+import pygame
+
+from typing import Callable
+
+class Pooled_Sprite(pygame.sprite.Sprite):
+
+	# Sprite that goes back to its pool when killed (see Pool for what subclasses must provide)
+	pool: 'Pool | None' = None
+	in_pool = False
+
+	def kill(self) -> None:
+
+		super().kill()
+		if self.pool is not None and not self.in_pool: self.pool.release(self)
+
+class Pool:
+
+	'''
+	Free list of one sprite type, so entities spawned and killed many times a second
+	(lasers, lemonoids, explosions) are re-initialised instead of rebuilt.
+
+	Released sprites are only handed out again after the next recycle() (called once per
+	frame), so nothing still holding a sprite killed this frame sees it come back as a new one.
+
+	Pooled sprites must define reset(**kwargs), taking the same arguments as their constructor:
+	acquire() builds a new sprite with factory(**kwargs) or re-initialises a free one with
+	reset(**kwargs), so all per-spawn state belongs in reset().
+	'''
+
+	def __init__(self, factory: Callable[..., Pooled_Sprite]) -> None:
+
+		self.factory = factory
+		self.free: list[Pooled_Sprite] = []
+		self.released: list[Pooled_Sprite] = [] # killed this frame
+
+		self.allocated = 0
+		self.in_use = 0
+		self.high_water = 0 # most in use at once
+
+	def acquire(self, **kwargs) -> Pooled_Sprite:
+
+		if self.free:
+
+			item = self.free.pop()
+			item.in_pool = False
+			item.reset(**kwargs)
+
+		else:
+
+			item = self.factory(**kwargs)
+			item.pool = self
+			self.allocated += 1
+
+		self.in_use += 1
+		self.high_water = max(self.high_water, self.in_use)
+
+		return item
+
+	def release(self, item: Pooled_Sprite) -> None:
+
+		item.in_pool = True
+		self.released.append(item)
+		self.in_use -= 1
+
+	def recycle(self) -> None:
+
+		self.free.extend(self.released)
+		self.released.clear()
+
+	def get_stats(self) -> dict[str, int]:
+		return {'allocated': self.allocated, 'in_use': self.in_use, 'free': len(self.free) + len(self.released), 'high_water': self.high_water}
+
+def release_group(group: pygame.sprite.AbstractGroup) -> None:
+
+	# Group.empty() for pooled sprites: kill each one so it returns to its pool
+	for sprite in group.sprites(): sprite.kill()
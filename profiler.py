@@ -0,0 +1,128 @@
+import csv
+import pygame
+
+from collections import deque
+from time import perf_counter_ns
+
+class Profiler:
+
+	'''
+	Per-stage frame timer.
+
+	Each frame, start(stage) / stop(count) pairs accumulate the time spent in (and the
+	entities processed by) a stage; end_frame() pushes the frame into a rolling history,
+	used by the on-screen overlay (along with the game's pool usage), and optionally streams it
+	to a CSV file (along with the quality governor's level that frame).
+	When disabled every call returns straight away.
+	'''
+
+	STAGES = ['particles', 'explosions', 'lasers', 'player', 'lemonoids', 'health bars', 'life meter', 'text', 'blits', 'cursor', 'display']
+	COLOURS = ['#ff2600', '#ff8c00', '#ffea00', '#33ff00', '#00c8ff', '#3050ff', '#a040ff', '#ff40c0', '#00ffa0', '#808080', '#ffffff']
+
+	def __init__(self, enabled: bool = False, csv_path: str | None = None, history: int = 240) -> None:
+
+		self.enabled = enabled or csv_path is not None
+		self.frame = 0
+		self.quality = 0 # quality governor level (0 = full quality), set by the game
+		self.pools: dict[str, dict[str, int]] = {} # pool name: Pool.get_stats(), set by the game for the overlay
+		self.times: dict[str, int] = dict.fromkeys(self.STAGES, 0) # ns
+		self.counts: dict[str, int] = dict.fromkeys(self.STAGES, 0)
+		self.last_counts: dict[str, int] = dict.fromkeys(self.STAGES, 0)
+		self.history: deque[list[int]] = deque(maxlen = history) # per-stage ns of each recent frame
+
+		self.stage = ''
+		self.stage_start = 0
+
+		self.csv_file = None
+		self.csv_writer = None
+
+		if csv_path is not None:
+
+			self.csv_file = open(csv_path, 'w', newline = '')
+			self.csv_writer = csv.writer(self.csv_file)
+			self.csv_writer.writerow(['frame', 'total_ns', 'quality'] + [f'{stage}_ns' for stage in self.STAGES] + [f'{stage}_count' for stage in self.STAGES])
+
+		# Overlay
+		self.legend: list[tuple[pygame.surface.Surface, tuple[int, int]]] = []
+
+	def start(self, stage: str) -> None:
+
+		if not self.enabled: return
+
+		self.stage = stage
+		self.stage_start = perf_counter_ns()
+
+	def stop(self, count: int = 0) -> None:
+
+		if not self.enabled: return
+
+		self.times[self.stage] += perf_counter_ns() - self.stage_start
+		self.counts[self.stage] += count
+
+	def end_frame(self) -> None:
+
+		if not self.enabled: return
+
+		times = [self.times[stage] for stage in self.STAGES]
+		self.history.append(times)
+
+		if self.csv_writer is not None:
+			self.csv_writer.writerow([self.frame, sum(times), self.quality] + times + [self.counts[stage] for stage in self.STAGES])
+
+		self.frame += 1
+		self.last_counts = self.counts
+		self.times, self.counts = dict.fromkeys(self.STAGES, 0), dict.fromkeys(self.STAGES, 0)
+
+	def get_averages(self) -> dict[str, float]:
+
+		# Mean ms per stage over the history window
+		if not self.history: return dict.fromkeys(self.STAGES, 0.0)
+		return {stage: sum(frame[i] for frame in self.history) / len(self.history) / 1e6 for i, stage in enumerate(self.STAGES)}
+
+	def draw(self, surface: pygame.surface.Surface, font: pygame.font.Font, budget_ms: float, origin: tuple[int, int]) -> pygame.rect.Rect:
+
+		'''
+		Rolling stacked-bar graph of the recent frames (one column per frame, one colour per
+		stage), with a line at the frame budget. origin = bottomleft of the graph.
+		Returns the area drawn over.
+		'''
+
+		if not self.enabled or not self.history: return pygame.Rect(origin, (0, 0))
+
+		HEIGHT = 100
+		scale = HEIGHT / (budget_ms * 2e6) # px per ns (graph tops out at 2x budget)
+		x, y = origin
+
+		pygame.draw.rect(surface, '#000000', (x, y - HEIGHT, self.history.maxlen, HEIGHT))
+
+		for column, frame in enumerate(self.history):
+
+			bottom = y
+
+			for i, ns in enumerate(frame):
+
+				height = min(ns * scale, bottom - (y - HEIGHT))
+				if height < 1: continue
+				pygame.draw.line(surface, self.COLOURS[i], (x + column, bottom), (x + column, bottom - height))
+				bottom -= height
+
+		pygame.draw.line(surface, '#ffffff', (x, y - HEIGHT / 2), (x + self.history.maxlen, y - HEIGHT / 2))
+
+		# Legend (re-rendered every 30 frames)
+		if self.frame % 30 == 0 or not self.legend:
+
+			averages = self.get_averages()
+			self.legend = [(font.render(f'{stage} {averages[stage]:.2f}ms x{self.last_counts[stage]}', False, self.COLOURS[i]), (x + self.history.maxlen + 5, y - (len(self.STAGES) - i) * font.get_linesize())) for i, stage in enumerate(self.STAGES)]
+			self.legend.append((font.render(f'quality level {self.quality}', False, '#ffffff'), (x + self.history.maxlen + 5, y - (len(self.STAGES) + 1) * font.get_linesize())))
+			self.legend += [(font.render(f'{name} pool {stats["in_use"]}/{stats["allocated"]} (peak {stats["high_water"]})', False, '#808080'), (x + self.history.maxlen + 5, y - (len(self.STAGES) + 2 + i) * font.get_linesize())) for i, (name, stats) in enumerate(self.pools.items())]
+
+		surface.blits(self.legend, doreturn = False)
+
+		return pygame.Rect(x, y - HEIGHT, self.history.maxlen, HEIGHT).unionall([image.get_rect(topleft = pos) for image, pos in self.legend])
+
+	def close(self) -> None:
+
+		if self.csv_file is not None:
+
+			self.csv_file.close()
+			self.csv_file, self.csv_writer = None, None
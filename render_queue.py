@@ -0,0 +1,89 @@
+import pygame
+
+from itertools import islice
+from typing import Callable
+
+class Render_Queue:
+
+	'''
+	A frame's blits, collected in draw order and submitted together.
+
+	World-space blits get the camera offset added once, as they're queued (nothing to do while
+	the camera is still); flush() submits each run of blits sharing a blend mode with a single
+	fblits call (blits on plain pygame). Images and positions are queued in two flat lists rather
+	than as (image, position) pairs, so holding a whole frame of blits doesn't fill the young GC
+	generation. Blit and call counts are kept for the profiler.
+	'''
+
+	def __init__(self) -> None:
+
+		self.images: list[pygame.surface.Surface] = []
+		self.positions: list[tuple[int, int] | pygame.rect.Rect] = []
+		self.runs: list[tuple[int, int]] = [] # (blend mode, end index)
+		self.offset = (0, 0)
+
+		self.blit_count = 0 # submitted this frame
+		self.call_count = 0
+
+		self.audit: Callable[[list[pygame.rect.Rect]], None] | None = None # called with each flush's blit rects (simulation.py --check-dirty)
+
+	def begin(self, offset: tuple[int, int] = (0, 0)) -> None:
+
+		self.clear()
+		self.offset = offset
+		self.blit_count, self.call_count = 0, 0
+
+	def add(self, images: list[pygame.surface.Surface], positions: list[tuple[int, int] | pygame.rect.Rect], world: bool = True, blend: int = 0) -> None:
+
+		if world and self.offset != (0, 0):
+
+			x, y = self.offset
+			positions = [(pos[0] + x, pos[1] + y) for pos in positions]
+
+		self.images.extend(images)
+		self.positions.extend(positions)
+
+		if self.runs and self.runs[-1][0] == blend: self.runs[-1] = (blend, len(self.images))
+		else: self.runs.append((blend, len(self.images)))
+
+	def add_blits(self, blits: list[tuple[pygame.surface.Surface, tuple[int, int] | pygame.rect.Rect]], world: bool = True, blend: int = 0) -> None:
+		self.add([image for image, pos in blits], [pos for image, pos in blits], world, blend)
+
+	def add_sprites(self, sprites: pygame.sprite.AbstractGroup | list[pygame.sprite.Sprite], world: bool = True, blend: int = 0, rects: dict[pygame.sprite.Sprite, pygame.rect.Rect] | None = None) -> list[pygame.rect.Rect]:
+
+		# Group.draw, queued - returns the on-screen rects for dirty tracking
+		# rects: {sprite: rect to draw it at instead of its own rect} (interpolated positions)
+		sprites = list(sprites)
+		rects = [rects.get(sprite, sprite.rect) for sprite in sprites] if rects else [sprite.rect for sprite in sprites]
+		if world: rects = [rect.move(self.offset) for rect in rects]
+
+		self.add([sprite.image for sprite in sprites], rects, world = False, blend = blend)
+		return rects
+
+	def flush(self, surface: pygame.surface.Surface) -> None:
+
+		if self.audit: self.audit([pygame.Rect(pos[0], pos[1], *image.get_size()) for image, pos in zip(self.images, self.positions)])
+		start = 0
+
+		for blend, end in self.runs:
+
+			if end == start: continue
+			blits = zip(islice(self.images, start, end), islice(self.positions, start, end))
+
+			if hasattr(surface, 'fblits'): surface.fblits(blits, blend)
+			else: surface.blits(((image, pos, None, blend) for image, pos in blits), doreturn = False)
+
+			self.blit_count += end - start
+			self.call_count += 1
+			start = end
+
+		self.clear()
+
+	def clear(self) -> None:
+
+		self.images.clear()
+		self.positions.clear()
+		self.runs.clear()
+
+	def get_stats(self) -> dict[str, int]:
+		return {'blits': self.blit_count, 'calls': self.call_count}
@@ -0,0 +1,151 @@
+import numpy
+import pygame
+
+class Renderer:
+
+	'''
+	Clears the screen before a frame is drawn and pushes it to the display afterwards.
+
+	mode 'full': the whole background is redrawn and the whole window updated every frame.
+	mode 'dirty': the screen is split into tiles; everything drawn marks the tiles it covers,
+	the next frame only restores the background under those tiles, and present() only
+	updates the tiles changed over the last two frames (merged into as few rects as possible).
+	Falls back to a full update once more than `full_threshold` of the screen is dirty.
+	'''
+
+	def __init__(self, size: tuple[int, int], mode: str = 'dirty', tile_size: int = 32, full_threshold: float = 0.4) -> None:
+
+		self.MODE = mode
+		self.SIZE = size
+		self.TILE_SIZE = tile_size
+		self.FULL_THRESHOLD = full_threshold
+
+		shape = (-(-size[1] // tile_size), -(-size[0] // tile_size)) # rows, columns (rounded up)
+		self.dirty = numpy.zeros(shape, dtype = bool) # tiles drawn over this frame
+		self.previous_dirty = numpy.zeros(shape, dtype = bool) # tiles drawn over last frame
+
+		self.background: pygame.surface.Surface | None = None
+		self.full_redraw = True # restore the whole background next begin()
+		self.full_update = True # update the whole window next present()
+
+		self.update_count = 0 # rects passed to the last display update (0 = full update)
+
+	def set_background(self, background: pygame.surface.Surface) -> None:
+
+		if background is not self.background:
+
+			self.background = background
+			self.invalidate()
+
+	def invalidate(self) -> None:
+		self.full_redraw = True
+
+	def begin(self, surface: pygame.surface.Surface) -> None:
+
+		if self.MODE == 'full' or self.full_redraw:
+
+			surface.blit(self.background, (0, 0))
+			self.full_redraw = False
+			self.full_update = True
+
+		else: surface.blits([(self.background, rect, rect) for rect in self.get_rects(self.dirty)], doreturn = False)
+
+		self.previous_dirty, self.dirty = self.dirty, self.previous_dirty
+		self.dirty[:] = False
+
+	# Marking
+	def mark(self, rect: pygame.rect.Rect) -> None:
+
+		if self.MODE == 'full': return
+
+		rect = rect.clip((0, 0), self.SIZE)
+		if not rect: return
+
+		self.dirty[rect.top // self.TILE_SIZE:(rect.bottom - 1) // self.TILE_SIZE + 1, rect.left // self.TILE_SIZE:(rect.right - 1) // self.TILE_SIZE + 1] = True
+
+	def mark_rects(self, rects: list[pygame.rect.Rect]) -> None:
+		for rect in rects: self.mark(rect)
+
+	def mark_boxes(self, boxes: numpy.ndarray) -> None:
+
+		# boxes: (n, 4) array of left, top, right, bottom (particles) - marks every tile each box covers, a column / row of tiles at a time
+		if self.MODE == 'full' or len(boxes) == 0: return
+
+		rows, columns = self.dirty.shape
+		left, top, right, bottom = (numpy.floor(boxes) // self.TILE_SIZE).astype(numpy.int64).T
+
+		left, top = numpy.maximum(left, 0), numpy.maximum(top, 0)
+		right, bottom = numpy.minimum(right, columns - 1), numpy.minimum(bottom, rows - 1)
+
+		visible = (left <= right) & (top <= bottom)
+		if not visible.any(): return
+		left, top, right, bottom = left[visible], top[visible], right[visible], bottom[visible]
+
+		for dx in range(int((right - left).max()) + 1):
+			for dy in range(int((bottom - top).max()) + 1):
+
+				x, y = left + dx, top + dy
+				covered = (x <= right) & (y <= bottom)
+				self.dirty[y[covered], x[covered]] = True
+
+	def mark_all(self) -> None:
+		self.dirty[:] = True
+
+	def get_unmarked(self, rects: list[pygame.rect.Rect]) -> list[pygame.rect.Rect]:
+
+		# Rects drawn this frame that reach a tile nothing marked - the next frame won't clear what's drawn there
+		if self.MODE == 'full': return []
+
+		unmarked = []
+
+		for rect in rects:
+
+			clipped = rect.clip((0, 0), self.SIZE)
+			if clipped and not self.dirty[clipped.top // self.TILE_SIZE:(clipped.bottom - 1) // self.TILE_SIZE + 1, clipped.left // self.TILE_SIZE:(clipped.right - 1) // self.TILE_SIZE + 1].all(): unmarked.append(rect)
+
+		return unmarked
+
+	def get_rects(self, tiles: numpy.ndarray) -> list[pygame.rect.Rect]:
+
+		# Merge each row's runs of dirty tiles into a rect, growing it downwards while the rows below have the same run
+		rects = []
+		open_runs: dict[tuple[int, int], pygame.rect.Rect] = {}
+
+		for row in range(tiles.shape[0]):
+
+			edges = numpy.flatnonzero(numpy.diff(tiles[row], prepend = False, append = False))
+			runs = {}
+
+			for start, end in zip(edges[::2].tolist(), edges[1::2].tolist()):
+
+				if (start, end) in open_runs:
+
+					rect = open_runs[(start, end)]
+					rect.height += self.TILE_SIZE
+
+				else:
+
+					rect = pygame.Rect(start * self.TILE_SIZE, row * self.TILE_SIZE, (end - start) * self.TILE_SIZE, self.TILE_SIZE)
+					rects.append(rect)
+
+				runs[(start, end)] = rect
+
+			open_runs = runs
+
+		return rects
+
+	def present(self) -> None:
+
+		tiles = self.dirty | self.previous_dirty
+
+		if self.MODE == 'full' or self.full_update or tiles.mean() > self.FULL_THRESHOLD:
+
+			pygame.display.update()
+			self.full_update = False
+			self.update_count = 0
+
+		else:
+
+			rects = self.get_rects(tiles)
+			pygame.display.update(rects)
+			self.update_count = len(rects)
@@ -0,0 +1,90 @@
+import struct
+import zlib
+import pygame
+
+from typing import TYPE_CHECKING, BinaryIO
+
+if TYPE_CHECKING: from main import Game, Input
+
+# Replay file: a header, then one record per rendered frame - the fixed steps simulated that frame,
+# the input state, a checksum of the game state after those steps and the key presses handled before them
+# (timers run on simulated time, so they replay by themselves)
+MAGIC = b'LEMREPLY'
+VERSION = 3
+
+HEADER = struct.Struct('<8sHQd?') # magic, version, RNG seed, step dt, debug (player collisions are off in debug mode)
+FRAME = struct.Struct('<BBBhhBI') # steps, keys held (bitmask of KEYS), mouse pressed, mouse x, mouse y, event count, state checksum
+EVENT = struct.Struct('<Ii') # event type, key
+
+KEYS = [pygame.K_w, pygame.K_SPACE] # the keys Input samples, bit i = KEYS[i]
+
+def get_checksum(game: 'Game') -> int:
+
+	# Cheap fingerprint of the simulation state, to find the first frame a replay diverges at
+	player = game.player.sprite
+	lemonoids = game.lemonoids
+	lasers = player.lasers_fired
+
+	state = struct.pack('<BqddddiiB?II', game.state, game.score, game.ticks, player.pos.x, player.pos.y, player.angle, player.health, player.lives, player.dead, player.collided, len(lemonoids), len(lasers))
+	state += lemonoids.pos[:len(lemonoids.slots)].tobytes() + struct.pack(f'<{len(lemonoids)}i', *[lemonoid.health for lemonoid in lemonoids.slots])
+	state += struct.pack(f'<{len(lasers) * 2}d', *[axis for laser in lasers for axis in laser.pos])
+
+	return zlib.crc32(state)
+
+class Recorder:
+
+	'''
+	Writes a replay file as the game runs: call record_frame() once per rendered frame, after the
+	frame's simulation steps, with the key presses handled before them.
+	'''
+
+	def __init__(self, path: str, seed: int, dt: float, debug: bool = False) -> None:
+
+		self.file: BinaryIO = open(path, 'wb')
+		self.file.write(HEADER.pack(MAGIC, VERSION, seed, dt, debug))
+		self.frames = 0
+
+	def record_frame(self, game: 'Game', steps: int, input: 'Input', events: list[pygame.event.Event]) -> None:
+
+		keys = sum(1 << i for i, key in enumerate(KEYS) if input.is_pressed(key))
+		x, y = round(input.mouse_pos[0]), round(input.mouse_pos[1])
+
+		self.file.write(FRAME.pack(steps, keys, input.mouse_pressed, x, y, len(events), get_checksum(game)))
+		for event in events: self.file.write(EVENT.pack(event.type, getattr(event, 'key', 0)))
+
+		self.frames += 1
+
+	def close(self) -> None:
+		self.file.close()
+
+def load_replay(path: str) -> tuple[int, float, bool, list[tuple]]:
+
+	'''
+	Returns (seed, step dt, debug, frames), each frame being
+	(steps, keys held, mouse pressed, mouse pos, checksum, events).
+	'''
+
+	with open(path, 'rb') as file: data = file.read()
+
+	magic, version, seed, dt, debug = HEADER.unpack_from(data, 0)
+	if magic != MAGIC or version != VERSION: raise ValueError(f'{path} is not a version {VERSION} Lemonoids replay')
+
+	frames = []
+	offset = HEADER.size
+
+	while offset < len(data):
+
+		steps, keys, mouse_pressed, x, y, event_count, checksum = FRAME.unpack_from(data, offset)
+		offset += FRAME.size
+
+		events = []
+
+		for i in range(event_count):
+
+			event_type, key = EVENT.unpack_from(data, offset)
+			offset += EVENT.size
+			events.append(pygame.event.Event(event_type, key = key) if key else pygame.event.Event(event_type))
+
+		frames.append((steps, {key for i, key in enumerate(KEYS) if keys & (1 << i)}, bool(mouse_pressed), (x, y), checksum, events))
+
+	return (seed, dt, debug, frames)
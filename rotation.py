@@ -0,0 +1,53 @@
+import pygame
+
+class Rotation_Atlas:
+
+	'''
+	Pre-rotated copies of one image, quantised to `step` degrees.
+
+	Each frame holds the rotated surface, its collision mask and the offset from the
+	sprite's centre to the frame's topleft, so a sprite only needs a table lookup
+	instead of a resample + mask rebuild every frame. Frames are built on first use
+	unless build() is called up front.
+	'''
+
+	def __init__(self, image: pygame.surface.Surface, step: int | float) -> None:
+
+		self.image = image
+		self.STEP = step
+		self.FRAME_COUNT = max(1, round(360 / step))
+		self.frames: list[tuple[pygame.surface.Surface, pygame.mask.Mask, tuple[int, int]] | None] = [None] * self.FRAME_COUNT
+
+	def get_index(self, angle: int | float) -> int:
+		return round(angle / self.STEP) % self.FRAME_COUNT
+
+	def get(self, angle: int | float) -> tuple[pygame.surface.Surface, pygame.mask.Mask, tuple[int, int]]:
+		return self.get_frame(self.get_index(angle))
+
+	def get_frame(self, index: int) -> tuple[pygame.surface.Surface, pygame.mask.Mask, tuple[int, int]]:
+
+		frame = self.frames[index]
+
+		if frame is None:
+
+			image = pygame.transform.rotate(self.image, index * self.STEP).convert_alpha()
+			frame = (image, pygame.mask.from_surface(image), (-(image.get_width() // 2), -(image.get_height() // 2)))
+			self.frames[index] = frame
+
+		return frame
+
+	def build(self) -> None:
+		for i in range(self.FRAME_COUNT): self.get_frame(i)
+
+	def get_memory_footprint(self) -> int:
+
+		# Bytes held by the built frames (surface pixels + 1 bit per mask pixel)
+		size = 0
+
+		for frame in self.frames:
+
+			if frame is None: continue
+			size += frame[0].get_pitch() * frame[0].get_height()
+			size += (frame[1].get_size()[0] * frame[1].get_size()[1] + 7) // 8
+
+		return size
@@ -0,0 +1,75 @@
+import heapq
+
+from typing import Callable
+
+class Scheduler:
+
+	'''
+	Simulation-time timers, a replacement for pygame.time.set_timer.
+
+	Timers fire off the game's simulated ticks (ms), so they fast-forward with headless runs,
+	don't drift when frames drop and replay exactly. Pending timers are kept in a heap ordered
+	by due time: setting one is O(log n), and a step with nothing due only looks at the top.
+	Events are plain ints (pygame event types), so the whole state can be saved and restored.
+	'''
+
+	def __init__(self) -> None:
+
+		self.queue: list[list] = [] # heap of [due ticks, order set, event, millis, loops left]
+		self.timers: dict[int, list] = {} # event: its live heap entry (replaced / cancelled entries are skipped when popped)
+		self.count = 0 # timers set so far (breaks ties between timers due at the same time)
+
+	def set(self, event: int, millis: int | float, loops: int = 0, ticks: int | float = 0) -> None:
+
+		'''
+		Same arguments as pygame.time.set_timer: fires `event` every `millis` ms from `ticks`,
+		`loops` times (0 = until cancelled). Replaces any timer already set for the event;
+		millis <= 0 cancels it.
+		'''
+
+		if millis <= 0:
+
+			self.cancel(event)
+			return
+
+		timer = [ticks + millis, self.count, event, millis, loops]
+		self.count += 1
+
+		self.timers[event] = timer
+		heapq.heappush(self.queue, timer)
+
+	def cancel(self, event: int) -> None:
+		self.timers.pop(event, None)
+
+	def update(self, ticks: int | float, handle: Callable[[int], None]) -> None:
+
+		# Fire everything due by `ticks`, in due order
+		queue = self.queue
+
+		while queue and queue[0][0] <= ticks:
+
+			timer = heapq.heappop(queue)
+			due, order, event, millis, loops = timer
+			if self.timers.get(event) is not timer: continue # replaced or cancelled
+
+			if loops == 1: self.timers.pop(event)
+
+			else:
+
+				timer[0] += millis
+				if loops > 1: timer[4] -= 1
+				heapq.heappush(queue, timer)
+
+			handle(event)
+
+	def get_state(self) -> dict:
+
+		# Plain lists + numbers (JSON / pickle safe)
+		return {'count': self.count, 'timers': sorted(self.timers.values())}
+
+	def load_state(self, state: dict) -> None:
+
+		self.count = state['count']
+		self.queue = [list(timer) for timer in state['timers']]
+		heapq.heapify(self.queue)
+		self.timers = {timer[2]: timer for timer in self.queue}
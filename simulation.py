@@ -0,0 +1,190 @@
+import argparse
+import random
+import pygame
+
+from time import perf_counter
+from typing import Callable
+
+import main
+from profiler import Profiler
+from replay import load_replay, get_checksum
+from constants import TICK_RATE, CENTER_X, CENTER_Y
+
+class Scripted_Input(main.Input):
+
+	'''
+	Input driven by a script instead of the keyboard / mouse.
+
+	script(frame) returns the input state for that frame as a dict with any of:
+	'keys' (pygame key constants held down), 'mouse_pressed', 'mouse_pos' and
+	'events' (pygame events to handle before the frame is simulated).
+	'''
+
+	def __init__(self, script: Callable[[int], dict] | None = None) -> None:
+
+		super().__init__()
+		self.script = script
+		self.frame = 0
+
+	def update(self) -> None:
+
+		state = self.script(self.frame) if self.script else {}
+
+		self.keys_pressed = set(state.get('keys', []))
+		self.mouse_pressed = state.get('mouse_pressed', False)
+		self.mouse_pos = state.get('mouse_pos', (CENTER_X, CENTER_Y))
+		self.events = state.get('events', [])
+		self.frame += 1
+
+class Simulation:
+
+	'''
+	Runs the game without a display under a fixed dt, seeded RNG and scripted input.
+	Nothing is drawn unless `render` is set, so it runs as fast as the simulation allows.
+	Frames are rendered at `alpha` (between the last two steps, like the live loop's interpolation),
+	which must never change the simulation.
+	'''
+
+	def __init__(
+
+			self,
+			seed: int = 0,
+			dt: float = 1 / TICK_RATE,
+			script: Callable[[int], dict] | None = None,
+			render: bool = False,
+			alpha: float = 1.0,
+			**game_options
+
+		) -> None:
+
+		self.screen = main.setup(headless = True)
+		random.seed(seed)
+
+		self.SEED = seed
+		self.DT = dt
+		self.RENDER = render
+		self.ALPHA = alpha
+		self.game = main.create_game(headless = True, **game_options)
+		self.game.input = Scripted_Input(script)
+		self.frame = 0
+
+	def step(self) -> None:
+
+		self.game.input.update()
+		for event in self.game.input.events: self.game.handle_event(event)
+
+		self.game.simulate(self.DT)
+		if self.RENDER: self.game.render(self.screen, self.ALPHA)
+		self.game.profiler.end_frame()
+
+		self.frame += 1
+
+	def run(self, frames: int) -> float:
+
+		# Returns the wall-clock time taken in seconds
+		start_time = perf_counter()
+		for i in range(frames): self.step()
+		return perf_counter() - start_time
+
+class Replay_Input(main.Input):
+
+	# Input set from a replay file's frame records
+	def set_frame(self, keys_pressed: set[int], mouse_pressed: bool, mouse_pos: tuple[int, int], events: list[pygame.event.Event]) -> None:
+
+		self.keys_pressed = keys_pressed
+		self.mouse_pressed = mouse_pressed
+		self.mouse_pos = mouse_pos
+		self.events = events
+
+	def update(self) -> None:
+		pass
+
+class Replay_Simulation(Simulation):
+
+	'''
+	Re-runs a recorded session (see replay.py) from its seed and input, with the same number of
+	fixed steps each frame as the original run (and debug mode as it was recorded). Each frame's state
+	checksum is compared against the recording; `divergence` is the first frame that didn't match
+	(None = bit-exact so far).
+	'''
+
+	def __init__(self, path: str, render: bool = False, alpha: float = 1.0, **game_options) -> None:
+
+		seed, dt, debug, self.frames = load_replay(path)
+		super().__init__(seed = seed, dt = dt, render = render, alpha = alpha, **{'debug': debug, **game_options})
+
+		self.game.input = Replay_Input()
+		self.divergence: int | None = None
+
+	def step(self) -> None:
+
+		steps, keys_pressed, mouse_pressed, mouse_pos, checksum, events = self.frames[self.frame]
+		self.game.input.set_frame(keys_pressed, mouse_pressed, mouse_pos, events)
+
+		for event in self.game.input.events: self.game.handle_event(event)
+		for i in range(steps): self.game.simulate(self.DT)
+
+		if self.divergence is None and get_checksum(self.game) != checksum: self.divergence = self.frame
+
+		if self.RENDER: self.game.render(self.screen, self.ALPHA)
+		self.game.profiler.end_frame()
+
+		self.frame += 1
+
+	def run(self, frames: int | None = None) -> float:
+		return super().run(len(self.frames) - self.frame if frames is None else frames)
+
+def main_cli() -> None:
+
+	parser = argparse.ArgumentParser(description = 'Run Lemonoids headless under a fixed timestep.')
+	parser.add_argument('--seconds', type = float, default = 60, help = 'simulated seconds to run')
+	parser.add_argument('--seed', type = int, default = 0)
+	parser.add_argument('--render', action = 'store_true', help = 'also render every frame (to an offscreen surface)')
+	parser.add_argument('--alpha', type = float, default = 1.0, help = 'interpolation alpha frames are rendered at (with --render) - a replay must match at any alpha')
+	parser.add_argument('--fire', action = 'store_true', help = 'hold fire while sweeping the mouse around the player')
+	parser.add_argument('--replay', help = 'replay a recorded session (see RECORD_REPLAY) instead of the scripted sweep')
+	parser.add_argument('--profile', help = 'stream per-frame stage timings to this CSV file')
+	parser.add_argument('--check-dirty', action = 'store_true', help = 'render every frame and check each blit lands on tiles the dirty renderer marked (the scripted sweep runs with debug off, as its lines redraw the whole screen)')
+	args = parser.parse_args()
+
+	unmarked: list[tuple[int, pygame.rect.Rect]] = [] # (frame, rect)
+
+	def check_dirty(simulation: Simulation) -> None:
+
+		renderer = simulation.game.renderer
+		simulation.game.render_queue.audit = lambda rects: unmarked.extend((simulation.frame, rect) for rect in renderer.get_unmarked(rects))
+
+	def report_dirty() -> None:
+
+		if not unmarked: print('Every blit was inside the dirty tiles')
+		else: print(f'{len(unmarked)} blits outside the dirty tiles over {len({frame for frame, rect in unmarked})} frames (first at frame {unmarked[0][0]}: {unmarked[0][1]})')
+
+	if args.replay:
+
+		simulation = Replay_Simulation(args.replay, render = args.render or args.check_dirty, alpha = args.alpha, sfx_vol = 0, music_vol = 0)
+		if args.profile: simulation.game.profiler = Profiler(enabled = True, csv_path = args.profile)
+		if args.check_dirty: check_dirty(simulation)
+		elapsed = simulation.run()
+		simulation.game.profiler.close()
+
+		print(f'Replayed {len(simulation.frames)} frames in {round(elapsed, 2)}s')
+		print('Replay matched the recording' if simulation.divergence is None else f'Replay diverged from the recording at frame {simulation.divergence}')
+		if args.check_dirty: report_dirty()
+		return
+
+	def sweep(frame: int) -> dict:
+
+		aim = pygame.math.Vector2(100, 0).rotate(frame)
+		return {'mouse_pressed': args.fire, 'mouse_pos': (CENTER_X + aim.x, CENTER_Y + aim.y)}
+
+	options = {'debug': False} if args.check_dirty else {}
+	simulation = Simulation(seed = args.seed, script = sweep, render = args.render or args.check_dirty, alpha = args.alpha, sfx_vol = 0, music_vol = 0, **options)
+	if args.check_dirty: check_dirty(simulation)
+	frames = round(args.seconds / simulation.DT)
+	elapsed = simulation.run(frames)
+
+	print(f'Simulated {args.seconds}s ({frames} frames) in {round(elapsed, 2)}s - {round(args.seconds / elapsed, 1)}x real time')
+	print(f'Score {simulation.game.score} | Lemonoids {len(simulation.game.lemonoids)} | Particles {len(simulation.game.particles)}')
+	if args.check_dirty: report_dirty()
+
+if __name__ == '__main__': main_cli()
@@ -0,0 +1,75 @@
+import pygame
+
+from typing import Any, Iterator
+
+class Spatial_Hash:
+
+	'''
+	Uniform grid broadphase keyed by cell coordinates.
+
+	Items are bucketed by the cells their rect covers, so overlap tests only run between
+	items that share a cell instead of between every pair. Rebuilt once per frame.
+	'''
+
+	def __init__(self, cell_size: int) -> None:
+
+		self.CELL_SIZE = cell_size
+		self.cells: dict[tuple[int, int], list[Any]] = {}
+		self.rects: dict[int, pygame.rect.Rect] = {} # id(item): rect at insert time
+
+	def get_cells(self, rect: pygame.rect.Rect) -> Iterator[tuple[int, int]]:
+
+		x0, y0 = rect.left // self.CELL_SIZE, rect.top // self.CELL_SIZE
+		x1, y1 = (rect.right - 1) // self.CELL_SIZE, (rect.bottom - 1) // self.CELL_SIZE
+
+		for x in range(x0, x1 + 1):
+			for y in range(y0, y1 + 1): yield (x, y)
+
+	def clear(self) -> None:
+
+		self.cells.clear()
+		self.rects.clear()
+
+	def insert(self, item: Any, rect: pygame.rect.Rect) -> None:
+
+		self.rects[id(item)] = rect
+		for cell in self.get_cells(rect): self.cells.setdefault(cell, []).append(item)
+
+	def build(self, items: list) -> None:
+
+		self.clear()
+		for item in items: self.insert(item, item.rect)
+
+	def query(self, rect: pygame.rect.Rect) -> list:
+
+		# Unique items whose rect overlaps `rect`, in insertion order
+		found: dict[int, Any] = {}
+
+		for cell in self.get_cells(rect):
+			for item in self.cells.get(cell, []):
+				if id(item) not in found and self.rects[id(item)].colliderect(rect): found[id(item)] = item
+
+		return list(found.values())
+
+	def get_pairs(self) -> list[tuple[Any, Any]]:
+
+		# Every pair of items with overlapping rects, each pair yielded once
+		pairs = []
+		seen: set[tuple[int, int]] = set()
+
+		for items in self.cells.values():
+
+			for i in range(len(items) - 1):
+
+				a = items[i]
+				a_rect = self.rects[id(a)]
+
+				for b in items[i + 1:]:
+
+					key = (id(a), id(b)) if id(a) < id(b) else (id(b), id(a))
+					if key in seen: continue
+					seen.add(key)
+
+					if a_rect.colliderect(self.rects[id(b)]): pairs.append((a, b))
+
+		return pairs
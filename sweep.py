@@ -0,0 +1,153 @@
+import argparse
+import contextlib
+import csv
+import io
+import itertools
+import multiprocessing
+import os
+import statistics
+
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from time import perf_counter
+
+import main
+from simulation import Simulation
+from benchmark import count_entities
+from constants import TICK_RATE, EXPLOSION_FRAME_COUNT, LEMONOID_SPEED, LEMONOID_FREQUENCY, LEMONOID_FREQUENCIES
+
+RESULTS_PATH = 'Benchmarks/sweep.csv'
+
+LADDERS: dict[str, tuple[int, list[tuple[int, int]]]] = {
+	# name: (starting ms between lemonoid spawns, [(score above, ms between spawns), ...] highest threshold first)
+	'default': (LEMONOID_FREQUENCY, LEMONOID_FREQUENCIES),
+	'gentle': (20000, [(100000, 5000), (50000, 10000), (10000, 15000)]),
+	'steep': (10000, [(50000, 1000), (20000, 3000), (5000, 6000)])
+}
+
+def bot(game: main.Game) -> dict:
+
+	# Aims at the nearest lemonoid and holds fire (never thrusts)
+	player = game.player.sprite
+	lemonoids = game.lemonoids.sprites()
+	if not lemonoids: return {'mouse_pressed': True, 'mouse_pos': tuple(player.pos)}
+
+	target = min(lemonoids, key = lambda lemonoid: player.pos.distance_squared_to(lemonoid.pos))
+	return {'mouse_pressed': True, 'mouse_pos': tuple(target.pos)}
+
+def run(seed: int, ladder: str, speed: int | float, seconds: float, render: bool = False) -> dict:
+
+	'''
+	Plays one game with the bot until game over or `seconds` of simulated time, and returns its
+	row of the results table. Frame cost is the wall-clock time of each step (simulate, + render if set).
+	'''
+
+	frequency, frequencies = LADDERS[ladder]
+
+	with contextlib.redirect_stdout(io.StringIO()): # per-game init logging
+		simulation = Simulation(seed = seed, render = render, debug = False, sfx_vol = 0, music_vol = 0, lemonoid_speed = speed, lemonoid_frequency = frequency, lemonoid_frequencies = frequencies)
+
+	game = simulation.game
+	game.input.script = lambda frame: bot(game)
+
+	frame_times = []
+	entities = []
+	lemonoids = []
+	score = 0 # (game over resets the score)
+
+	for i in range(round(seconds * TICK_RATE)):
+
+		start_time = perf_counter()
+		simulation.step()
+		frame_times.append((perf_counter() - start_time) * 1000)
+
+		if game.get_state() == game.STATES['game_over']: break
+		score = game.score
+		entities.append(count_entities(game))
+		lemonoids.append(len(game.lemonoids))
+
+	died = game.get_state() == game.STATES['game_over']
+
+	return {
+		'seed': seed,
+		'ladder': ladder,
+		'speed': speed,
+		'died': died,
+		'survival_s': round(simulation.frame * simulation.DT, 2),
+		'score': score,
+		'frames': len(frame_times),
+		'mean_ms': round(statistics.fmean(frame_times), 3),
+		'p95_ms': round(statistics.quantiles(frame_times, n = 100)[94], 3) if len(frame_times) > 1 else round(frame_times[0], 3),
+		'max_ms': round(max(frame_times), 3),
+		'mean_entities': round(statistics.fmean(entities), 1) if entities else 0,
+		'max_entities': max(entities, default = 0),
+		'max_lemonoids': max(lemonoids, default = 0)
+	}
+
+def init_worker() -> None:
+
+	# Each worker gets its own headless display (and asset registry), once
+	main.setup(headless = True)
+
+def sweep(runs: list[tuple], workers: int | None = None) -> list[dict]:
+
+	'''
+	Runs every (seed, ladder, speed, seconds, render) in a process pool and returns the rows in run order.
+	Runs share nothing, so they scale with the worker count - up to the number of cores.
+	'''
+
+	# Build the explosion frame cache up front, so the workers don't all try to write it at once
+	main.setup(headless = True)
+	explosion_cache = main.create_explosion_cache(EXPLOSION_FRAME_COUNT)
+	if not explosion_cache.is_valid(): explosion_cache.generate()
+
+	rows: list[dict | None] = [None] * len(runs)
+
+	# Spawned (not forked) workers, so they don't inherit the parent's SDL state
+	with ProcessPoolExecutor(max_workers = workers, mp_context = multiprocessing.get_context('spawn'), initializer = init_worker) as executor:
+
+		futures = {executor.submit(run, *args): i for i, args in enumerate(runs)}
+
+		for done, future in enumerate(as_completed(futures)):
+
+			rows[futures[future]] = future.result()
+			print(f'\r{done + 1}/{len(runs)} runs', end = '', flush = True)
+
+	print()
+	return rows
+
+def main_cli() -> None:
+
+	parser = argparse.ArgumentParser(description = 'Play many headless Lemonoids games with a bot across a process pool, for difficulty / load tuning.')
+	parser.add_argument('--seeds', type = int, default = 4, help = 'runs per parameter set (seeds 0 to SEEDS - 1)')
+	parser.add_argument('--ladder', action = 'append', choices = list(LADDERS), help = 'lemonoid spawn frequency ladder(s) (default: all)')
+	parser.add_argument('--speed', type = float, action = 'append', help = f'lemonoid spawn speed(s) (default: {LEMONOID_SPEED})')
+	parser.add_argument('--seconds', type = float, default = 120, help = 'simulated seconds a run is cut off at if the bot survives')
+	parser.add_argument('--render', action = 'store_true', help = 'also render every frame (to an offscreen surface)')
+	parser.add_argument('--workers', type = int, default = os.cpu_count(), help = 'worker processes (default: one per core)')
+	parser.add_argument('--output', default = RESULTS_PATH)
+	args = parser.parse_args()
+
+	runs = [(seed, ladder, speed, args.seconds, args.render) for ladder, speed, seed in itertools.product(args.ladder or list(LADDERS), args.speed or [LEMONOID_SPEED], range(args.seeds))]
+
+	start_time = perf_counter()
+	rows = sweep(runs, args.workers)
+	elapsed = perf_counter() - start_time
+
+	os.makedirs(os.path.dirname(args.output), exist_ok = True)
+
+	with open(args.output, 'w', newline = '') as file:
+
+		writer = csv.DictWriter(file, fieldnames = list(rows[0]))
+		writer.writeheader()
+		writer.writerows(rows)
+
+	# One line per parameter set, averaged over its seeds
+	for (ladder, speed), group in itertools.groupby(rows, key = lambda row: (row['ladder'], row['speed'])):
+
+		group = list(group)
+		print(f'{ladder} ladder, speed {speed}: survived {round(statistics.fmean(row["survival_s"] for row in group), 1)}s ({sum(row["died"] for row in group)}/{len(group)} died) | score {round(statistics.fmean(row["score"] for row in group))} | mean {round(statistics.fmean(row["mean_ms"] for row in group), 3)}ms | p95 {round(max(row["p95_ms"] for row in group), 3)}ms | {max(row["max_entities"] for row in group)} entities max')
+
+	simulated = sum(row['survival_s'] for row in rows)
+	print(f'{len(rows)} runs ({round(simulated)}s simulated) in {round(elapsed, 1)}s on {args.workers} workers - results in {args.output}')
+
+if __name__ == '__main__': main_cli()